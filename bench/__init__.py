@@ -0,0 +1,11 @@
+""" Benchmark Module for Sudoku Game
+
+This module provides micro-benchmarks of the core operations of the Sudoku game, with a stored baseline to detect regressions.
+
+Structure:
+    bench.py      - Contains the benchmarks, their timing and the comparison with the baseline
+    baseline.json - Contains the baseline results, written by `run_bench(update=True)`
+"""
+from .bench import run_bench
+
+__all__ = ["run_bench"]
@@ -0,0 +1,260 @@
+""" Sudoku Benchmark Module
+This module is part of the bench package and times the core operations of the Sudoku game.
+Each benchmark is run with `timeit` (garbage collector disabled) in several samples, each preceded by a sample of a fixed
+calibration loop. The median ratio of the two is the relative time compared with the stored baseline, which makes
+the comparison independent of the speed and the load of the machine.
+The startup benchmark imports `sudoku.py` in a fresh interpreter, and `import_times` breaks that time down by module.
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+
+from core.board import Board
+from core.game import Game
+from core.generator import Generator
+from core.number import Number
+from core.solver import Solver
+from core.uniqueness import UniquenessChecker
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # Directory of sudoku.py
+DEFAULT_THRESHOLD = 0.25  # Relative slowdown reported as a regression
+DEFAULT_REPEAT = 7
+DEFAULT_MIN_TIME = 0.05  # Minimum duration of a sample in seconds
+PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+SOLUTION = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+
+def run_bench(output_path="-", baseline_path=BASELINE_PATH, threshold=DEFAULT_THRESHOLD, update=False, names=None,
+              repeat=DEFAULT_REPEAT, min_time=DEFAULT_MIN_TIME):
+    """ Run the benchmarks, write their results as JSON and compare them with the baseline.
+    Args:
+        output_path (str): The path of the JSON results, or "-" for the standard output. Defaults to "-".
+        baseline_path (str): The path of the baseline file. Defaults to `BASELINE_PATH`.
+        threshold (float): The relative slowdown beyond which a benchmark regressed (0.25 for 25%). Defaults to `DEFAULT_THRESHOLD`.
+        update (bool): Whether to replace the baseline with the results instead of comparing them. Defaults to False.
+        names (list[str]): The benchmarks to run. Defaults to None, which runs all of `BENCHMARKS`.
+        repeat (int): The number of samples of each benchmark. Defaults to `DEFAULT_REPEAT`.
+        min_time (float): The minimum duration of a sample in seconds. Defaults to `DEFAULT_MIN_TIME`.
+    Returns:
+        list[dict]: The regressions, with the "name", "baseline" and "current" relative times and the "change" ratio.
+            Empty if there is no regression, no baseline file or the baseline was updated.
+            With the startup benchmark, the results also hold the slowest "imports" of `sudoku.py` (see `import_times`).
+    Raises:
+        ValueError: If a benchmark name is unknown, or the threshold, repeat or minimum time is not positive.
+    """
+    if threshold <= 0 or repeat < 1 or min_time <= 0:
+        raise ValueError("Threshold, repeat and minimum time must be positive.")
+    names = list(BENCHMARKS) if names is None else names
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {unknown}. Valid benchmarks are {list(BENCHMARKS)}.")
+    results = {name: time_callable(BENCHMARKS[name](), repeat, min_time) for name in names}
+    report = {"python": platform.python_version(), "benchmarks": results}
+    if "startup" in names:
+        report["imports"] = import_times()
+    regressions = []
+    if update:
+        _write_json(report, baseline_path)
+    elif os.path.exists(baseline_path):
+        with open(baseline_path, "r") as file:
+            regressions = compare(results, json.load(file), threshold)
+        report["regressions"] = regressions
+    _write_json(report, output_path)
+    return regressions
+
+def time_callable(function, repeat=DEFAULT_REPEAT, min_time=DEFAULT_MIN_TIME):
+    """ Time a callable taking no argument.
+        The number of calls per sample is doubled until a sample lasts `min_time`, then `repeat` samples are taken.
+    Args:
+        function (callable): The operation to time.
+        repeat (int): The number of samples. Defaults to `DEFAULT_REPEAT`.
+        min_time (float): The minimum duration of a sample in seconds. Defaults to `DEFAULT_MIN_TIME`.
+    Returns:
+        dict: The "best_ns" and "median_ns" times per call in nanoseconds, the "number" of calls per sample,
+            and the "relative" time: the median ratio of each sample to a sample of the calibration loop taken right before it,
+            so that both see the same load and clock speed.
+    """
+    timer, number = _sized_timer(function, min_time)
+    calibration, calibration_number = _sized_timer(_calibration, min_time)
+    samples = []
+    ratios = []
+    for _ in range(repeat):
+        reference = calibration.timeit(calibration_number) / calibration_number
+        samples.append(timer.timeit(number) / number)
+        ratios.append(samples[-1] / reference)
+    return {"best_ns": min(samples) * 1e9, "median_ns": statistics.median(samples) * 1e9, "number": number,
+            "relative": statistics.median(ratios)}
+
+def import_times(module="sudoku", limit=10):
+    """ Measure the import time of a module and of the modules it imports, in a fresh interpreter with `python -X importtime`.
+    Args:
+        module (str): The module to import, from the directory of `sudoku.py`. Defaults to "sudoku".
+        limit (int): The number of modules kept. Defaults to 10, None keeps them all.
+    Returns:
+        list[tuple[str, int]]: The slowest modules with their cumulative import time in microseconds, slowest first.
+    Raises:
+        subprocess.CalledProcessError: If the module cannot be imported.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    times = []
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            times.append((fields[2].strip(), int(fields[1])))
+    times.sort(key=lambda item: item[1], reverse=True)
+    return times[:limit]
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """ Compare benchmark results with a baseline, on their times relative to the calibration loop.
+        Benchmarks missing from the baseline are ignored.
+    Args:
+        results (dict): The results of the benchmarks by name, with at least the "relative" key.
+        baseline (dict): The baseline report, with the results under the "benchmarks" key.
+        threshold (float): The relative slowdown beyond which a benchmark regressed. Defaults to `DEFAULT_THRESHOLD`.
+    Returns:
+        list[dict]: The regressions (see `run_bench`).
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get("benchmarks", {}).get(name)
+        if reference is None:
+            continue
+        change = result["relative"] / reference["relative"] - 1
+        if change > threshold:
+            regressions.append({"name": name, "baseline": reference["relative"], "current": result["relative"], "change": change})
+    return regressions
+
+# Functions to support the above methods
+
+def _sized_timer(function, min_time):
+    """ Build the timer of a callable and find the number of calls of a sample, doubled until the sample lasts `min_time`.
+    Args:
+        function (callable): The operation to time.
+        min_time (float): The minimum duration of a sample in seconds.
+    Returns:
+        tuple[timeit.Timer, int]: The timer and the number of calls per sample.
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    return timer, number
+
+def _write_json(data, path):
+    """ Write data as indented JSON.
+    Args:
+        data (dict): The data to write.
+        path (str): The path of the file, or "-" for the standard output.
+    """
+    if path == "-":
+        json.dump(data, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write("\n")
+        return
+    with open(path, "w") as file:
+        json.dump(data, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+def _calibration():
+    """ Fixed pure-Python loop measuring the speed of the interpreter on the current machine. """
+    total = 0
+    for value in range(100):
+        total += value * value
+    return total
+
+def _grid(text):
+    """ Build the nested `Number` grid expected by `Board.__init__` from the 81-character format.
+    Args:
+        text (str): The grid.
+    Returns:
+        list[list[Number]]: The grid, with the numbers fixed.
+    """
+    values = [0 if char == "." else int(char) for char in text]
+    return [[Number(values[row * 9 + col], values[row * 9 + col] != 0) for col in range(9)] for row in range(9)]
+
+# Each benchmark builds its fixtures and returns the operation to time
+
+def _bench_number_init():
+    return lambda: Number(5, True)
+
+def _bench_board_init():
+    grid = _grid(PUZZLE)
+    return lambda: Board(grid)
+
+def _bench_board_from_string():
+    return lambda: Board.from_string(PUZZLE)
+
+def _bench_board_from_bytes():
+    data = Board.from_string(PUZZLE).to_bytes()
+    return lambda: Board.from_bytes(data, trusted=True)
+
+def _bench_board_copy():
+    return Board.from_string(PUZZLE).copy
+
+def _bench_set_number():
+    board = Board.from_string(PUZZLE)
+    def operation():
+        # Undoing keeps the journal from growing over millions of calls
+        board.set_number(0, 2, 4)
+        board.undo()
+    return operation
+
+def _bench_allowed_numbers():
+    board = Board.from_string(PUZZLE)
+    return lambda: board.allowed_numbers(4, 4)
+
+def _bench_is_valid():
+    board = Board.from_string(PUZZLE)
+    return lambda: board.is_valid(4, 4)
+
+def _bench_game_is_board_valid():
+    game = Game("easy")
+    game.set_board(Board.from_string(SOLUTION))
+    return game._is_board_valid
+
+def _bench_solve():
+    solver = Solver()
+    values = [0 if char == "." else int(char) for char in PUZZLE]
+    return lambda: next(solver.solve_values(values, limit=1))
+
+def _bench_uniqueness_removal():
+    solution = [int(char) for char in SOLUTION]
+    order = [(index * 31) % 81 for index in range(81)]
+    def operation():
+        # Full removal pass down to 24 givens, as done by the generator for the hardest levels
+        checker = UniquenessChecker(solution, solution)
+        for index in order:
+            if checker.get_given_count() <= 24:
+                break
+            checker.remove(index)
+    return operation
+
+def _bench_generate_hard():
+    seeds = iter(range(1 << 30))
+    # Another seed for each call: the time of a sample is an average over several puzzles
+    return lambda: Generator(next(seeds)).generate("hard")
+
+def _bench_startup():
+    command = [sys.executable, "-c", "import sudoku"]
+    return lambda: subprocess.run(command, cwd=ROOT, check=True)
+
+BENCHMARKS = {
+    "number_init": _bench_number_init,
+    "board_init": _bench_board_init,
+    "board_from_string": _bench_board_from_string,
+    "board_from_bytes": _bench_board_from_bytes,
+    "board_copy": _bench_board_copy,
+    "set_number_undo": _bench_set_number,
+    "allowed_numbers": _bench_allowed_numbers,
+    "is_valid": _bench_is_valid,
+    "game_is_board_valid": _bench_game_is_board_valid,
+    "solve": _bench_solve,
+    "uniqueness_removal": _bench_uniqueness_removal,
+    "generate_hard": _bench_generate_hard,
+    "startup": _bench_startup,
+}
@@ -4,7 +4,11 @@ This module provides command-line interface functionality for the Sudoku game, a
 
 Structure:
     cli.py      - Contains the main CLI application logic
+    batch.py    - Contains the non-interactive batch mode solving and generating puzzles over a process pool
+    pipe.py     - Contains the streaming mode checking, solving and grading puzzles line by line in Unix pipelines
 """
 from .cli import run_cli
+from .batch import run_generate, run_solve
+from .pipe import run_pipe
 
-__all__ = ["run_cli"]
\ No newline at end of file
+__all__ = ["run_cli", "run_generate", "run_pipe", "run_solve"]
@@ -0,0 +1,180 @@
+""" Sudoku Batch Module
+This module provides the non-interactive batch mode of the Sudoku game.
+It is part of the cli package and solves puzzles read in the common 81-character one-line format,
+spreading them over a pool of processes in chunks and writing the solutions in input order.
+It also generates shards of puzzle batches over a pool of processes, writing each puzzle as soon as it is ready.
+"""
+
+import os
+import sys
+import time
+from collections import deque
+
+from core.board import FROM_CHARS, TO_CHARS
+from core.solver import Solver
+
+DEFAULT_CHUNK_SIZE = 256
+EMPTY_CHARS = "0."
+# Number of chunks sent to the pool for each worker before waiting for the oldest result,
+# which bounds the memory used on large inputs.
+CHUNKS_PER_WORKER = 4
+
+_solver = None  # Solver of the current process, built on first use
+
+def run_solve(input_path="-", output_path="-", workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """ Solve the puzzles of a file, one per line, and write one result line per puzzle in input order.
+        Each result line holds the solution in the 81-character format (or "unsolvable" / "invalid")
+        and the time spent on the puzzle in milliseconds, separated by a tab. Blank lines are skipped.
+    Args:
+        input_path (str): The path of the puzzle file, or "-" for the standard input. Defaults to "-".
+        output_path (str): The path of the result file, or "-" for the standard output. Defaults to "-".
+        workers (int): The number of processes. Defaults to None, which uses one process per CPU.
+            With a single worker, the puzzles are solved in the current process.
+        chunk_size (int): The number of puzzles sent to a process at once. Defaults to `DEFAULT_CHUNK_SIZE`.
+    Returns:
+        int: The number of puzzles processed.
+    Raises:
+        ValueError: If the number of workers or the chunk size is not positive.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1 or chunk_size < 1:
+        raise ValueError("Workers and chunk size must be positive.")
+    source = sys.stdin if input_path == "-" else open(input_path, "r")
+    target = sys.stdout if output_path == "-" else open(output_path, "w")
+    try:
+        count = 0
+        for results in _map_chunks(_read_chunks(source, chunk_size), workers):
+            target.writelines(f"{solution}\t{elapsed:.3f}\n" for solution, elapsed in results)
+            count += len(results)
+        target.flush()
+        return count
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+def run_generate(level, count, output_path="-", seed=0, start=0, workers=None, box_size=3):
+    """ Generate the puzzles `start` to `start + count - 1` of a batch and write one line per puzzle as soon as it is ready.
+        Each line holds the index of the puzzle, its givens and its solution in the one-line format,
+        and its graded level ("-" for boards other than 9x9), separated by tabs. Lines are written in completion order.
+        Delegates the generation to the `generate_shard` function.
+    Args:
+        level (str): The difficulty level of the puzzles.
+        count (int): The number of puzzles to generate.
+        output_path (str): The path of the puzzle file, or "-" for the standard output. Defaults to "-".
+        seed (int): The seed of the batch. Defaults to 0.
+        start (int): The index of the first puzzle. Defaults to 0.
+        workers (int): The number of processes. Defaults to None, which uses one process per CPU.
+        box_size (int): The box size of the puzzles (2 to 5). Defaults to 3, for 9x9 puzzles.
+    Returns:
+        int: The number of puzzles generated.
+    Raises:
+        ValueError: If the level is not valid, or the count, start or number of workers is out of range.
+    """
+    from core.sharding import generate_shard  # Imported here, as solving does not need the generator
+    puzzles = generate_shard(level, count, seed, start, workers, box_size)
+    target = sys.stdout if output_path == "-" else open(output_path, "w")
+    try:
+        generated = 0
+        for index, givens, solution, grade in puzzles:
+            graded = grade["level"] if grade is not None else "-"
+            target.write(f"{index}\t{format_grid(givens)}\t{format_grid(solution)}\t{graded}\n")
+            target.flush()
+            generated += 1
+        return generated
+    finally:
+        if target is not sys.stdout:
+            target.close()
+
+def parse_puzzle(line):
+    """ Read a puzzle in the 81-character one-line format.
+    Args:
+        line (str): The puzzle, with digits 1-9 for the givens and "0" or "." for the empty cells.
+    Returns:
+        list[int]: The 81 values of the puzzle in row-major order (0 for empty cells).
+    Raises:
+        ValueError: If the line does not hold exactly 81 valid characters.
+    """
+    line = line.strip()
+    if len(line) != 81:
+        raise ValueError("Puzzle must contain 81 characters.")
+    values = line.encode("utf-8").translate(FROM_CHARS)
+    if len(values) != 81 or max(values) > 9:
+        char = next((char for char in line if char not in EMPTY_CHARS and not "1" <= char <= "9"), None)
+        raise ValueError(f"Invalid character in puzzle: {char!r}.")
+    return list(values)
+
+def format_grid(values):
+    """ Write a grid in the 81-character one-line format.
+    Args:
+        values (list[int]): The 81 values of the grid in row-major order (0 for empty cells).
+    Returns:
+        str: The grid, with "." for the empty cells.
+    """
+    return bytes(values).translate(TO_CHARS).decode("ascii")
+
+# Functions to support the above methods
+
+def _read_chunks(source, chunk_size):
+    """ Group the non-blank lines of a stream into chunks.
+    Args:
+        source (file): The stream to read.
+        chunk_size (int): The number of lines of each chunk.
+    Yields:
+        list[str]: The next chunk of lines, the last one possibly shorter.
+    """
+    chunk = []
+    for line in source:
+        line = line.strip()
+        if not line:
+            continue
+        chunk.append(line)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _map_chunks(chunks, workers):
+    """ Solve chunks of puzzles over a pool of processes, keeping a bounded number of chunks in flight.
+    Args:
+        chunks (iterable[list[str]]): The chunks of puzzle lines.
+        workers (int): The number of processes.
+    Yields:
+        list[tuple[str, float]]: The results of each chunk, in input order.
+    """
+    if workers == 1:
+        yield from map(_solve_chunk, chunks)
+        return
+    from concurrent.futures import ProcessPoolExecutor  # Imported here, as a single worker does not need it
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_solve_chunk, chunk))
+            if len(pending) >= workers * CHUNKS_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def _solve_chunk(lines):
+    """ Solve a chunk of puzzles in the current process, timing each of them.
+    Args:
+        lines (list[str]): The puzzles in the 81-character one-line format.
+    Returns:
+        list[tuple[str, float]]: For each puzzle, its solution (or "unsolvable" / "invalid") and the time spent in milliseconds.
+    """
+    global _solver
+    if _solver is None:
+        _solver = Solver()
+    results = []
+    for line in lines:
+        start = time.perf_counter()
+        try:
+            solutions = list(_solver.solve_values(parse_puzzle(line), limit=1))
+            solution = format_grid(solutions[0]) if solutions else "unsolvable"
+        except ValueError:
+            solution = "invalid"
+        results.append((solution, (time.perf_counter() - start) * 1000))
+    return results
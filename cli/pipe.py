@@ -0,0 +1,145 @@
+""" Sudoku Pipe Module
+This module provides the streaming mode of the Sudoku game, made to sit in Unix pipelines.
+It is part of the cli package and reads puzzles in the one-line format line by line, checks, solves and grades each of them,
+and writes one result line per puzzle as soon as it is processed. Nothing is kept from one line to the next, so the memory
+used does not depend on the size of the input. The output is buffered, and flushed whenever no more input is waiting,
+so results come out right away when the input is slow and in large writes when it is fast.
+The input is read in chunks without Python's buffering, so that the lines waiting to be processed are all in view.
+"""
+
+import os
+import select
+import sys
+
+from core.board import FROM_CHARS, TO_CHARS, Board
+from core.logic import LogicSolver
+from core.solver import Solver
+
+# Statuses of a puzzle
+STATUSES = ["unique", "multiple", "unsolvable", "conflict", "invalid"]
+EMPTY_FIELD = "-"
+# Largest read from the input at once, in bytes
+CHUNK_SIZE = 64 * 1024
+# Longest line kept whole, in bytes: the largest puzzles take 625 characters
+MAX_LINE_SIZE = 1024
+
+_solvers = {}  # Box size -> Solver, built on first use
+
+def run_pipe(input_path="-", output_path="-", grade=True):
+    """ Check, solve and grade the puzzles of a stream, one per line, writing one result line per puzzle in input order.
+        Each result line holds, separated by tabs: the status of the puzzle (see `check_puzzle`), its solution in the one-line
+        format, and its graded level and rating, with "-" for the fields that do not apply. Blank lines are skipped.
+        A closed output, e.g. when piped into `head`, ends the run quietly.
+    Args:
+        input_path (str): The path of the puzzle file, or "-" for the standard input. Defaults to "-".
+        output_path (str): The path of the result file, or "-" for the standard output. Defaults to "-".
+        grade (bool): Whether to grade the 9x9 puzzles with a unique solution. Defaults to True.
+    Returns:
+        int: The number of puzzles processed.
+    """
+    if input_path == "-":
+        source = open(sys.stdin.fileno(), "rb", buffering=0, closefd=False)
+    else:
+        source = open(input_path, "rb", buffering=0)
+    target = sys.stdout if output_path == "-" else open(output_path, "w")
+    count = 0
+    try:
+        for line, pending in _read_lines(source):
+            if not line.strip():
+                continue
+            status, solution, grading = check_puzzle(line, grade)
+            level, rating = (grading["level"], f"{grading['rating']:g}") if grading is not None else (EMPTY_FIELD, EMPTY_FIELD)
+            target.write(f"{status}\t{solution or EMPTY_FIELD}\t{level}\t{rating}\n")
+            count += 1
+            if not pending:
+                target.flush()
+        target.flush()
+    except BrokenPipeError:
+        # The reader of the output is gone: point the output to devnull so that closing it at exit does not fail again
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, target.fileno())
+        os.close(devnull)
+    finally:
+        source.close()
+        if target is not sys.stdout:
+            target.close()
+    return count
+
+def check_puzzle(line, grade=True):
+    """ Check, solve and grade a puzzle.
+        Delegates the solving to the `Solver` class and the grading to the `LogicSolver` class.
+    Args:
+        line (str): The puzzle in the one-line format (16, 81, 256 or 625 characters). Surrounding whitespace is ignored.
+        grade (bool): Whether to grade the puzzle if it is 9x9 with a unique solution. Defaults to True.
+    Returns:
+        tuple[str, str, dict]: The status of the puzzle, one of `STATUSES`: "invalid" if the line is not a puzzle,
+        "conflict" if a number appears twice in a row, column or subgrid, "unsolvable", "unique" or "multiple";
+        the solution in the one-line format if it is unique, or None; and the grade (see `LogicSolver.grade`), or None.
+    """
+    try:
+        board = Board.from_string(line)
+    except ValueError:
+        return "invalid", None, None
+    if board.get_conflict_count():
+        return "conflict", None, None
+    values = list(line.strip().encode("ascii").translate(FROM_CHARS))
+    box_size = board.get_box_size()
+    if box_size not in _solvers:
+        _solvers[box_size] = Solver(box_size)
+    solutions = list(_solvers[box_size].solve_values(values, limit=2))
+    if not solutions:
+        return "unsolvable", None, None
+    if len(solutions) > 1:
+        return "multiple", None, None
+    solution = bytes(solutions[0]).translate(TO_CHARS).decode("ascii")
+    grading = LogicSolver(values).grade() if grade and box_size == 3 else None
+    return "unique", solution, grading
+
+# Functions to support the above methods
+
+def _read_lines(source):
+    """ Read the lines of an unbuffered binary stream, telling after each line if more input can be read right away.
+        The stream is read in chunks of at most `CHUNK_SIZE` bytes, each of them taking what is available without waiting for more.
+        Invalid UTF-8 bytes are replaced, so they make the line an invalid puzzle. Only the first `MAX_LINE_SIZE` + 1 bytes
+        of a longer line are kept, the rest being dropped up to the next end of line, so the line is still an invalid puzzle.
+    Args:
+        source (io.RawIOBase): The input stream, opened with `buffering=0`.
+    Yields:
+        tuple[str, bool]: Each line without its end of line, and True if more whole lines are read already or more input is waiting.
+    """
+    rest = b""
+    overlong = None  # Start of a line over `MAX_LINE_SIZE` bytes whose end is not read yet
+    while True:
+        chunk = source.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        lines = (rest + chunk).split(b"\n")
+        rest = lines.pop()
+        if overlong is not None and lines:
+            lines[0] = overlong
+            overlong = None
+        if len(rest) > MAX_LINE_SIZE:
+            if overlong is None:
+                overlong = rest[:MAX_LINE_SIZE + 1]
+            rest = b""
+        last = len(lines) - 1
+        for number, line in enumerate(lines):
+            pending = number < last or _input_pending(source)
+            yield line.decode("utf-8", "replace"), pending
+    if overlong is not None:
+        rest = overlong
+    if rest:
+        yield rest.decode("utf-8", "replace"), False
+
+def _input_pending(source):
+    """ Check if more input can be read from a stream right away.
+        Streams without a file descriptor, or platforms where `select` does not support them, count as having none.
+    Args:
+        source (file): The input stream.
+    Returns:
+        bool: True if reading the next line would not wait, as far as the operating system can tell.
+    """
+    try:
+        return bool(select.select([source], [], [], 0)[0])
+    except (OSError, ValueError):
+        return False
@@ -4,10 +4,30 @@ This module provides classes and methods for managing the Sudoku board, numbers,
 They are essential for the functionality of the Sudoku game and are used by the CLI and GUI interfaces.
 
 Structure:
-    board.py     - Contains the Board class for grid management
-    game.py      - Contains the Game class for game state and control
-    number.py    - Contains the Number class for cell management
+    bank.py       - Contains the PuzzleBank class reading puzzles from a memory-mapped file
+    board.py      - Contains the Board class for grid management
+    cache.py      - Contains the SolutionCache class keeping recent solutions with LRU eviction
+    canonical.py  - Contains the canonical form of grids up to the symmetries of Sudoku
+    catalog.py    - Contains the PuzzleCatalog class generating puzzles again from their ID
+    game.py       - Contains the Game class for game state and control
+    generator.py  - Contains the Generator class for puzzle generation
+    logic.py      - Contains the LogicSolver class for human-style solving and grading
+    number.py     - Contains the Number class for cell management
+    pool.py       - Contains the PuzzlePool class keeping generated puzzles ready for each level
+    sharding.py   - Contains the seeded sharding of puzzle batches generated over a process pool
+    solver.py     - Contains the Solver class for solving boards with Dancing Links
+    stats.py      - Contains the opt-in instrumentation counters and timers
+    uniqueness.py - Contains the UniquenessChecker class removing givens while the solution stays unique
+    validator.py  - Contains the NumPy bulk validator for many grids at once
 """
-from .game import Game
+import importlib
 
 __all__ = ["Game"]
+
+def __getattr__(name):
+    """ Import `Game` on first access. Every mode runs this file through the core modules it uses,
+        and most of them never need `Game` and the generator, pool and bank modules it loads.
+    """
+    if name == "Game":
+        return importlib.import_module(".game", __name__).Game
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,245 @@
+""" Sudoku Puzzle Bank Class
+This module is part of the core package of the Sudoku game.
+It defines the `PuzzleBank` class, which reads puzzles from a binary file of fixed-size records opened with mmap,
+and the `write_bank` function, which creates such a file.
+
+File layout (little-endian):
+    header  - magic b"SDKB", format version (uint16), record size (uint16), number of records (uint32)
+    index   - for each level and each rating from 0.0 to 5.0 in tenths, the number of the first record of this bucket (uint32),
+              followed by the total number of records
+    records - givens bitmap (11 bytes), solution packed as two digits per byte (41 bytes), level (uint8) and rating in tenths (uint8)
+Records are sorted by level then rating, so each level and rating range is a contiguous run of records.
+"""
+
+import mmap
+import os
+import random
+import struct
+
+from core.logic import LEVEL_RATINGS, UNSOLVED_RATING
+
+MAGIC = b"SDKB"
+VERSION = 1
+LEVELS = tuple(LEVEL_RATINGS)
+RATING_SLOTS = round(UNSOLVED_RATING * 10) + 1  # Ratings 0.0 to 5.0 in tenths
+BUCKETS = len(LEVELS) * RATING_SLOTS
+HEADER = struct.Struct("<4sHHI")
+INDEX = struct.Struct(f"<{BUCKETS + 1}I")
+RECORD = struct.Struct("<11s41sBB")
+DATA_OFFSET = HEADER.size + INDEX.size
+
+class PuzzleBank:
+    """ Class reading puzzles from a memory-mapped puzzle bank. Opening a bank only reads its header and index. """
+
+    def __init__(self, path, seed=None):
+        """ Open a puzzle bank file created by `write_bank`.
+        Args:
+            path (str): The path of the bank file.
+            seed (int): The seed used to pick random puzzles. Defaults to None, which uses a random seed.
+        Raises:
+            ValueError: If the file is not a puzzle bank of a supported version.
+            OSError: If the file cannot be opened.
+        """
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < DATA_OFFSET:
+            self._map.close()
+            raise ValueError("File is not a puzzle bank.")
+        magic, version, record_size, count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size or len(self._map) != DATA_OFFSET + count * RECORD.size:
+            self._map.close()
+            raise ValueError("File is not a puzzle bank of a supported version.")
+        self._count = count
+        self._index = INDEX.unpack_from(self._map, HEADER.size)
+        self._random = random.Random(seed)
+
+    # Methods to read puzzles
+
+    def get_count(self, level=None, min_rating=None, max_rating=None):
+        """ Count the puzzles of the bank, optionally of a level and rating range.
+        Args:
+            level (str): The difficulty level. Defaults to None, which counts every level.
+            min_rating (float): The lowest rating included. Defaults to None, which sets no lower bound.
+            max_rating (float): The highest rating included. Defaults to None, which sets no upper bound.
+        Returns:
+            int: The number of puzzles matching.
+        Raises:
+            ValueError: If the level is not valid.
+        """
+        if level is None:
+            return sum(self.get_count(level, min_rating, max_rating) for level in LEVELS)
+        start, end = self._bucket_range(level, min_rating, max_rating)
+        return end - start
+
+    def get_puzzle(self, level, min_rating=None, max_rating=None):
+        """ Pick a random puzzle of a level and rating range, in constant time.
+        Args:
+            level (str): The difficulty level of the puzzle.
+            min_rating (float): The lowest rating included. Defaults to None, which sets no lower bound.
+            max_rating (float): The highest rating included. Defaults to None, which sets no upper bound.
+        Returns:
+            tuple[list[int], list[int], dict]: The givens, the solution and the grade of the puzzle (see `get_record`).
+        Raises:
+            ValueError: If the level is not valid or the bank holds no matching puzzle.
+        """
+        start, end = self._bucket_range(level, min_rating, max_rating)
+        if start == end:
+            raise ValueError(f"No puzzle of level {level} in the bank for this rating range.")
+        return self.get_record(self._random.randrange(start, end))
+
+    def get_record(self, number):
+        """ Read a record of the bank.
+            Only the level and rating of the grade are stored, so its "techniques" are empty.
+        Args:
+            number (int): The number of the record (0 to `get_count() - 1`).
+        Returns:
+            tuple[list[int], list[int], dict]: The givens and the solution as 81 values in row-major order (0 for empty cells),
+            and the grade of the puzzle with the "level", "rating", "techniques" and "solved" keys.
+        Raises:
+            IndexError: If the number is out of bounds.
+        """
+        if not 0 <= number < self._count:
+            raise IndexError("Record number out of bounds.")
+        given_bits, packed, level, rating = RECORD.unpack_from(self._map, DATA_OFFSET + number * RECORD.size)
+        solution = _unpack_digits(packed)
+        mask = int.from_bytes(given_bits, "little")
+        givens = [value if mask >> index & 1 else 0 for index, value in enumerate(solution)]
+        grade = {"level": LEVELS[level], "rating": rating / 10, "techniques": {}, "solved": rating / 10 < UNSOLVED_RATING}
+        return givens, solution, grade
+
+    def close(self):
+        """ Close the memory map of the bank. """
+        self._map.close()
+
+    # Functions to support the above methods
+
+    def _bucket_range(self, level, min_rating, max_rating):
+        """ Find the records of a level and rating range.
+        Args:
+            level (str): The difficulty level.
+            min_rating (float): The lowest rating included, or None.
+            max_rating (float): The highest rating included, or None.
+        Returns:
+            tuple[int, int]: The first record and the record after the last one.
+        Raises:
+            ValueError: If the level is not valid.
+        """
+        if level not in LEVELS:
+            raise ValueError(f"Level must be one of {list(LEVELS)}.")
+        low = 0 if min_rating is None else _rating_slot(min_rating, ceil=True)
+        high = RATING_SLOTS - 1 if max_rating is None else _rating_slot(max_rating)
+        if low > high:
+            return 0, 0
+        base = LEVELS.index(level) * RATING_SLOTS
+        return self._index[base + low], self._index[base + high + 1]
+
+def write_bank(path, puzzles):
+    """ Write a puzzle bank file, sorting the puzzles by level and rating without holding them in memory.
+        The records are first written in input order to a temporary file, then copied to their place in a second temporary file,
+        which replaces the bank once complete: an interrupted write leaves any previous bank untouched.
+    Args:
+        path (str): The path of the bank file to create.
+        puzzles (iterable[tuple[list[int], list[int], dict]]): The givens, the solution and the grade of each puzzle
+            (see `Generator.generate` and `LogicSolver.grade`).
+    Returns:
+        int: The number of puzzles written.
+    Raises:
+        ValueError: If a puzzle does not have 81 values, its solution does not hold digits 1-9 matching the givens,
+            or its grade has an invalid level.
+    """
+    counts = [0] * BUCKETS
+    records = f"{path}.records.tmp"
+    temporary = f"{path}.tmp"
+    try:
+        with open(records, "wb") as file:
+            for givens, solution, grade in puzzles:
+                record = _pack_record(givens, solution, grade)
+                counts[_bucket_of(record)] += 1
+                file.write(record)
+        starts = [0] * (BUCKETS + 1)
+        for bucket in range(BUCKETS):
+            starts[bucket + 1] = starts[bucket] + counts[bucket]
+        count = starts[BUCKETS]
+        with open(temporary, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, RECORD.size, count))
+            file.write(INDEX.pack(*starts))
+            file.truncate(DATA_OFFSET + count * RECORD.size)
+        if count:
+            positions = starts[:BUCKETS]
+            with open(temporary, "r+b") as file, open(records, "rb") as source:
+                target = mmap.mmap(file.fileno(), 0)
+                for record in iter(lambda: source.read(RECORD.size), b""):
+                    bucket = _bucket_of(record)
+                    offset = DATA_OFFSET + positions[bucket] * RECORD.size
+                    target[offset:offset + RECORD.size] = record
+                    positions[bucket] += 1
+                target.close()
+        os.replace(temporary, path)
+    finally:
+        for name in (records, temporary):
+            if os.path.exists(name):
+                os.remove(name)
+    return count
+
+def _pack_record(givens, solution, grade):
+    """ Encode a puzzle as a record of the bank.
+    Args:
+        givens (list[int]): The 81 givens of the puzzle (0 for empty cells).
+        solution (list[int]): The 81 values of the solution.
+        grade (dict): The grade of the puzzle, with at least the "level" and "rating" keys.
+    Returns:
+        bytes: The record.
+    Raises:
+        ValueError: If the puzzle does not have 81 values, its solution does not hold digits 1-9 matching the givens,
+            or the grade has an invalid level.
+    """
+    if len(givens) != 81 or len(solution) != 81:
+        raise ValueError("Puzzle must contain 81 values.")
+    # Each digit of the solution takes four bits of the record: a larger value would overwrite the next digit
+    if any(not 1 <= digit <= 9 or given not in (0, digit) for given, digit in zip(givens, solution)):
+        raise ValueError("Solution must contain digits 1-9 matching the givens.")
+    if grade["level"] not in LEVELS:
+        raise ValueError(f"Level must be one of {list(LEVELS)}.")
+    mask = 0
+    for index, value in enumerate(givens):
+        if value:
+            mask |= 1 << index
+    digits = list(solution) + [0]
+    packed = bytes(digits[i] | digits[i + 1] << 4 for i in range(0, 82, 2))
+    return RECORD.pack(mask.to_bytes(11, "little"), packed, LEVELS.index(grade["level"]), _rating_slot(grade["rating"]))
+
+def _unpack_digits(packed):
+    """ Decode the solution of a record, stored as two digits per byte.
+    Args:
+        packed (bytes): The 41 bytes of the solution.
+    Returns:
+        list[int]: The 81 values of the solution.
+    """
+    digits = []
+    for byte in packed:
+        digits.append(byte & 15)
+        digits.append(byte >> 4)
+    return digits[:81]
+
+def _bucket_of(record):
+    """ Get the index bucket of a record from its level and rating bytes.
+    Args:
+        record (bytes): The record.
+    Returns:
+        int: The bucket of the record.
+    """
+    return record[-2] * RATING_SLOTS + record[-1]
+
+def _rating_slot(rating, ceil=False):
+    """ Convert a rating to its slot in tenths, clamped to the ratings of the bank.
+    Args:
+        rating (float): The rating.
+        ceil (bool): Whether to round a rating between two slots up instead of down. Defaults to False.
+    Returns:
+        int: The slot of the rating (0 to `RATING_SLOTS - 1`).
+    """
+    tenths = rating * 10
+    slot = round(tenths)
+    if abs(tenths - slot) > 1e-9:
+        slot = int(tenths) + (1 if ceil else 0)
+    return min(max(slot, 0), RATING_SLOTS - 1)
@@ -3,27 +3,138 @@ This module is part of the core package of the Sudoku game.
 It defines the `Board` class, which represents a Sudoku board and provides methods for manipulation and validation.
 """
 
+from array import array
+
+from core import stats
 from core.number import Number
 
+# Supported sizes of the boxes: 2 (4x4 grids) to 5 (25x25 grids).
+MIN_BOX_SIZE = 2
+MAX_BOX_SIZE = 5
+
+class Geometry:
+    """ Precomputed tables describing the geometry of a grid made of `box_size` x `box_size` boxes.
+    Cells are addressed by their flat index (row * size + col) and units are numbered
+    0 to size - 1 for rows, size to 2 * size - 1 for columns and 2 * size to 3 * size - 1 for the boxes.
+    """
+
+    __slots__ = ("box_size", "size", "cells", "all_digits", "row_of", "col_of", "box_of", "units", "units_of", "peers")
+
+    def __init__(self, box_size):
+        """ Build the tables of a grid.
+        Args:
+            box_size (int): The number of rows and columns of a box.
+        """
+        size = box_size * box_size
+        cells = size * size
+        self.box_size = box_size
+        self.size = size
+        self.cells = cells
+        self.all_digits = (1 << (size + 1)) - 2  # Bits 1 to size set, bit 0 (empty cell) unused
+        self.row_of = tuple(index // size for index in range(cells))
+        self.col_of = tuple(index % size for index in range(cells))
+        self.box_of = tuple((index // (size * box_size)) * box_size + (index % size) // box_size for index in range(cells))
+        self.units = tuple(
+            [tuple(row * size + col for col in range(size)) for row in range(size)]
+            + [tuple(row * size + col for row in range(size)) for col in range(size)]
+            + [tuple(index for index in range(cells) if self.box_of[index] == box) for box in range(size)]
+        )
+        self.units_of = tuple(
+            (self.row_of[index], size + self.col_of[index], 2 * size + self.box_of[index]) for index in range(cells)
+        )
+        self.peers = tuple(
+            tuple(sorted(set().union(*(self.units[unit] for unit in self.units_of[index])) - {index}))
+            for index in range(cells)
+        )
+
+_geometries = {}
+
+def get_geometry(box_size):
+    """ Get the tables of a grid, built once per box size.
+    Args:
+        box_size (int): The number of rows and columns of a box (`MIN_BOX_SIZE` to `MAX_BOX_SIZE`).
+    Returns:
+        Geometry: The tables of the grid.
+    Raises:
+        ValueError: If the box size is not supported.
+        TypeError: If the box size is not an integer.
+    """
+    geometry = _geometries.get(box_size)
+    if geometry is None:
+        if not isinstance(box_size, int):
+            raise TypeError("Box size must be an integer.")
+        if not MIN_BOX_SIZE <= box_size <= MAX_BOX_SIZE:
+            raise ValueError(f"Box size must be between {MIN_BOX_SIZE} and {MAX_BOX_SIZE}.")
+        geometry = _geometries[box_size] = Geometry(box_size)
+    return geometry
+
+# Tables of the classic 9x9 grid, used by the solvers and the generator.
+GEOMETRY = get_geometry(3)
+ALL_DIGITS = GEOMETRY.all_digits
+ROW_OF = GEOMETRY.row_of
+COL_OF = GEOMETRY.col_of
+BOX_OF = GEOMETRY.box_of
+UNITS = GEOMETRY.units
+UNITS_OF = GEOMETRY.units_of
+PEERS = GEOMETRY.peers
+DIGITS_OF_MASK = tuple(tuple(digit for digit in range(1, 10) if mask >> digit & 1) for mask in range(1 << 10))
+
+# Translation tables of the one-line format: digits 1-9 then letters A-P for the numbers 10-25, "0" or "." for empty cells.
+# Characters outside the format are mapped to 255, so that a single max() detects them.
+CHARS = ".123456789ABCDEFGHIJKLMNOP"
+FROM_CHARS = bytes(
+    CHARS.index(char.upper()) if char.upper() in CHARS[1:] else 0 if char in "0." else 255 for char in map(chr, range(256))
+)
+TO_CHARS = CHARS.encode("ascii") + bytes(256 - len(CHARS))
+FILLED_BITS = b"0" + b"1" * 255  # Non-empty cells to "1", to build a bitmap with int(..., 2)
+LOW_NIBBLES = bytes(byte & 15 for byte in range(256))
+HIGH_NIBBLES = bytes(byte >> 4 for byte in range(256))
+PACKED_SIZE = 11 + 41  # Packed 9x9 board: fixed cells bitmap, then the values packed as two digits per byte
+# Fields of a journal delta, packed as index << 2 * DELTA_BITS | old << DELTA_BITS | new.
+# Values up to 25 take 5 bits each and cell indices up to 624 take 10 bits on 25x25 boards: 20 bits in all,
+# more than an unsigned short holds, so the journal is an array("L") of at least 32 bits per delta.
+DELTA_BITS = 5
+DELTA_MASK = (1 << DELTA_BITS) - 1
+
 class Board:
-    """ Class representing a Sudoku board with methods for manipulation and validation. """
+    """ Class representing a Sudoku board with methods for manipulation and validation.
+    The board is 9x9 by default, or made of boxes of 2x2 to 5x5 cells (see `Geometry`).
+    The values are stored in a flat buffer of bytes (row-major order) and the fixed cells in a bitmap of one bit per cell.
+    The number of filled cells and of conflicts are kept up to date on each change, so that completion is checked in O(1).
+    Each change is recorded in a journal of (cell, old, new) deltas, packed as integers (see `DELTA_BITS`), for undo, redo and snapshots.
+    """
 
-    def __init__(self, grid=None):
+    __slots__ = ("_geometry", "_values", "_fixed", "_counts", "_masks", "_filled", "_conflicts", "_unit_conflicts", "_listeners", "_journal", "_position")
+
+    def __init__(self, grid=None, box_size=3):
         """ Initialize the Sudoku board with a given grid or an empty grid.
         Args:
-            grid (list[list[Number]]): A 9x9 grid representing the Sudoku board where each cell is an instance of the Number class. Defaults to None, which initializes an empty board.
+            grid (list[list[Number]]): A size x size grid representing the Sudoku board where each cell is an instance of the Number class. Defaults to None, which initializes an empty board.
+            box_size (int): The number of rows and columns of a box, the board having box_size² rows and columns. Defaults to 3.
         Raises:
-            ValueError: If the grid is not a 9x9 grid.
+            ValueError: If the grid is not a size x size grid, holds a number above the size, or the box size is not supported.
             TypeError: If the grid is not a list of lists containing Number instances.
         """
-        if grid is None:
-            self._grid = self._create_empty_grid()
-        else:
-            if len(grid) != 9 or any(len(row) != 9 for row in grid):
-                raise ValueError("Grid must be a 9x9 grid.")
+        geometry = get_geometry(box_size)
+        size = geometry.size
+        self._geometry = geometry
+        self._values = bytearray(geometry.cells)
+        self._fixed = 0
+        self._listeners = ()
+        self._journal = array("L")
+        self._position = 0
+        if grid is not None:
+            if len(grid) != size or any(len(row) != size for row in grid):
+                raise ValueError(f"Grid must be a {size}x{size} grid.")
             if not isinstance(grid, list) or not all(isinstance(row, list) for row in grid) or not all(isinstance(cell, Number) for row in grid for cell in row):
                 raise TypeError("Grid must be a list of lists containing Number instances.")
-            self._grid = grid
+            for index, cell in enumerate(cell for row in grid for cell in row):
+                if cell.get_value() > size:
+                    raise ValueError(f"Grid numbers must be between 0 and {size}.")
+                self._values[index] = cell.get_value()
+                if cell.is_fixed():
+                    self._fixed |= 1 << index
+        self._init_masks()
 
     def __str__(self):
         """ Display the Sudoku board in a readable format.
@@ -31,194 +142,597 @@ class Board:
         Returns:
             str: A string representation of the Sudoku board, with rows and columns clearly delineated (e.g., with spaces or newlines).
         """
+        size = self._geometry.size
         board_str = ""
-        for row in self._grid:
-            row_str = " ".join(str(cell.get_value()) if cell.get_value() != 0 else '.' for cell in row)
+        for row in range(size):
+            row_str = " ".join(self._values[row * size:row * size + size].translate(TO_CHARS).decode("ascii"))
             board_str += row_str + "\n"
         return board_str.strip()
     
+    # Methods to import and export the Sudoku board
+
+    @classmethod
+    def from_string(cls, text, fixed=True):
+        """ Create a board from the one-line format (81 characters for a 9x9 board), without building `Number` instances.
+            The size of the board is deduced from the length of the text: 16, 81, 256 or 625 characters.
+        Args:
+            text (str): The grid in row-major order, with digits 1-9 and letters A-P (10-25) for the numbers, and "0" or "." for the empty cells.
+                Surrounding whitespace is ignored.
+            fixed (bool): Whether the numbers of the grid are fixed, as the givens of a puzzle. Defaults to True.
+        Returns:
+            Board: The new board.
+        Raises:
+            ValueError: If the length of the text is not the number of cells of a supported board, or it holds invalid characters.
+        """
+        text = text.strip()
+        box_size = round(len(text) ** 0.25)
+        if box_size ** 4 != len(text) or not MIN_BOX_SIZE <= box_size <= MAX_BOX_SIZE or not text.isascii():
+            raise ValueError("Grid must contain 16, 81, 256 or 625 characters.")
+        geometry = get_geometry(box_size)
+        values = bytearray(text.encode("ascii").translate(FROM_CHARS))
+        if max(values) > geometry.size:
+            raise ValueError(f"Grid must contain only numbers 1-{geometry.size} (up to '{CHARS[geometry.size]}'), '0' or '.'.")
+        return cls._load(geometry, values, _filled_bitmap(values) if fixed else 0)
+
+    def to_string(self):
+        """ Write the board in the one-line format, without the fixed flags.
+        Returns:
+            str: The values in row-major order, with letters A-P for the numbers 10-25 and "." for the empty cells.
+        """
+        return self._values.translate(TO_CHARS).decode("ascii")
+
+    @classmethod
+    def from_bytes(cls, data, trusted=False, box_size=3):
+        """ Create a board from the packed format written by `to_bytes`.
+        Args:
+            data (bytes): The packed board.
+            trusted (bool): Whether the data comes from `to_bytes`, which skips checking the values and the fixed cells. Defaults to False.
+            box_size (int): The box size of the packed board. Defaults to 3.
+        Returns:
+            Board: The new board.
+        Raises:
+            ValueError: If the data is not a valid packed board, or the box size is not supported.
+        """
+        geometry = get_geometry(box_size)
+        bitmap_size, packed_size = _packed_sizes(geometry)
+        if len(data) != bitmap_size + packed_size:
+            raise ValueError(f"Packed board must contain {bitmap_size + packed_size} bytes.")
+        data = bytes(data)
+        fixed = int.from_bytes(data[:bitmap_size], "little")
+        packed = data[bitmap_size:]
+        if geometry.size < 16:
+            values = bytearray(packed_size * 2)
+            values[0::2] = packed.translate(LOW_NIBBLES)
+            values[1::2] = packed.translate(HIGH_NIBBLES)
+            del values[geometry.cells:]
+        else:
+            values = bytearray(packed)
+        if not trusted and (max(values) > geometry.size or fixed & ~_filled_bitmap(values)):
+            raise ValueError("Packed board holds invalid values or empty fixed cells.")
+        return cls._load(geometry, values, fixed)
+
+    def to_bytes(self):
+        """ Write the board in a packed format: the bitmap of the fixed cells, then the values as two digits per byte
+            (one per byte on boards of 16x16 cells and more). A 9x9 board takes `PACKED_SIZE` bytes.
+        Returns:
+            bytes: The packed board.
+        """
+        bitmap_size, packed_size = _packed_sizes(self._geometry)
+        if self._geometry.size >= 16:
+            return self._fixed.to_bytes(bitmap_size, "little") + bytes(self._values)
+        low = int.from_bytes(self._values[0::2], "little")
+        high = int.from_bytes(self._values[1::2], "little")
+        # Each byte of `low` and `high` is a digit, so the sum never carries into the next byte
+        return self._fixed.to_bytes(bitmap_size, "little") + (low + (high << 4)).to_bytes(packed_size, "little")
+
+    def get_box_size(self):
+        """ Get the number of rows and columns of a box.
+        Returns:
+            int: The box size (3 for a 9x9 board).
+        """
+        return self._geometry.box_size
+
+    def get_size(self):
+        """ Get the number of rows and columns of the board, which is also the highest number.
+        Returns:
+            int: The size of the board (9 for a 9x9 board).
+        """
+        return self._geometry.size
+
     # Methods to manipulate the Sudoku board
 
+    def copy(self):
+        """ Create an independent copy of the board, including the fixed cells but not the listeners and the journal.
+        Returns:
+            Board: A new board with the same values and fixed cells.
+        """
+        board = type(self).__new__(type(self))
+        board._geometry = self._geometry
+        board._values = self._values[:]
+        board._fixed = self._fixed
+        board._counts = self._counts[:]
+        board._masks = self._masks[:]
+        board._filled = self._filled
+        board._conflicts = self._conflicts
+        board._unit_conflicts = self._unit_conflicts[:]
+        board._listeners = ()
+        board._journal = array("L")
+        board._position = 0
+        return board
+
     def get_number(self, row, col):
         """ Get the number value at the specified row and column.
             Delegates the check of the row and column indices to the `_is_valid_row_col` method.
         Args:
-            row (int): The row index (0-8).
-            col (int): The column index (0-8).
+            row (int): The row index (0 to size - 1).
+            col (int): The column index (0 to size - 1).
         Returns:
             int: The number at the specified position, or 0 if the cell is empty.
         Raises:
-            IndexError: If the row or column index is out of bounds (not between 0 and 8).
+            IndexError: If the row or column index is out of bounds (not between 0 and size - 1).
             TypeError: If the row or column is not of the expected type (int).
         """
         if self._is_valid_row_col(row, col):
-            return self._grid[row][col].get_value()
+            if stats.enabled:
+                stats.count("board.reads")
+            return self._values[row * self._geometry.size + col]
 
     def set_number(self, row, col, num):
         """ Set a number in the Sudoku board at the specified row and column.
             Delegates the check of the row and column indices to the `_is_valid_row_col` method.
-            Delegates the check of the number and its mutability to the `Number` class.
+            Delegates the check of the number to the `Number` class.
         Args:
-            row (int): The row index (0-8).
-            col (int): The column index (0-8).
-            num (Number): The number to add (0-9). 0 represents an empty cell.
+            row (int): The row index (0 to size - 1).
+            col (int): The column index (0 to size - 1).
+            num (Number): The number to add (0 to size). 0 represents an empty cell.
         Raises:
-            IndexError: If the row or column index is out of bounds (not between 0 and 8).
+            IndexError: If the row or column index is out of bounds (not between 0 and size - 1).
             TypeError: If the row, column, or number is not of the expected type (int).
-            ValueError: If the number is not between 0 and 9.
+            ValueError: If the number is not between 0 and the size of the board.
             PermissionError: If the cell cannot be modified (e.g., if it is part of the initial grid).
         """
         if self._is_valid_row_col(row, col):
-            self._grid[row][col].set_value(num)
+            Number.check_value(num, self._geometry.size)
+            index = row * self._geometry.size + col
+            if self._fixed >> index & 1:
+                raise PermissionError("Cannot change a fixed number.")
+            self._change(index, num)
 
     def clear_number(self, row, col):
         """ Clear the number in the specified cell, setting it to zero.
             Delegates the check of the row and column indices to the `_is_valid_row_col` method.
-            Delegates the check of the cell mutability to the `Number` class.
         Args:
-            row (int): The row index (0-8).
-            col (int): The column index (0-8).
+            row (int): The row index (0 to size - 1).
+            col (int): The column index (0 to size - 1).
         Raises:
-            IndexError: If the row or column index is out of bounds (not between 0 and 8).
+            IndexError: If the row or column index is out of bounds (not between 0 and size - 1).
             TypeError: If the row or column is not of the expected type (int).
             PermissionError: If the cell cannot be modified (e.g., if it is part of the initial grid).
         """
         if self._is_valid_row_col(row, col):
-            self._grid[row][col].clear_value()
+            index = row * self._geometry.size + col
+            if self._fixed >> index & 1:
+                raise PermissionError("Cannot clear a fixed number.")
+            self._change(index, 0)
 
     def lock_number(self, row, col):
         """ Lock the number in the specified cell, making it immutable.
+            Locking is part of setting up the puzzle, so it clears the journal: the moves made before cannot be undone.
             Delegates the check of the row and column indices to the `_is_valid_row_col` method.
-            Delegates the check of the cell mutability to the `Number` class.
         Args:
-            row (int): The row index (0-8).
-            col (int): The column index (0-8).
+            row (int): The row index (0 to size - 1).
+            col (int): The column index (0 to size - 1).
         Raises:
-            IndexError: If the row or column index is out of bounds (not between 0 and 8).
+            IndexError: If the row or column index is out of bounds (not between 0 and size - 1).
             TypeError: If the row or column is not of the expected type (int).
             PermissionError: If the cell cannot be modified (e.g., if it is part of the initial grid).
         """
         if self._is_valid_row_col(row, col):
-            self._grid[row][col].lock()
+            index = row * self._geometry.size + col
+            if self._fixed >> index & 1:
+                raise PermissionError("Number is already fixed.")
+            if self._values[index] == 0:
+                raise PermissionError("Cannot lock a number with value 0 (empty cell).")
+            self._fixed |= 1 << index
+            self._journal = array("L")
+            self._position = 0
+
+    def is_fixed(self, row, col):
+        """ Check if the number in the specified cell is fixed (part of the initial grid).
+            Delegates the check of the row and column indices to the `_is_valid_row_col` method.
+        Args:
+            row (int): The row index (0 to size - 1).
+            col (int): The column index (0 to size - 1).
+        Returns:
+            bool: True if the cell is fixed, False otherwise.
+        Raises:
+            IndexError: If the row or column index is out of bounds (not between 0 and size - 1).
+            TypeError: If the row or column is not of the expected type (int).
+        """
+        if self._is_valid_row_col(row, col):
+            return bool(self._fixed >> (row * self._geometry.size + col) & 1)
 
     def allowed_numbers(self, row, col):
         """ Get a list of numbers that can be placed in the specified cell without violating Sudoku rules.
             Delegates the check of the row and column indices to the `_is_valid_row_col` method.
-            Delegates the checks of cell mutability to the `Number` class.
         Args:
-            row (int): The row index (0-8).
-            col (int): The column index (0-8).
+            row (int): The row index (0 to size - 1).
+            col (int): The column index (0 to size - 1).
         Returns:
             list[int]: A list of numbers that can be placed in the specified cell.
         Raises:
-            IndexError: If the row or column index is out of bounds (not between 0 and 8).
+            IndexError: If the row or column index is out of bounds (not between 0 and size - 1).
             TypeError: If the row or column is not of the expected type (int).
-            PersmissionError: If the cell cannot be modified (e.g., if it is part of the initial grid).
         """
-        row_numbers = self._get_row(row)
-        col_numbers = self._get_column(col)
-        subgrid_numbers = self._get_subgrid(row, col)
-        if isinstance(row_numbers, list) and isinstance(col_numbers, list) and isinstance(subgrid_numbers, list):
-            used_numbers = set(row_numbers + col_numbers + subgrid_numbers)
-            return [num for num in range(1, 10) if num not in used_numbers]
+        if self._is_valid_row_col(row, col):
+            if stats.enabled:
+                stats.count("board.candidates")
+            mask = self._free_mask(row, col)
+            if self._geometry.size == 9:
+                return list(DIGITS_OF_MASK[mask])
+            return [digit for digit in range(1, self._geometry.size + 1) if mask >> digit & 1]
+
+    def allowed_mask(self, row, col):
+        """ Get the numbers that can be placed in the specified cell as a bitmask.
+            Bit `n` is set when the number `n` does not appear in the row, column or subgrid of the cell.
+            Delegates the check of the row and column indices to the `_is_valid_row_col` method.
+        Args:
+            row (int): The row index (0 to size - 1).
+            col (int): The column index (0 to size - 1).
+        Returns:
+            int: A bitmask of the numbers that can be placed in the specified cell.
+        Raises:
+            IndexError: If the row or column index is out of bounds (not between 0 and size - 1).
+            TypeError: If the row or column is not of the expected type (int).
+        """
+        if self._is_valid_row_col(row, col):
+            if stats.enabled:
+                stats.count("board.candidates")
+            return self._free_mask(row, col)
 
     def is_valid(self, row, col):
         """ Check if the number at the specified row and column is valid according to Sudoku rules.
             Delegates the check of the row and column indices to the `_is_valid_row_col` method.
         Args:
-            row (int): The row index (0-8).
-            col (int): The column index (0-8).
+            row (int): The row index (0 to size - 1).
+            col (int): The column index (0 to size - 1).
         Returns:
             bool: True if the number is valid, False otherwise.
         Raises:
-            IndexError: If the row or column index is out of bounds (not between 0 and 8).
+            IndexError: If the row or column index is out of bounds (not between 0 and size - 1).
             TypeError: If the row or column is not of the expected type (int).
         """
         if self._is_valid_row_col(row, col):
-            return self._grid[row][col].get_value() in self.allowed_numbers(row, col)
+            value = self._values[row * self._geometry.size + col]
+            return value != 0 and bool(self._free_mask(row, col) >> value & 1)
+
+    def undo(self):
+        """ Undo the last change of a cell made by `set_number` or `clear_number`, in constant time.
+        Returns:
+            tuple[int, int]: The (row, col) position of the cell restored, or None if there is nothing to undo.
+        """
+        if not self._position:
+            return None
+        self._position -= 1
+        delta = self._journal[self._position]
+        index = delta >> 2 * DELTA_BITS
+        self._change(index, delta >> DELTA_BITS & DELTA_MASK, record=False)
+        return divmod(index, self._geometry.size)
+
+    def redo(self):
+        """ Redo the last change undone by `undo`, in constant time. Any new change discards the changes left to redo.
+        Returns:
+            tuple[int, int]: The (row, col) position of the cell changed, or None if there is nothing to redo.
+        """
+        if self._position == len(self._journal):
+            return None
+        delta = self._journal[self._position]
+        self._position += 1
+        index = delta >> 2 * DELTA_BITS
+        self._change(index, delta & DELTA_MASK, record=False)
+        return divmod(index, self._geometry.size)
+
+    def snapshot(self):
+        """ Mark the current state of the board, to come back to it with `restore` without copying the board.
+        Returns:
+            int: The marker of the current state, valid as long as the changes made before it are not undone.
+        """
+        return self._position
+
+    def restore(self, marker):
+        """ Undo the changes made since a marker returned by `snapshot`, in time proportional to their number.
+            The changes undone this way are discarded and cannot be redone.
+        Args:
+            marker (int): The marker of the state to come back to.
+        Raises:
+            ValueError: If the marker is not a state of the journal that can be restored.
+        """
+        if not isinstance(marker, int) or not 0 <= marker <= self._position:
+            raise ValueError("Marker does not match a state of the journal.")
+        while self._position > marker:
+            self.undo()
+        del self._journal[marker:]
+
+    def add_listener(self, listener):
+        """ Register a function called after each change of a cell by `set_number` or `clear_number`.
+        Args:
+            listener (callable): The function, called with the row, the column, the old value and the new value of the cell.
+        Raises:
+            TypeError: If the listener is not callable.
+        """
+        if not callable(listener):
+            raise TypeError("Listener must be callable.")
+        self._listeners = self._listeners + (listener,)
+
+    def remove_listener(self, listener):
+        """ Unregister a function registered with `add_listener`. Does nothing if it is not registered.
+        Args:
+            listener (callable): The function to unregister.
+        """
+        self._listeners = tuple(registered for registered in self._listeners if registered != listener)
+
+    def is_complete(self):
+        """ Check if the board is completely filled without any conflict, in constant time.
+        Returns:
+            bool: True if all the cells are filled and no number appears twice in a row, column or subgrid, False otherwise.
+        """
+        return self._filled == self._geometry.cells and self._conflicts == 0
+
+    def get_filled_count(self):
+        """ Get the number of filled cells.
+        Returns:
+            int: The number of non-empty cells (0-81 on a 9x9 board).
+        """
+        return self._filled
+
+    def get_conflict_count(self):
+        """ Get the number of conflicts of the board.
+            Each extra occurrence of a number in a row, column or subgrid counts as one conflict.
+        Returns:
+            int: The number of conflicts, 0 if the board follows Sudoku rules.
+        """
+        return self._conflicts
+
+    def conflicting_cells(self):
+        """ Get the cells whose number also appears in their row, column or subgrid.
+            Only the units holding a conflict are scanned.
+        Returns:
+            list[tuple[int, int]]: The (row, col) positions of the conflicting cells, in row-major order.
+        """
+        if not self._conflicts:
+            return []
+        values = self._values
+        counts = self._counts
+        units = self._geometry.units
+        stride = self._geometry.size + 1
+        cells = set()
+        for unit, conflicts in enumerate(self._unit_conflicts):
+            if conflicts:
+                cells.update(index for index in units[unit] if values[index] and counts[unit * stride + values[index]] > 1)
+        return [divmod(index, self._geometry.size) for index in sorted(cells)]
 
     # Functions to support the above methods
 
-    def _create_empty_grid(self):
-        """ Create an empty 9x9 grid filled with Number instances initialized to zero.
+    @classmethod
+    def _load(cls, geometry, values, fixed):
+        """ Create a board from trusted values and fixed bitmap, skipping the checks of `__init__`.
+        Args:
+            geometry (Geometry): The tables of the grid.
+            values (bytearray): The values of the grid in row-major order (0 to size).
+            fixed (int): The bitmap of the fixed cells.
+        Returns:
+            Board: The new board.
+        """
+        board = cls.__new__(cls)
+        board._geometry = geometry
+        board._values = values
+        board._fixed = fixed
+        board._listeners = ()
+        board._journal = array("L")
+        board._position = 0
+        board._init_masks()
+        return board
+
+    def _init_masks(self):
+        """ Build the per-unit digit counters and bitmasks, the filled count and the conflict counts from the current content of the grid.
+            Each unit keeps a count per digit so that duplicates are handled when a number is cleared.
+            All of them are computed in one pass over the values: the extra copies of a digit in a unit are its conflicts.
+        """
+        geometry = self._geometry
+        units = len(geometry.units)
+        stride = geometry.size + 1
+        units_of = geometry.units_of
+        counts = bytearray(units * stride)
+        masks = [0] * units
+        filled = [0] * units
+        for index, value in enumerate(self._values):
+            if value:
+                bit = 1 << value
+                for unit in units_of[index]:
+                    counts[unit * stride + value] += 1
+                    masks[unit] |= bit
+                    filled[unit] += 1
+        self._counts = counts
+        self._masks = array("L", masks)
+        self._unit_conflicts = bytearray(count - mask.bit_count() for count, mask in zip(filled, masks))
+        self._conflicts = sum(self._unit_conflicts)
+        self._filled = geometry.cells - self._values.count(0)
+
+    def _update_masks(self, row, col, old, new):
+        """ Update the per-unit digit counters and bitmasks, the filled count and the conflict counts after a cell changed from `old` to `new`.
+        Args:
+            row (int): The row index (0 to size - 1).
+            col (int): The column index (0 to size - 1).
+            old (int): The previous value of the cell (0 to size).
+            new (int): The new value of the cell (0 to size).
+        """
+        if old == new:
+            return
+        counts = self._counts
+        masks = self._masks
+        unit_conflicts = self._unit_conflicts
+        geometry = self._geometry
+        stride = geometry.size + 1
+        conflicts = 0
+        for unit in geometry.units_of[row * geometry.size + col]:
+            if old:
+                counts[unit * stride + old] -= 1
+                if not counts[unit * stride + old]:
+                    masks[unit] &= ~(1 << old)
+                else:
+                    unit_conflicts[unit] -= 1
+                    conflicts -= 1
+            if new:
+                if counts[unit * stride + new]:
+                    unit_conflicts[unit] += 1
+                    conflicts += 1
+                counts[unit * stride + new] += 1
+                masks[unit] |= 1 << new
+        self._conflicts += conflicts
+        self._filled += (new != 0) - (old != 0)
+
+    def _change(self, index, new, record=True):
+        """ Change the value of a cell, updating the counters, the journal and the listeners. Does nothing if the value is the same.
+        Args:
+            index (int): The index of the cell (0-80 on a 9x9 board).
+            new (int): The new value of the cell (0 to size).
+            record (bool): Whether to record the change in the journal, discarding the changes left to redo. Defaults to True.
+        """
+        old = self._values[index]
+        if old == new:
+            return
+        if stats.enabled:
+            stats.count("board.writes")
+        row, col = divmod(index, self._geometry.size)
+        self._update_masks(row, col, old, new)
+        self._values[index] = new
+        if record:
+            if self._position != len(self._journal):
+                del self._journal[self._position:]
+            self._journal.append(index << 2 * DELTA_BITS | old << DELTA_BITS | new)
+            self._position += 1
+        if self._listeners:
+            self._notify(row, col, old, new)
+
+    def _notify(self, row, col, old, new):
+        """ Call the listeners after a change of a cell.
+        Args:
+            row (int): The row index (0 to size - 1).
+            col (int): The column index (0 to size - 1).
+            old (int): The previous value of the cell (0 to size).
+            new (int): The new value of the cell (0 to size).
+        """
+        for listener in self._listeners:
+            listener(row, col, old, new)
+
+    def _free_mask(self, row, col):
+        """ Get the bitmask of the numbers absent from the row, column and subgrid of the specified cell.
+            Does not check the row and column indices.
+        Args:
+            row (int): The row index (0 to size - 1).
+            col (int): The column index (0 to size - 1).
         Returns:
-            list[list[Number]]: A 9x9 grid where each cell is an instance of the Number class initialized
+            int: A bitmask where bit `n` is set if the number `n` can be placed in the cell.
         """
-        return [[Number(0) for _ in range(9)] for _ in range(9)]
+        masks = self._masks
+        geometry = self._geometry
+        row_unit, col_unit, box_unit = geometry.units_of[row * geometry.size + col]
+        return ~(masks[row_unit] | masks[col_unit] | masks[box_unit]) & geometry.all_digits
 
     def _is_empty(self, row, col):
         """ Check if the specified cell is empty (contains zero).
             Delegates the check of the row and column indices to the `_is_valid_row_col` method.
         Args:
-            row (int): The row index (0-8).
-            col (int): The column index (0-8).
+            row (int): The row index (0 to size - 1).
+            col (int): The column index (0 to size - 1).
         Returns:
             bool: True if the cell is empty (contains zero), False otherwise.
         Raises:
-            IndexError: If the row or column index is out of bounds (not between 0 and 8).
+            IndexError: If the row or column index is out of bounds (not between 0 and size - 1).
             TypeError: If the row or column is not of the expected type (int).
         """
         if self._is_valid_row_col(row, col):
-            return self._grid[row][col].get_value() == 0
+            return self._values[row * self._geometry.size + col] == 0
 
     def _get_row(self, row):
         """ Get the numbers appearing in the specified row. Don't include zeroes.
             Delegates the check of the row index to the `_is_valid_row_col` method.
         Args:
-            row (int): The row index (0-8).
+            row (int): The row index (0 to size - 1).
         Returns:
             list[int]: A list of numbers from the specified row.
         Raises:
-            IndexError: If the row index is out of bounds (not between 0 and 8).
+            IndexError: If the row index is out of bounds (not between 0 and size - 1).
             TypeError: If the row index is not of the expected type (int).
         """
         if self._is_valid_row_col(row, 0):
-            return [self._grid[row][col].get_value() for col in range(9) if self._grid[row][col].get_value() != 0]
+            size = self._geometry.size
+            return [value for value in self._values[row * size:row * size + size] if value != 0]
 
     def _get_column(self, col):
         """ Get the numbers appearing in the specified column. Don't include zeroes.
             Delegates the check of the column index to the `_is_valid_row_col` method.
         Args:
-            col (int): The column index (0-8).
+            col (int): The column index (0 to size - 1).
         Returns:
             list[int]: A list of numbers from the specified column.
         Raises:
-            IndexError: If the column index is out of bounds (not between 0 and 8).
+            IndexError: If the column index is out of bounds (not between 0 and size - 1).
             TypeError: If the column index is not of the expected type (int).
         """
         if self._is_valid_row_col(0, col):
-            return [self._grid[row][col].get_value() for row in range(9) if self._grid[row][col].get_value() != 0]
+            return [value for value in self._values[col::self._geometry.size] if value != 0]
 
     def _get_subgrid(self, row, col):
-        """ Get the numbers appearing in the 3x3 subgrid containing the specified cell. Don't include zeroes.
+        """ Get the numbers appearing in the subgrid containing the specified cell. Don't include zeroes.
             Delegates the check of the row and column indices to the `_is_valid_row_col` method.
         Args:
-            row (int): The row index (0-8).
-            col (int): The column index (0-8).
+            row (int): The row index (0 to size - 1).
+            col (int): The column index (0 to size - 1).
         Returns:
-            list[int]: A list of numbers from the specified 3x3 subgrid.
+            list[int]: A list of numbers from the specified subgrid.
         Raises:
-            IndexError: If the row or column index is out of bounds (not between 0 and 8).
+            IndexError: If the row or column index is out of bounds (not between 0 and size - 1).
             TypeError: If the row or column is not of the expected type (int).
         """
         if self._is_valid_row_col(row, col):
-            start_row = (row // 3) * 3
-            start_col = (col // 3) * 3
-            return [self._grid[r][c].get_value() for r in range(start_row, start_row + 3) for c in range(start_col, start_col + 3) if self._grid[r][c].get_value() != 0]
+            values = self._values
+            geometry = self._geometry
+            return [values[index] for index in geometry.units[geometry.units_of[row * geometry.size + col][2]] if values[index] != 0]
 
     def _is_valid_row_col(self, row, col):
-        """ Check if the row and column indices are valid (between 0 and 8). And if they are of the expected type (int).
+        """ Check if the row and column indices are valid (between 0 and size - 1). And if they are of the expected type (int).
         Args:
-            row (int): The row index (0-8).
-            col (int): The column index (0-8).
+            row (int): The row index (0 to size - 1).
+            col (int): The column index (0 to size - 1).
         Returns:
             bool: True if the row and column indices are valid, False otherwise.
         Raises:
-            IndexError: If the row or column index is out of bounds (not between 0 and 8).
+            IndexError: If the row or column index is out of bounds (not between 0 and size - 1).
             TypeError: If the row or column is not of the expected type (int).
         """
         if not isinstance(row, int) or not isinstance(col, int):
             raise TypeError("Row and column indices must be integers.")
-        if not (0 <= row < 9) or not (0 <= col < 9):
-            raise IndexError("Row and column indices must be between 0 and 8.")
-        return True
\ No newline at end of file
+        size = self._geometry.size
+        if not (0 <= row < size) or not (0 <= col < size):
+            raise IndexError(f"Row and column indices must be between 0 and {size - 1}.")
+        return True
+
+def _packed_sizes(geometry):
+    """ Get the sizes of the two parts of a packed board.
+    Args:
+        geometry (Geometry): The tables of the grid.
+    Returns:
+        tuple[int, int]: The number of bytes of the fixed cells bitmap and of the values.
+    """
+    cells = geometry.cells
+    return (cells + 7) // 8, (cells + 1) // 2 if geometry.size < 16 else cells
+
+def _filled_bitmap(values):
+    """ Get the bitmap of the non-empty cells of a grid.
+    Args:
+        values (bytearray): The values of the grid in row-major order.
+    Returns:
+        int: The bitmap, with bit `index` set for each non-empty cell.
+    """
+    return int(values.translate(FILLED_BITS)[::-1], 2)
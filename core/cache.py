@@ -0,0 +1,141 @@
+""" Sudoku Solution Cache Class
+This module is part of the core package of the Sudoku game.
+It defines the `SolutionCache` class, which remembers the solutions of recently solved puzzles
+with a bounded size and least-recently-used eviction.
+"""
+
+import threading
+from collections import OrderedDict
+
+from core.solver import Solver
+
+DEFAULT_CACHE_SIZE = 1024
+_UNSOLVABLE = b""  # Cached result of a puzzle without solution
+
+class SolutionCache:
+    """ Class caching the solutions of puzzles, keyed by their givens. Safe to share between threads. """
+
+    def __init__(self, max_size=DEFAULT_CACHE_SIZE, canonical=False):
+        """ Initialize an empty cache.
+        Args:
+            max_size (int): The maximum number of puzzles kept. Defaults to `DEFAULT_CACHE_SIZE`.
+            canonical (bool): Whether to key the puzzles by their canonical form, so that equivalent puzzles share an entry.
+                Computing the canonical form takes tens of milliseconds, and hundreds on grids with many symmetries, far more
+                than solving a puzzle, so it only pays off when the same expensive puzzles come back under other symmetries.
+                Defaults to False.
+        Raises:
+            ValueError: If the maximum size is not a positive integer.
+        """
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError("Maximum size must be a positive integer.")
+        self._max_size = max_size
+        self._canonical = canonical
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._solver = Solver()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    # Methods to use the cache
+
+    def get_solution(self, givens):
+        """ Get the solution of a puzzle, solving it on a cache miss.
+            Delegates the solving to the `Solver` class.
+        Args:
+            givens (list[int]): The 81 givens of the puzzle in row-major order (0 for empty cells).
+        Returns:
+            list[int]: The 81 values of the solution, or None if the puzzle has no solution.
+        Raises:
+            ValueError: If the puzzle does not contain 81 values.
+        """
+        key, transform = self._key(givens)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        if entry is None:
+            solution = next(self._solver.solve_values(self._orient(givens, transform), limit=1), None)
+            entry = bytes(solution) if solution is not None else _UNSOLVABLE
+            self._store(key, entry)
+        if entry == _UNSOLVABLE:
+            return None
+        if transform is None:
+            return list(entry)
+        from core.canonical import invert_transform
+        return invert_transform(list(entry), transform)
+
+    def put(self, givens, solution):
+        """ Store the known solution of a puzzle, e.g. the one returned by the generator.
+        Args:
+            givens (list[int]): The 81 givens of the puzzle in row-major order (0 for empty cells).
+            solution (list[int]): The 81 values of its solution.
+        Raises:
+            ValueError: If the puzzle or the solution does not contain 81 values.
+        """
+        if len(solution) != 81:
+            raise ValueError("Solution must contain 81 values.")
+        key, transform = self._key(givens)
+        self._store(key, bytes(self._orient(solution, transform)))
+
+    def get_stats(self):
+        """ Get the counters of the cache.
+        Returns:
+            dict: The number of "hits", "misses" and "evictions" since the cache was created or cleared, and its current "size".
+        """
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "evictions": self._evictions, "size": len(self._entries)}
+
+    def clear(self):
+        """ Remove all the puzzles from the cache and reset its counters. """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    # Functions to support the above methods
+
+    def _key(self, givens):
+        """ Get the key of a puzzle in the cache.
+        Args:
+            givens (list[int]): The 81 givens of the puzzle.
+        Returns:
+            tuple[bytes | str, tuple]: The key, and the symmetry to its canonical form (None if the cache is not canonical).
+        Raises:
+            ValueError: If the puzzle does not contain 81 values.
+        """
+        if len(givens) != 81:
+            raise ValueError("Puzzle must contain 81 values.")
+        if self._canonical:
+            # Imported here as only canonical caches need the canonical module, which is slow to import
+            from core.canonical import canonicalize
+            return canonicalize(list(givens))
+        return bytes(givens), None
+
+    def _orient(self, values, transform):
+        """ Bring a grid to the orientation of the keys of the cache.
+        Args:
+            values (list[int]): The 81 values of the grid.
+            transform (tuple): The symmetry to the canonical form, or None.
+        Returns:
+            list[int]: The values in the orientation of the keys.
+        """
+        if transform is None:
+            return list(values)
+        from core.canonical import apply_transform
+        return apply_transform(values, transform)
+
+    def _store(self, key, entry):
+        """ Store an entry as the most recently used, evicting the least recently used one if the cache is full.
+        Args:
+            key (bytes | str): The key of the puzzle.
+            entry (bytes): The solution of the puzzle in the orientation of the key, or `_UNSOLVABLE`.
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
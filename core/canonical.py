@@ -0,0 +1,307 @@
+""" Sudoku Canonical Form
+This module is part of the core package of the Sudoku game.
+It computes a canonical form of a grid, identical for all the grids equivalent under the symmetries of Sudoku:
+digit relabeling, row permutations within bands, column permutations within stacks, band and stack swaps, and transposition.
+
+The canonical form is the smallest 81-character string, over all these symmetries, where the digits are relabeled
+in order of first appearance (1 for the first digit met, 2 for the next new one, ...) and empty cells are written "0".
+It is found by branch and bound: the rows are placed one at a time and only the partial grids with the smallest prefix are kept.
+"""
+
+from itertools import permutations
+from operator import itemgetter
+
+from core.board import Board
+
+DIGITS = bytes(range(1, 10))
+UNLABELED = b"\xff"  # Label of the values not met yet
+PERMUTATIONS_OF_3 = tuple(permutations(range(3)))
+# The 1296 orders of the columns (or rows) keeping each stack (or band) together
+LINE_ORDERS = tuple(
+    tuple(stack * 3 + offset for stack, offsets in zip(stacks, inner) for offset in offsets)
+    for stacks in PERMUTATIONS_OF_3
+    for inner in ((a, b, c) for a in PERMUTATIONS_OF_3 for b in PERMUTATIONS_OF_3 for c in PERMUTATIONS_OF_3)
+)
+LINE_PICKERS = tuple(itemgetter(*order) for order in LINE_ORDERS)
+EMPTY_TABLE = bytes([0]) + UNLABELED * 255  # No value labeled yet
+COLUMNS = bytes(range(9))
+# For each column order, the translation table from a column to its position in the order, counted from 1
+POSITION_TABLES = tuple(bytes.maketrans(bytes(order), DIGITS) for order in LINE_ORDERS)
+
+def canonical_form(board):
+    """ Get the canonical form of a grid, to compare grids up to the symmetries of Sudoku.
+    Args:
+        board (Board | list[int]): The grid, as a board or as 81 values in row-major order (0 for empty cells).
+    Returns:
+        str: The canonical form of the grid, as 81 characters.
+    Raises:
+        TypeError: If the grid is neither a board nor a list of values.
+        ValueError: If the list does not contain 81 values, or the board is not 9x9.
+    """
+    return canonicalize(board)[0]
+
+def canonicalize(board):
+    """ Get the canonical form of a grid and a symmetry turning the grid into it.
+    Args:
+        board (Board | list[int]): The grid, as a board or as 81 values in row-major order (0 for empty cells).
+    Returns:
+        tuple[str, tuple]: The canonical form of the grid, and the symmetry as a tuple (transpose, rows, cols, labels):
+        cell (i, j) of the canonical grid holds `labels[value]`, where `value` is the cell (rows[i], cols[j])
+        of the grid, transposed first if `transpose` is True. `labels` maps every value 0-9 to its new value.
+    Raises:
+        TypeError: If the grid is neither a board nor a list of values.
+        ValueError: If the list does not contain 81 values, or the board is not 9x9.
+    """
+    values = _get_values(board)
+    grids = (
+        tuple(bytes(values[row * 9:row * 9 + 9]) for row in range(9)),
+        tuple(bytes(values[col::9]) for col in range(9)),
+    )
+    if all(len(set(line)) == 9 and 0 not in line for grid in grids for line in grid):
+        states, start = _first_two_rows(grids), 2
+    else:
+        states, start = _first_rows(grids), 1
+    for depth in range(start, 9):
+        best, kept = None, []
+        for transpose, order, rows, table in states:
+            grid = grids[transpose]
+            pick = LINE_PICKERS[order]
+            for row in _next_rows(rows, depth):
+                values = bytes(pick(grid[row]))
+                line = values.translate(table)
+                new_table = table
+                if UNLABELED in line:
+                    line, new_table = _relabel(values, table)
+                if best is None or line < best:
+                    best, kept = line, []
+                if line == best:
+                    kept.append((transpose, order, rows + (row,), new_table))
+        states = _unique_states(kept, grids) if len(kept) > 1 else kept
+    transpose, order, rows, table = states[0]
+    labels = _complete_labels(table)
+    cols = LINE_ORDERS[order]
+    key = "".join(str(labels[value]) for row in rows for value in LINE_PICKERS[order](grids[transpose][row]))
+    return key, (bool(transpose), rows, cols, labels)
+
+def apply_transform(values, transform):
+    """ Apply a symmetry returned by `canonicalize` to a grid, e.g. to bring its solution to the canonical orientation.
+    Args:
+        values (list[int]): The 81 values of the grid in row-major order (0 for empty cells).
+        transform (tuple): The symmetry (transpose, rows, cols, labels).
+    Returns:
+        list[int]: The 81 values of the transformed grid.
+    """
+    transpose, rows, cols, labels = transform
+    if transpose:
+        return [labels[values[col * 9 + row]] for row in rows for col in cols]
+    return [labels[values[row * 9 + col]] for row in rows for col in cols]
+
+def invert_transform(values, transform):
+    """ Undo a symmetry returned by `canonicalize`, e.g. to bring a canonical solution back to the original grid.
+    Args:
+        values (list[int]): The 81 values of the transformed grid in row-major order.
+        transform (tuple): The symmetry (transpose, rows, cols, labels) applied to the original grid.
+    Returns:
+        list[int]: The 81 values of the original grid.
+    """
+    transpose, rows, cols, labels = transform
+    digits = [0] * 10
+    for value, label in enumerate(labels):
+        digits[label] = value
+    result = [0] * 81
+    for i, row in enumerate(rows):
+        for j, col in enumerate(cols):
+            index = col * 9 + row if transpose else row * 9 + col
+            result[index] = digits[values[i * 9 + j]]
+    return result
+
+# Functions to support the above methods
+
+def _get_values(board):
+    """ Read the values of a grid given as a board or a list.
+    Args:
+        board (Board | list[int]): The grid.
+    Returns:
+        list[int]: The 81 values of the grid in row-major order.
+    Raises:
+        TypeError: If the grid is neither a board nor a list of values.
+        ValueError: If the list does not contain 81 values, or the board is not 9x9.
+    """
+    if isinstance(board, Board):
+        if board.get_size() != 9:
+            raise ValueError("Board must be a 9x9 board.")
+        return [board.get_number(index // 9, index % 9) for index in range(81)]
+    if not isinstance(board, (list, tuple)):
+        raise TypeError("Grid must be an instance of the Board class or a list of values.")
+    if len(board) != 81:
+        raise ValueError("Grid must contain 81 values.")
+    return list(board)
+
+def _next_rows(rows, depth):
+    """ Get the rows that can be placed at a depth, keeping each band together.
+    Args:
+        rows (tuple[int]): The rows already placed.
+        depth (int): The index of the row to place (0-8).
+    Returns:
+        list[int]: The candidate rows.
+    """
+    if depth % 3:
+        band = rows[-1] // 3
+        return [row for row in range(band * 3, band * 3 + 3) if row not in rows]
+    used = {row // 3 for row in rows}
+    return [row for row in range(9) if row // 3 not in used]
+
+def _first_rows(grids):
+    """ Find the partial grids with the smallest first row.
+        Empty cells come first in the order of the canonical form, so the rows and column orders placing the most
+        empty cells first are found from the number of filled cells of each stack, before comparing their labels.
+        Column orders giving the same columns in the same order are only tried once.
+    Args:
+        grids (tuple): The rows of the grid and of its transpose, as bytes.
+    Returns:
+        list[tuple]: The states (transpose, column order, rows placed, labels as a translation table) with the smallest first row.
+    """
+    patterns = {}
+    for transpose, grid in enumerate(grids):
+        for row, line in enumerate(grid):
+            filled = sorted(sum(value != 0 for value in line[stack * 3:stack * 3 + 3]) for stack in range(3))
+            patterns[transpose, row] = tuple(cell >= 3 - count for count in filled for cell in range(3))
+    best_pattern = min(patterns.values())
+    best, states = None, []
+    for transpose, grid in enumerate(grids):
+        rows = [row for row in range(9) if patterns[transpose, row] == best_pattern]
+        if not rows:
+            continue
+        filled = [tuple(value != 0 for value in grid[row]) for row in rows]
+        for order in _distinct_orders(grids[1 - transpose]):
+            pick = LINE_PICKERS[order]
+            for row, cells in zip(rows, filled):
+                if pick(cells) != best_pattern:
+                    continue
+                values = bytes(pick(grid[row]))
+                digits = values.replace(b"\0", b"")
+                if len(set(digits)) == len(digits):
+                    # Distinct values are labeled in order with a single translation table
+                    others = DIGITS.translate(None, digits)
+                    table = bytes.maketrans(digits + others, DIGITS[:len(digits)] + UNLABELED * len(others))
+                    line = values.translate(table)
+                else:
+                    line, table = _relabel(values, EMPTY_TABLE)
+                if best is None or line < best:
+                    best, states = line, []
+                if line == best:
+                    states.append((transpose, order, (row,), table))
+    return _unique_states(states, grids) if len(states) > 1 else states
+
+def _first_two_rows(grids):
+    """ Find the partial grids with the smallest two first rows, for a complete grid whose rows hold distinct values.
+        The first row always reads 1 to 9, so its labels are the positions of its columns: the second row, taken from the
+        same band, is the permutation `h` mapping each column to the column of its value in the first row, conjugated
+        by the column order. It is computed with one translation per column order.
+    Args:
+        grids (tuple): The rows of the grid and of its transpose, as bytes.
+    Returns:
+        list[tuple]: The states (transpose, column order, rows placed, labels as a translation table) with the smallest two first rows.
+    """
+    best, kept = None, []
+    for transpose, grid in enumerate(grids):
+        for first in range(9):
+            columns = bytes.maketrans(grid[first], COLUMNS)
+            band = first // 3 * 3
+            seconds = [(row, grid[row].translate(columns)) for row in range(band, band + 3) if row != first]
+            for order in range(len(LINE_ORDERS)):
+                pick = LINE_PICKERS[order]
+                positions = POSITION_TABLES[order]
+                for second, h in seconds:
+                    line = bytes(pick(h)).translate(positions)
+                    if best is None or line < best:
+                        best, kept = line, []
+                    if line == best:
+                        kept.append((transpose, order, first, second))
+    states = []
+    for transpose, order, first, second in kept:
+        table = bytes.maketrans(grids[transpose][first], COLUMNS.translate(POSITION_TABLES[order]))
+        states.append((transpose, order, (first, second), table))
+    return states
+
+def _distinct_orders(columns):
+    """ Get the column orders leading to different grids, skipping the orders that only swap identical columns.
+    Args:
+        columns (tuple[bytes]): The columns of the grid, as the rows of the other orientation.
+    Returns:
+        list[int]: The indices of the column orders in `LINE_ORDERS`.
+    """
+    ids = tuple(columns.index(column) for column in columns)
+    if len(set(ids)) == 9:
+        return range(len(LINE_ORDERS))
+    seen = set()
+    orders = []
+    for order, pick in enumerate(LINE_PICKERS):
+        signature = pick(ids)
+        if signature not in seen:
+            seen.add(signature)
+            orders.append(order)
+    return orders
+
+def _relabel(line, table):
+    """ Give new labels, in order of first appearance, to the values of a row that are not labeled yet.
+    Args:
+        line (bytes): The values of the row (0 for empty cells).
+        table (bytes): The translation table of the labels so far.
+    Returns:
+        tuple[bytes, bytes]: The relabeled row and the updated translation table.
+    """
+    table = bytearray(table)
+    next_label = 10 - DIGITS.translate(table).count(UNLABELED)
+    for value in line:
+        if value and table[value] == UNLABELED[0]:
+            table[value] = next_label
+            next_label += 1
+    table = bytes(table)
+    return line.translate(table), table
+
+def _unique_states(states, grids):
+    """ Keep one state among those leading to the same completions, which happens for sparse or symmetric grids.
+        The completions of a state only depend on its labels and on the values of the rows left, in column order,
+        grouped by band: the rows of a band and the bands themselves can be placed in any order.
+        Rows without empty cells tell their column order apart, so states are only compared while empty cells remain.
+    Args:
+        states (list[tuple]): The states kept at a depth.
+        grids (tuple): The rows of the grid and of its transpose, as bytes.
+    Returns:
+        list[tuple]: One state for each set of completions, in their first order.
+    """
+    if all(0 not in grids[transpose][row] for transpose in (0, 1) for row in range(9) if row not in states[0][2]):
+        return states
+    seen = set()
+    unique = []
+    for state in states:
+        transpose, order, rows, table = state
+        pick = LINE_PICKERS[order]
+        lines = [bytes(pick(line)) if row not in rows else None for row, line in enumerate(grids[transpose])]
+        current = rows[-1] // 3 if len(rows) % 3 else None
+        bands = tuple(sorted(
+            tuple(sorted(lines[band * 3:band * 3 + 3]))
+            for band in range(3) if band != current and all(line is not None for line in lines[band * 3:band * 3 + 3])
+        ))
+        band = tuple(sorted(line for line in lines[current * 3:current * 3 + 3] if line is not None)) if current is not None else None
+        key = (table, band, bands)
+        if key not in seen:
+            seen.add(key)
+            unique.append(state)
+    return unique
+
+def _complete_labels(table):
+    """ Give a label to the values absent from the grid, in increasing order, so that the labels form a permutation of 1-9.
+    Args:
+        table (bytes): The translation table of the labels.
+    Returns:
+        tuple[int]: The label of each value 0-9.
+    """
+    labels = [0] + [table[value] for value in DIGITS]
+    next_label = 10 - labels.count(UNLABELED[0])
+    for value in DIGITS:
+        if labels[value] == UNLABELED[0]:
+            labels[value] = next_label
+            next_label += 1
+    return tuple(labels)
@@ -0,0 +1,134 @@
+""" Sudoku Puzzle Catalog Class
+This module is part of the core package of the Sudoku game.
+It defines the `PuzzleCatalog` class, which serves puzzles addressed by an ID instead of storing them.
+An ID encodes the version of the generator, the level and the seed of a puzzle, such as "1-hard-9f86d081884c7d65",
+so the puzzle is generated again from its ID on demand. Recently used puzzles are kept in a small cache with LRU eviction.
+"""
+
+import random
+import re
+import threading
+from collections import OrderedDict
+
+from core.generator import GENERATOR_VERSION, LEVEL_CLUES, Generator
+
+DEFAULT_CATALOG_SIZE = 64
+MAX_SEED = 2 ** 64 - 1
+# Format of an ID, with a single spelling for each puzzle: no leading zero in the version, 16 lowercase hex digits in the seed
+ID_PATTERN = re.compile(r"(0|[1-9][0-9]*)-([a-z]+)-([0-9a-f]{16})")
+
+def make_id(level, seed):
+    """ Get the ID of the puzzle generated for a level from a seed by the current version of the generator.
+    Args:
+        level (str): The difficulty level of the puzzle.
+        seed (int): The seed of the generator, between 0 and `MAX_SEED`.
+    Returns:
+        str: The ID of the puzzle.
+    Raises:
+        ValueError: If the level or the seed is not valid.
+    """
+    if level not in LEVEL_CLUES:
+        raise ValueError(f"Level must be one of {list(LEVEL_CLUES)}.")
+    if not isinstance(seed, int) or not 0 <= seed <= MAX_SEED:
+        raise ValueError(f"Seed must be an integer between 0 and {MAX_SEED}.")
+    return f"{GENERATOR_VERSION}-{level}-{seed:016x}"
+
+def parse_id(puzzle_id):
+    """ Read the version of the generator, the level and the seed encoded in a puzzle ID.
+    Args:
+        puzzle_id (str): The ID of the puzzle.
+    Returns:
+        tuple[int, str, int]: The version of the generator, the level and the seed of the puzzle.
+    Raises:
+        ValueError: If the ID is not valid.
+    """
+    match = ID_PATTERN.fullmatch(puzzle_id) if isinstance(puzzle_id, str) else None
+    if match is None or match[2] not in LEVEL_CLUES:
+        raise ValueError(f"Invalid puzzle ID: {puzzle_id!r}.")
+    return int(match[1]), match[2], int(match[3], 16)
+
+class PuzzleCatalog:
+    """ Class generating puzzles from their ID, keeping the recently used ones. Safe to share between threads. """
+
+    def __init__(self, max_size=DEFAULT_CATALOG_SIZE, seed=None):
+        """ Initialize the catalog with an empty cache.
+        Args:
+            max_size (int): The maximum number of puzzles kept. Defaults to `DEFAULT_CATALOG_SIZE`.
+            seed (int): The seed used to pick new puzzle IDs. Defaults to None, which uses a random seed.
+        Raises:
+            ValueError: If the maximum size is not a positive integer.
+        """
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError("Maximum size must be a positive integer.")
+        self._max_size = max_size
+        self._random = random.Random(seed)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    # Methods to use the catalog
+
+    def new_id(self, level):
+        """ Pick the ID of a new puzzle for a level.
+        Args:
+            level (str): The difficulty level of the puzzle.
+        Returns:
+            str: The ID of the puzzle.
+        Raises:
+            ValueError: If the level is not valid.
+        """
+        with self._lock:
+            seed = self._random.getrandbits(64)
+        return make_id(level, seed)
+
+    def get_puzzle(self, puzzle_id):
+        """ Get the puzzle of an ID, generating it on a cache miss.
+            Delegates the generation to the `Generator` class, seeded with the seed of the ID.
+        Args:
+            puzzle_id (str): The ID of the puzzle.
+        Returns:
+            tuple[list[int], list[int], dict]: The givens, the solution and the grade of the puzzle (see `Generator.generate`).
+        Raises:
+            ValueError: If the ID is not valid or was made by another version of the generator.
+        """
+        version, level, seed = parse_id(puzzle_id)
+        if version != GENERATOR_VERSION:
+            raise ValueError(f"Puzzle ID was made by version {version} of the generator, not {GENERATOR_VERSION}.")
+        key = (level, seed)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        if entry is None:
+            generator = Generator(seed)
+            givens, solution = generator.generate(level)
+            entry = (bytes(givens), bytes(solution), generator.get_last_grade())
+            self._store(key, entry)
+        givens, solution, grade = entry
+        return list(givens), list(solution), dict(grade, techniques=dict(grade["techniques"]))
+
+    def get_stats(self):
+        """ Get the counters of the cache.
+        Returns:
+            dict: The number of "hits" and "misses" since the catalog was created, and the current "size" of the cache.
+        """
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "size": len(self._entries)}
+
+    # Functions to support the above methods
+
+    def _store(self, key, entry):
+        """ Store a puzzle as the most recently used, evicting the least recently used one if the cache is full.
+        Args:
+            key (tuple[str, int]): The level and the seed of the puzzle.
+            entry (tuple[bytes, bytes, dict]): The givens, the solution and the grade of the puzzle.
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
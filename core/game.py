@@ -3,27 +3,113 @@ This module is part of the core package of the Sudoku game.
 It defines the `Game` class, which represents a Sudoku game and provides methods.
 """
 
+import threading
+import time
+
+from . import stats
 from .board import Board
+from .cache import SolutionCache
+from .catalog import PuzzleCatalog, parse_id
+from .logic import TECHNIQUES, LogicSolver
 
 valid_levels = ["easy", "medium", "hard", "expert"]
 statuses = ["not started", "in progress", "completed"]
+# Cache of solutions shared by the games which are not given their own
+shared_cache = SolutionCache()
+# Catalog of puzzles addressed by ID shared by the games which are not given their own
+shared_catalog = PuzzleCatalog()
+
+def find_hint(board, cache=None, is_stale=None):
+    """ Find the next logical move on a 9x9 board in the calling thread. Wrong numbers of the player are ignored.
+        Delegates the solving to the `SolutionCache` and `LogicSolver` classes.
+    Args:
+        board (Board): The board, whose fixed numbers form the puzzle.
+        cache (SolutionCache): The cache of solutions used to solve the puzzle. Defaults to None, which uses `shared_cache`.
+        is_stale (callable): A function returning True once the hint is no longer needed, checked between the steps
+            of the logic solver. Defaults to None, which never gives up.
+    Returns:
+        tuple[int, int, int, str]: The row, the column and the number to place, and the hardest technique needed
+        ("solution" if the techniques of the `LogicSolver` class are not enough), or None if the board is complete,
+        the puzzle has no solution or the hint is stale.
+    Raises:
+        ValueError: If the board is not 9x9.
+    """
+    if board.get_size() != 9:
+        raise ValueError("Hints need a 9x9 board.")
+    if cache is None:
+        cache = shared_cache
+    if is_stale is None:
+        is_stale = lambda: False
+    values = [board.get_number(index // 9, index % 9) for index in range(81)]
+    givens = [value if board.is_fixed(index // 9, index % 9) else 0 for index, value in enumerate(values)]
+    solution = cache.get_solution(givens)
+    if solution is None:
+        return None
+    known = [value if value == solution[index] else 0 for index, value in enumerate(values)]
+    if 0 not in known:
+        return None
+    solver = LogicSolver(known)
+    hardest = None
+    while not is_stale():
+        step = solver.step()
+        if step is None:
+            break
+        name, placements, _ = step
+        if hardest is None or TECHNIQUES[name] > TECHNIQUES[hardest]:
+            hardest = name
+        if placements:
+            index, digit = placements[0]
+            return index // 9, index % 9, digit, hardest
+    if is_stale():
+        return None
+    # No technique applies: reveal the empty cell with the fewest candidates
+    values = solver.get_values()
+    index = min((index for index in range(81) if not values[index]), key=lambda index: len(solver.get_candidates(index)))
+    return index // 9, index % 9, solution[index], "solution"
 
 class Game:
     """ Class representing a Sudoku game with methods for management and control. """
 
-    def __init__(self, level):
+    def __init__(self, level, source=None, cache=None, catalog=None):
         """ Initialize the Sudoku game by creating a new board and setting the game level.
         Args:
             level (str): The difficulty level of the Sudoku puzzle. Valid levels are "easy", "medium", "hard", and "expert".
+            source (PuzzlePool | PuzzleBank): A pool or a bank of ready puzzles to start the games from. Defaults to None, which generates each puzzle on demand.
+            cache (SolutionCache): The cache of solutions used to solve the puzzles. Defaults to None, which uses `shared_cache`.
+            catalog (PuzzleCatalog): The catalog generating the puzzles from their ID. Defaults to None, which uses `shared_catalog`.
         Raises:
             ValueError: If the level is not valid.
+            TypeError: If the source is not an instance of the PuzzlePool or PuzzleBank class, the cache is not an instance of the SolutionCache class,
+                or the catalog is not an instance of the PuzzleCatalog class.
         """
         if level not in valid_levels:
             raise ValueError(f"Level must be one of {valid_levels}.")
+        if source is not None:
+            # Imported here as most games have no source, which spares them the imports of the pool and the bank
+            from .bank import PuzzleBank
+            from .pool import PuzzlePool
+            if not isinstance(source, (PuzzlePool, PuzzleBank)):
+                raise TypeError("Source must be an instance of the PuzzlePool or PuzzleBank class.")
+        if cache is not None and not isinstance(cache, SolutionCache):
+            raise TypeError("Cache must be an instance of the SolutionCache class.")
+        if catalog is not None and not isinstance(catalog, PuzzleCatalog):
+            raise TypeError("Catalog must be an instance of the PuzzleCatalog class.")
         
         self._level = level
-        self._board = Board()
+        self._source = source
+        self._cache = cache if cache is not None else shared_cache
+        self._board = None
         self._status = "not started"
+        self._catalog = catalog if catalog is not None else shared_catalog
+        self._puzzle_id = None
+        self._solution = None
+        self._generation_time = 0.0
+        self._grade = None
+        self._hint_condition = threading.Condition()
+        self._hint_thread = None
+        self._hint_version = 0
+        self._hint = None  # (version of the board, hint) computed last
+        self._attach_board(Board())
         
     def __str__(self):
         """ Display the Sudoku game information.
@@ -31,6 +117,17 @@ class Game:
             str: A string representation of the game.
         """
         return f"Sudoku Game - Level: {self._level}, Status: {self._status}\n{self._board}"
+
+    def __enter__(self):
+        """ Use the game as a context manager, which calls `close` on exit.
+        Returns:
+            Game: The game.
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """ Close the game when leaving the context. """
+        self.close()
     
     # Methods to manipulate the Sudoku game
     
@@ -61,15 +158,18 @@ class Game:
         return self._board
 
     def set_board(self, board):
-        """ Set the current board of the game.
+        """ Set the current board of the game, stopping the background thread computing the hints.
         Args:
             board (Board): The new board to set for the game.
         Raises:
             TypeError: If the board is not an instance of the Board class.
+            ValueError: If the board is not 9x9.
         """
         if not isinstance(board, Board):
             raise TypeError("Board must be an instance of the Board class.")
-        self._board = board
+        if board.get_size() != 9:
+            raise ValueError("Board must be 9x9.")
+        self._attach_board(board)
 
     def get_status(self):
         """ Get the current status of the game.
@@ -89,18 +189,131 @@ class Game:
             raise ValueError(f"Status must be one of {statuses}.")
         self._status = status
 
-    def start_game(self):
+    def get_generation_time(self):
+        """ Get the time spent providing the current puzzle, by generating it or by taking it from the pool or bank.
+        Returns:
+            float: The duration of the last puzzle generation in seconds, or 0.0 if no puzzle was generated.
+        """
+        return self._generation_time
+
+    def get_grade(self):
+        """ Get the grade of the current puzzle, measured from the techniques needed to solve it.
+        Returns:
+            dict: The "level", "rating", "techniques" and "solved" keys (see `LogicSolver.grade`), or None if no puzzle was generated.
+        """
+        return self._grade
+
+    def get_puzzle_id(self):
+        """ Get the ID of the current puzzle, which `start_game` accepts to play the same puzzle again.
+        Returns:
+            str: The ID of the puzzle (see `PuzzleCatalog`), or None if no puzzle was generated or it came from a pool or a bank.
+        """
+        return self._puzzle_id
+
+    def get_stats(self):
+        """ Get the instrumentation counters and timers, with the statistics of the solution cache.
+            Counters and timers are shared by the process and only recorded while `stats.enable()` is in effect.
+        Returns:
+            dict: The "counters" and "timers" (see `stats.get_stats`), the "cache" statistics (see `SolutionCache.get_stats`)
+            and the "generation_time" of the current puzzle in seconds.
+        """
+        data = stats.get_stats()
+        data["cache"] = self._cache.get_stats()
+        data["generation_time"] = self._generation_time
+        return data
+
+    def undo(self):
+        """ Undo the last move of the player.
+            Delegates the undo to the `Board` class.
+        Returns:
+            tuple[int, int]: The (row, col) position of the cell restored, or None if there is nothing to undo.
+        """
+        return self._board.undo()
+
+    def redo(self):
+        """ Redo the last move undone by the player.
+            Delegates the redo to the `Board` class.
+        Returns:
+            tuple[int, int]: The (row, col) position of the cell changed, or None if there is nothing to redo.
+        """
+        return self._board.redo()
+
+    def get_solution(self):
+        """ Get the solution of the puzzle formed by the fixed numbers of the board.
+            Delegates the solving to the `SolutionCache` class, so repeated requests for the same puzzle are not solved again.
+        Returns:
+            list[int]: The 81 values of the solution in row-major order, or None if the puzzle has no solution.
+        """
+        return self._cache.get_solution(self._get_givens())
+
+    def get_mistakes(self):
+        """ Get the cells of the board holding a number that differs from the solution.
+            Delegates the solving to the `get_solution` method.
+        Returns:
+            list[tuple[int, int]]: The (row, col) positions of the wrong numbers, or all the filled cells if the puzzle has no solution.
+        """
+        solution = self.get_solution()
+        mistakes = []
+        for index in range(81):
+            value = self._board.get_number(index // 9, index % 9)
+            if value and (solution is None or value != solution[index]):
+                mistakes.append((index // 9, index % 9))
+        return mistakes
+
+    def hint(self):
+        """ Get the next logical move on the current board.
+            The hint is computed in a background thread after each change of the board, so it is usually ready;
+            otherwise this waits for the thread, which is started on the first call. Wrong numbers of the player are ignored.
+        Returns:
+            tuple[int, int, int, str]: The row, the column and the number to place, and the hardest technique needed
+            ("solution" if the techniques of the `LogicSolver` class are not enough), or None if the board is complete
+            or the puzzle has no solution.
+        Raises:
+            Exception: The error raised by the background thread while computing the hint of the current board.
+        """
+        with self._hint_condition:
+            while self._hint is None or self._hint[0] != self._hint_version:
+                if self._hint_thread is None:
+                    self._hint_thread = threading.Thread(target=self._run_hints, name="hints", daemon=True)
+                    self._hint_thread.start()
+                self._hint_condition.wait()
+            hint = self._hint[1]
+        if isinstance(hint, Exception):
+            raise hint
+        return hint
+
+    def stop_hints(self):
+        """ Stop the background thread computing the hints. It is started again by the next call to `hint`. """
+        with self._hint_condition:
+            thread = self._hint_thread
+            self._hint_thread = None
+            self._hint_condition.notify_all()
+        if thread is not None:
+            thread.join()
+
+    def close(self):
+        """ Release the resources of the game, i.e. stop the background thread computing the hints.
+            The game can still be used afterwards.
+        """
+        self.stop_hints()
+
+    def start_game(self, puzzle_id=None):
         """ Start the Sudoku game by filling the board with a valid Sudoku puzzle.
             Delegates the filling of the board to the '_fill_board' method.
+        Args:
+            puzzle_id (str): The ID of the puzzle to play (see `get_puzzle_id`), which also sets the level of the game.
+                Defaults to None, which starts a new puzzle of the current level.
         Raises:
+            ValueError: If the puzzle ID is not valid.
             RuntimeError: If the board could not be initialized with a valid Sudoku puzzle.
         """
-        if not self._fill_board():
+        if not self._fill_board(puzzle_id):
             raise RuntimeError("Could not initialize the board with a valid Sudoku puzzle.")
         self._status = "in progress"
 
     def reset_game(self):
         """ Reset the game by clearing the board and reinitializing it with a new valid Sudoku puzzle.
+            The background thread computing the hints is stopped.
             Delegates the clearing of the board to the '_clear_board' method and the filling of the board to the '_fill_board' method.
         Raises:
             RuntimeError: If the board could not be reinitialized with a valid Sudoku puzzle.
@@ -118,27 +331,113 @@ class Game:
 
     # Functions to support the above methods
 
-    def _fill_board(self):
+    def _fill_board(self, puzzle_id=None):
         """ Fill the current board with a valid Sudoku puzzle.
+            Delegates the choice of the puzzle to the `PuzzlePool` or `PuzzleBank` class if the game has a source and no ID is given,
+            to the `PuzzleCatalog` class otherwise.
+        Args:
+            puzzle_id (str): The ID of the puzzle. Defaults to None, which picks a new puzzle of the current level.
         Returns:
             bool: True if the board was filled successfully, False if there was an error.
         Raises:
+            ValueError: If the puzzle ID is not valid.
             RuntimeError: If the board could not be filled with a valid Sudoku puzzle.
         """
-        pass
-        # This method should call the Board class's method to fill the board with a valid Sudoku puzzle.
+        if stats.enabled:
+            stats.count("game.puzzles")
+        start = time.perf_counter()
+        if puzzle_id is None and self._source is not None:
+            givens, solution, grade = self._source.get_puzzle(self._level)
+        else:
+            if puzzle_id is None:
+                puzzle_id = self._catalog.new_id(self._level)
+            givens, solution, grade = self._catalog.get_puzzle(puzzle_id)
+            self._level = parse_id(puzzle_id)[1]
+        board = Board.from_string("".join(map(str, givens)))  # One pass over the givens, which are all fixed
+        self._attach_board(board)
+        self._solution = solution
+        self._cache.put(givens, solution)
+        self._generation_time = time.perf_counter() - start
+        self._grade = grade
+        self._puzzle_id = puzzle_id
+        return True
+
+    def _attach_board(self, board):
+        """ Make a board the current board, moving the listener of the hints from the previous one
+            and stopping the background thread computing the hints of the previous board.
+        Args:
+            board (Board): The new board.
+        """
+        if self._board is not None:
+            self._board.remove_listener(self._on_board_change)
+        board.add_listener(self._on_board_change)
+        self._board = board
+        # Marking the hint as stale first makes a computation in progress give up, so that the thread stops quickly
+        self._on_board_change()
+        self.stop_hints()
+
+    def _on_board_change(self, *change):
+        """ Mark the hint as stale and wake up the thread computing the hints. Called by the board after each change. """
+        with self._hint_condition:
+            self._hint_version += 1
+            self._hint_condition.notify_all()
+
+    def _run_hints(self):
+        """ Loop of the background thread: compute the hint of each new version of the board, until `stop_hints` is called. """
+        current = threading.current_thread()
+        while True:
+            with self._hint_condition:
+                while self._hint_thread is current and self._hint is not None and self._hint[0] == self._hint_version:
+                    self._hint_condition.wait()
+                if self._hint_thread is not current:
+                    return
+                version = self._hint_version
+                # The board is copied under the lock, as the listener marks each change under it
+                board = self._board.copy()
+            try:
+                hint = self._compute_hint(board, version)
+            except Exception as error:  # Published as the hint, so that `hint` raises it instead of waiting forever
+                hint = error
+            self._publish_hint(version, hint)
+
+    def _publish_hint(self, version, hint):
+        """ Store a hint and wake up the callers of `hint` waiting for it, unless the board changed since its computation started.
+        Args:
+            version (int): The version of the board the hint was computed for.
+            hint (tuple | Exception): The hint, or the error raised while computing it.
+        """
+        with self._hint_condition:
+            if version == self._hint_version:
+                self._hint = (version, hint)
+                self._hint_condition.notify_all()
+
+    def _compute_hint(self, board, version):
+        """ Find the next logical move on a copy of the current board, giving up as soon as the board changes.
+            Delegates the search to the `find_hint` function.
+        Args:
+            board (Board): The copy of the board, which no other thread changes.
+            version (int): The version of the board when it was copied.
+        Returns:
+            tuple[int, int, int, str]: The hint (see `hint`), or None.
+        """
+        return find_hint(board, self._cache, lambda: self._hint_version != version)
+
+    def _get_givens(self):
+        """ Get the fixed numbers of the board.
+        Returns:
+            list[int]: The 81 values of the fixed cells in row-major order (0 for the other cells).
+        """
+        board = self._board
+        return [board.get_number(i, j) if board.is_fixed(i, j) else 0 for i in range(9) for j in range(9)]
 
     def _clear_board(self):
         """ Clear the current board by replacing it with a new empty board. """
-        self._board = Board()
+        self._attach_board(Board())
 
     def _is_board_valid(self):
-        """ Check if the current board is valid (i.e., follows Sudoku rules).
+        """ Check if the current board is complete and valid (i.e., follows Sudoku rules).
+            Delegates the check to the `Board` class, which keeps its filled and conflict counts up to date.
         Returns:
             bool: True if the board is valid, False otherwise.
         """
-        for i in range(9):
-            for j in range(9):
-                if not self._board.is_valid(i, j):
-                    return False
-        return True
\ No newline at end of file
+        return self._board.is_complete()
\ No newline at end of file
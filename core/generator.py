@@ -0,0 +1,344 @@
+""" Sudoku Generator Class
+This module is part of the core package of the Sudoku game.
+It defines the `Generator` class, which creates Sudoku puzzles with a unique solution for a given difficulty level.
+"""
+
+import random
+import time
+
+from core import stats
+from core.board import ALL_DIGITS, BOX_OF, COL_OF, DIGITS_OF_MASK, ROW_OF, UNITS_OF, get_geometry
+from core.logic import LEVEL_RATINGS, LogicSolver
+from core.solver import Solver
+from core.uniqueness import UniquenessChecker
+
+# Version of the generation algorithm, part of the puzzle IDs (see `core.catalog`).
+# Must be increased by any change making a seed produce another puzzle.
+GENERATOR_VERSION = 2
+# Maximum number of givens kept for each difficulty level.
+# Below this number, each puzzle is graded and givens are removed until it reaches the requested level.
+LEVEL_CLUES = {"easy": 36, "medium": 36, "hard": 34, "expert": 26}
+# Number of complete grids tried before returning a puzzle that did not reach the requested level,
+# and number of graded removal orders tried on each of them.
+MAX_ATTEMPTS = 20
+ORDERS_PER_GRID = 3
+# Number of removals undone in a row after which a removal order is given up.
+MAX_REJECTIONS = 6
+# Number of gradings allowed to each puzzle, across its grids and removal orders. When they are used up,
+# the last puzzle is returned even if it did not reach the requested level, which bounds the generation time.
+MAX_GRADINGS = 400
+# Share of the cells kept as givens for each level on boards other than 9x9, which are not graded.
+LEVEL_GIVENS = {"easy": 0.6, "medium": 0.55, "hard": 0.5, "expert": 0.45}
+# Search nodes allowed to each uniqueness check on these boards, per cell. A removal whose check gives up is undone,
+# so the solution stays unique and the time spent on 25x25 boards stays in seconds.
+CHECK_NODES_PER_CELL = 1
+
+class Generator:
+    """ Class generating Sudoku puzzles with a unique solution. """
+
+    def __init__(self, seed=None, box_size=3):
+        """ Initialize the generator with an optional seed for reproducible puzzles.
+        Args:
+            seed (int): The seed of the random number generator. Defaults to None, which uses a random seed.
+            box_size (int): The box size of the puzzles (2 to 5). Defaults to 3, for 9x9 puzzles.
+        Raises:
+            ValueError: If the box size is not supported.
+        """
+        self._random = random.Random(seed)
+        self._geometry = get_geometry(box_size)
+        self._solver = None  # Solver of the boards other than 9x9, built on first use
+        self._last_duration = 0.0
+        self._last_grade = None
+        self._gradings_left = 0  # Gradings left to the puzzle being generated (see `MAX_GRADINGS`)
+
+    # Methods to generate puzzles
+
+    def generate(self, level):
+        """ Generate a Sudoku puzzle for the given difficulty level.
+            A complete grid is built first, then givens are removed in random order as long as the solution stays unique,
+            down to `LEVEL_CLUES[level]` givens. More givens are then removed until the puzzle is graded at the requested level
+            by the `LogicSolver` class, trying several removal orders before starting again from a new grid.
+            Puzzles of other sizes are not graded: they keep `LEVEL_GIVENS[level]` of their cells (see `_generate_sized`).
+        Args:
+            level (str): The difficulty level of the puzzle. Valid levels are "easy", "medium", "hard", and "expert".
+        Returns:
+            tuple[list[int], list[int]]: The givens and the solution of the puzzle, as 81 values in row-major order (0 for empty cells)
+            on a 9x9 board.
+        Raises:
+            ValueError: If the level is not valid.
+        """
+        if level not in LEVEL_CLUES:
+            raise ValueError(f"Level must be one of {list(LEVEL_CLUES)}.")
+        start = time.perf_counter()
+        if self._geometry.size != 9:
+            givens, solution = self._generate_sized(level)
+            self._last_duration = time.perf_counter() - start
+            self._last_grade = None
+            return givens, solution
+        self._gradings_left = MAX_GRADINGS
+        for _ in range(MAX_ATTEMPTS):
+            with stats.timer("generator.fill_grid"):
+                solution = self._fill_grid()
+            with stats.timer("generator.remove_clues"):
+                start_givens = self._remove_clues(solution, LEVEL_CLUES[level])
+            unavoidable = _unavoidable_sets(solution)
+            for _ in range(ORDERS_PER_GRID):
+                with stats.timer("generator.remove_graded_clues"):
+                    givens, grade = self._remove_graded_clues(start_givens, solution, level, unavoidable)
+                if grade["level"] == level or not self._gradings_left:
+                    break
+            if grade["level"] == level or not self._gradings_left:
+                break
+        if grade["level"] != level:
+            grade = LogicSolver(givens).grade()
+        self._last_duration = time.perf_counter() - start
+        self._last_grade = grade
+        if stats.enabled:
+            stats.count(f"generator.puzzles.{level}")
+        return givens, solution
+
+    def get_last_duration(self):
+        """ Get the time spent generating the last puzzle.
+        Returns:
+            float: The duration of the last call to `generate`, in seconds.
+        """
+        return self._last_duration
+
+    def get_last_grade(self):
+        """ Get the grade of the last puzzle generated.
+            Delegates the grading to the `LogicSolver` class.
+        Returns:
+            dict: The grade of the last puzzle (see `LogicSolver.grade`), or None if no puzzle was generated or it is not 9x9.
+        """
+        return self._last_grade
+
+    def get_box_size(self):
+        """ Get the box size of the puzzles.
+        Returns:
+            int: The box size (3 for 9x9 puzzles).
+        """
+        return self._geometry.box_size
+
+    # Functions to support the above methods
+
+    def _generate_sized(self, level):
+        """ Generate a puzzle on a board other than 9x9.
+            The complete grid is a shuffled pattern grid, then givens are removed in random order as long as the solution stays unique,
+            down to `LEVEL_GIVENS[level]` of the cells. Each check is a bounded search of the `Solver` class.
+        Args:
+            level (str): The difficulty level of the puzzle.
+        Returns:
+            tuple[list[int], list[int]]: The givens and the solution of the puzzle in row-major order (0 for empty cells).
+        """
+        geometry = self._geometry
+        if self._solver is None:
+            self._solver = Solver(geometry.box_size)
+        with stats.timer("generator.fill_grid"):
+            solution = self._shuffled_grid()
+        givens = solution[:]
+        target = round(geometry.cells * LEVEL_GIVENS[level])
+        max_nodes = geometry.cells * CHECK_NODES_PER_CELL
+        order = list(range(geometry.cells))
+        self._random.shuffle(order)
+        remaining = geometry.cells
+        with stats.timer("generator.remove_clues"):
+            for index in order:
+                if remaining <= target:
+                    break
+                givens[index] = 0
+                if stats.enabled:
+                    stats.count("generator.uniqueness_checks")
+                if self._solver.count_values(givens, limit=2, max_nodes=max_nodes) == 1:
+                    remaining -= 1
+                else:
+                    givens[index] = solution[index]
+        if stats.enabled:
+            stats.count(f"generator.puzzles.{level}")
+        return givens, solution
+
+    def _shuffled_grid(self):
+        """ Build a random complete grid of any size in linear time, by shuffling a pattern grid.
+            The bands, the rows of each band, the stacks, the columns of each stack and the numbers are shuffled, which keeps the grid valid.
+        Returns:
+            list[int]: A complete and valid grid in row-major order.
+        """
+        box_size, size = self._geometry.box_size, self._geometry.size
+        shuffle = self._random.shuffle
+
+        def lines():
+            bands = list(range(box_size))
+            shuffle(bands)
+            order = []
+            for band in bands:
+                lines = [band * box_size + line for line in range(box_size)]
+                shuffle(lines)
+                order.extend(lines)
+            return order
+
+        rows, cols = lines(), lines()
+        numbers = list(range(1, size + 1))
+        shuffle(numbers)
+        return [numbers[(box_size * (row % box_size) + row // box_size + col) % size] for row in rows for col in cols]
+
+    def _fill_grid(self):
+        """ Build a random complete grid, always filling the empty cell with the fewest candidates first.
+        Returns:
+            list[int]: A complete and valid grid of 81 values in row-major order.
+        """
+        values = [0] * 81
+        rows, cols, boxes = [0] * 9, [0] * 9, [0] * 9
+        shuffle = self._random.shuffle
+
+        def fill():
+            index, candidates = _most_constrained_cell(values, rows, cols, boxes)
+            if index is None:
+                return True
+            digits = list(DIGITS_OF_MASK[candidates])
+            shuffle(digits)
+            row, col, box = ROW_OF[index], COL_OF[index], BOX_OF[index]
+            for digit in digits:
+                bit = 1 << digit
+                values[index] = digit
+                rows[row] |= bit
+                cols[col] |= bit
+                boxes[box] |= bit
+                if fill():
+                    return True
+                rows[row] ^= bit
+                cols[col] ^= bit
+                boxes[box] ^= bit
+            values[index] = 0
+            return False
+
+        fill()
+        return values
+
+    def _remove_clues(self, solution, target):
+        """ Remove givens from a complete grid in random order while the solution stays unique.
+            Delegates the checks to the `UniquenessChecker` class.
+        Args:
+            solution (list[int]): A complete and valid grid of 81 values.
+            target (int): The number of givens to stop at.
+        Returns:
+            list[int]: The givens of the puzzle, as 81 values (0 for empty cells).
+        """
+        checker = UniquenessChecker(solution, solution)
+        order = list(range(81))
+        self._random.shuffle(order)
+        for index in order:
+            if checker.get_given_count() <= target:
+                break
+            checker.remove(index)
+        return checker.get_givens()
+
+    def _remove_graded_clues(self, givens, solution, level, unavoidable):
+        """ Remove givens in random order, grading the puzzle after each removal, until it reaches the requested level.
+            A puzzle solved by logic has a unique solution. Removals making the puzzle harder than the level
+            (or its solution not unique) are undone. Removals emptying an unavoidable set are undone without grading,
+            and the removals stop when the gradings left to the puzzle are used up.
+        Args:
+            givens (list[int]): The givens of a puzzle with a unique solution, as 81 values (0 for empty cells).
+            solution (list[int]): The 81 values of its solution.
+            level (str): The difficulty level to reach.
+            unavoidable (list[int]): The unavoidable sets of the solution (see `_unavoidable_sets`).
+        Returns:
+            tuple[list[int], dict]: The givens of the new puzzle and its grade, which is below the level if it was not reached.
+        """
+        levels = list(LEVEL_RATINGS)
+        target = levels.index(level)
+        max_rating = LEVEL_RATINGS[level] if level != "expert" else None
+        grade = LogicSolver(givens).grade(max_rating)
+        if levels.index(grade["level"]) >= target:
+            return givens[:], grade
+        checker = UniquenessChecker(givens, solution)
+        present = sum(1 << index for index, digit in enumerate(givens) if digit)
+        order = [index for index, digit in enumerate(givens) if digit]
+        self._random.shuffle(order)
+        rejections = 0
+        for index in order:
+            if rejections >= MAX_REJECTIONS or not self._gradings_left:
+                break
+            present ^= 1 << index
+            if any(not cells & present for cells in unavoidable):
+                # The digits of an empty unavoidable set can be swapped: the solution is not unique, no need to grade
+                present ^= 1 << index
+                rejections += 1
+                continue
+            checker.clear(index)
+            if checker.is_forced(index):
+                # The removed given is deduced right away: same level as before, keep going
+                rejections = 0
+                continue
+            self._gradings_left -= 1
+            if stats.enabled:
+                stats.count("generator.gradings")
+            new_grade = LogicSolver(checker.get_givens()).grade(max_rating)
+            if new_grade["solved"]:
+                restore = False
+            elif level != "expert":
+                restore = True
+            else:
+                restore = checker.has_other_solution(index)
+            if restore:
+                checker.restore(index)
+                present ^= 1 << index
+                rejections += 1
+                continue
+            rejections = 0
+            grade = new_grade
+            if grade["level"] == level:
+                break
+        return checker.get_givens(), grade
+
+def _unavoidable_sets(solution):
+    """ Find the sets of cells of a complete grid whose two digits can be swapped, keeping the grid valid.
+        For each pair of digits, a cell holding one of them is linked to the cells holding the other in its row, column and box,
+        and each group of linked cells is such a set: the smallest ones are rectangles of four cells.
+        A puzzle keeping none of the cells of a set as givens has a second solution with the digits swapped.
+    Args:
+        solution (list[int]): A complete and valid grid of 81 values.
+    Returns:
+        list[int]: The bitmasks of the cells of each set (bit `index` set for each cell).
+    """
+    cell_of = [[0] * 27 for _ in range(10)]  # Cell holding each digit in each unit
+    for index, digit in enumerate(solution):
+        for unit in UNITS_OF[index]:
+            cell_of[digit][unit] = index
+    sets = []
+    for first in range(1, 10):
+        for second in range(first + 1, 10):
+            seen = 0
+            for start in cell_of[first][:9]:
+                if seen >> start & 1:
+                    continue
+                group, stack = 0, [start]
+                while stack:
+                    index = stack.pop()
+                    if group >> index & 1:
+                        continue
+                    group |= 1 << index
+                    other = cell_of[second if solution[index] == first else first]
+                    stack.extend(other[unit] for unit in UNITS_OF[index])
+                seen |= group
+                sets.append(group)
+    return sets
+
+def _most_constrained_cell(values, rows, cols, boxes):
+    """ Find the empty cell with the fewest candidates.
+    Args:
+        values (list[int]): The 81 values of the grid (0 for empty cells).
+        rows, cols, boxes (list[int]): The bitmasks of the digits used in each row, column and box.
+    Returns:
+        tuple[int, int]: The index of the cell and the bitmask of its candidates, or (None, 0) if the grid is full.
+    """
+    best, best_mask, best_count = None, 0, 10
+    for index in range(81):
+        if values[index]:
+            continue
+        mask = ~(rows[ROW_OF[index]] | cols[COL_OF[index]] | boxes[BOX_OF[index]]) & ALL_DIGITS
+        count = len(DIGITS_OF_MASK[mask])
+        if count < best_count:
+            best, best_mask, best_count = index, mask, count
+            if count <= 1:
+                break
+    return best, best_mask
@@ -0,0 +1,401 @@
+""" Sudoku Logic Solver Class
+This module is part of the core package of the Sudoku game.
+It defines the `LogicSolver` class, which solves a Sudoku board with human solving techniques
+and grades its difficulty from the hardest technique needed.
+"""
+
+from itertools import combinations
+
+from core import stats
+from core.board import ALL_DIGITS, BOX_OF, COL_OF, DIGITS_OF_MASK, PEERS, ROW_OF, UNITS, UNITS_OF, Board
+
+# Techniques in the order they are tried, with their difficulty rating.
+TECHNIQUES = {
+    "naked single": 1.0,
+    "hidden single": 1.2,
+    "pointing": 2.0,
+    "claiming": 2.2,
+    "naked pair": 3.0,
+    "hidden pair": 3.2,
+    "x-wing": 3.4,
+    "naked triple": 3.6,
+    "hidden triple": 3.8,
+    "xy-wing": 4.0,
+    "swordfish": 4.2,
+}
+# Rating given to a puzzle that cannot be solved with the techniques above.
+UNSOLVED_RATING = 5.0
+# Highest rating of each difficulty level, in increasing order.
+LEVEL_RATINGS = {"easy": 1.2, "medium": 2.2, "hard": 4.2, "expert": UNSOLVED_RATING}
+
+class LogicSolver:
+    """ Class solving a Sudoku board step by step with human techniques, keeping the candidates of each cell. """
+
+    def __init__(self, board):
+        """ Initialize the solver with the content of a board and compute the candidates of the empty cells.
+        Args:
+            board (Board | list[int]): The board to solve, or its 81 values in row-major order (0 for empty cells).
+        Raises:
+            TypeError: If the board is neither a Board instance nor a list of values.
+            ValueError: If a list of values does not contain 81 values, or the board is not 9x9.
+        """
+        if isinstance(board, Board):
+            if board.get_size() != 9:
+                raise ValueError("Board must be a 9x9 board.")
+            values = [board.get_number(index // 9, index % 9) for index in range(81)]
+        elif isinstance(board, list):
+            if len(board) != 81:
+                raise ValueError("Grid must contain 81 values.")
+            values = board[:]
+        else:
+            raise TypeError("Board must be an instance of the Board class or a list of 81 values.")
+        used = [0] * 27
+        for index, value in enumerate(values):
+            if value:
+                for unit in UNITS_OF[index]:
+                    used[unit] |= 1 << value
+        self._values = values
+        self._candidates = [
+            0 if value else ~(used[ROW_OF[index]] | used[9 + COL_OF[index]] | used[18 + BOX_OF[index]]) & ALL_DIGITS
+            for index, value in enumerate(values)
+        ]
+        self._techniques = {}
+
+    # Methods to solve the board
+
+    def step(self, max_rating=None):
+        """ Apply the easiest technique that makes progress.
+        Args:
+            max_rating (float): The rating of the hardest technique to try. Defaults to None, which tries every technique.
+        Returns:
+            tuple[str, list[tuple[int, int]], list[tuple[int, int]]]: The name of the technique, the placed (cell, digit) pairs
+            and the eliminated (cell, digit) candidates, or None if the board is solved or no technique applies.
+        """
+        if self.is_solved():
+            return None
+        if stats.enabled:
+            stats.count("logic.steps")
+        for name, technique in (
+            ("naked single", self._naked_single),
+            ("hidden single", self._hidden_single),
+            ("pointing", self._pointing),
+            ("claiming", self._claiming),
+            ("naked pair", lambda: self._naked_subset(2)),
+            ("hidden pair", lambda: self._hidden_subset(2)),
+            ("x-wing", lambda: self._fish(2)),
+            ("naked triple", lambda: self._naked_subset(3)),
+            ("hidden triple", lambda: self._hidden_subset(3)),
+            ("xy-wing", self._xy_wing),
+            ("swordfish", lambda: self._fish(3)),
+        ):
+            if max_rating is not None and TECHNIQUES[name] > max_rating:
+                break
+            placements, eliminations = technique()
+            if placements or eliminations:
+                for index, digit in placements:
+                    self._place(index, digit)
+                for index, digit in eliminations:
+                    self._candidates[index] &= ~(1 << digit)
+                self._techniques[name] = self._techniques.get(name, 0) + 1
+                return name, placements, eliminations
+        return None
+
+    def solve(self, max_rating=None):
+        """ Apply techniques until the board is solved or no technique applies.
+            Every deduction is sound, so a board solved this way has a unique solution.
+        Args:
+            max_rating (float): The rating of the hardest technique to try. Defaults to None, which tries every technique.
+        Returns:
+            bool: True if the board was solved, False otherwise.
+        """
+        while True:
+            self._fill_singles(max_rating)
+            if self.step(max_rating) is None:
+                return self.is_solved()
+
+    def grade(self, max_rating=None):
+        """ Solve the board and grade its difficulty from the hardest technique needed.
+        Args:
+            max_rating (float): The rating of the hardest technique to try. Defaults to None, which tries every technique.
+                A board that cannot be solved with these techniques is rated `UNSOLVED_RATING`.
+        Returns:
+            dict: The "level" (str), "rating" (float), "techniques" (dict of technique name to number of uses) and "solved" (bool).
+        """
+        solved = self.solve(max_rating)
+        rating = self.get_rating()
+        level = next(level for level, highest in LEVEL_RATINGS.items() if rating <= highest)
+        return {"level": level, "rating": rating, "techniques": dict(self._techniques), "solved": solved}
+
+    def get_values(self):
+        """ Get the current values of the board.
+        Returns:
+            list[int]: The 81 values in row-major order (0 for empty cells).
+        """
+        return self._values[:]
+
+    def get_candidates(self, index):
+        """ Get the candidates left in a cell.
+        Args:
+            index (int): The index of the cell (row * 9 + col).
+        Returns:
+            list[int]: The digits that can still be placed in the cell, empty if the cell is filled.
+        """
+        return list(DIGITS_OF_MASK[self._candidates[index]])
+
+    def get_techniques(self):
+        """ Get the techniques used so far.
+        Returns:
+            dict: The number of times each technique was applied.
+        """
+        return dict(self._techniques)
+
+    def get_rating(self):
+        """ Get the rating of the techniques used so far.
+        Returns:
+            float: The rating of the hardest technique used, or `UNSOLVED_RATING` if the board is not solved.
+        """
+        if not self.is_solved():
+            return UNSOLVED_RATING
+        return max((TECHNIQUES[name] for name in self._techniques), default=0.0)
+
+    def is_solved(self):
+        """ Check if every cell of the board is filled.
+        Returns:
+            bool: True if the board is solved, False otherwise.
+        """
+        return 0 not in self._values
+
+    def is_broken(self):
+        """ Check if an empty cell has no candidate left, meaning the board has no solution.
+        Returns:
+            bool: True if the board cannot be solved, False otherwise.
+        """
+        return any(not value and not candidates for value, candidates in zip(self._values, self._candidates))
+
+    # Functions to support the above methods
+
+    def _place(self, index, digit):
+        """ Place a digit in a cell and remove it from the candidates of its peers. """
+        self._values[index] = digit
+        self._candidates[index] = 0
+        candidates = self._candidates
+        bit = ~(1 << digit)
+        for peer in PEERS[index]:
+            candidates[peer] &= bit
+
+    def _fill_singles(self, max_rating):
+        """ Place naked and hidden singles in bulk until none is left, recording them like single steps.
+            Cells whose candidates drop to one are queued when a digit is placed, instead of scanning the grid again.
+            Stops early if a cell runs out of candidates.
+        Args:
+            max_rating (float): The rating of the hardest technique to try, or None to allow every technique.
+        """
+        if stats.enabled:
+            stats.count("logic.propagations")
+        values, candidates, techniques = self._values, self._candidates, self._techniques
+        hidden = max_rating is None or TECHNIQUES["hidden single"] <= max_rating
+        queue = [index for index, mask in enumerate(candidates) if mask and not mask & (mask - 1)]
+
+        def place(index, digit):
+            values[index] = digit
+            candidates[index] = 0
+            for peer in PEERS[index]:
+                mask = candidates[peer]
+                if mask >> digit & 1:
+                    mask &= ~(1 << digit)
+                    candidates[peer] = mask
+                    if not mask & (mask - 1):
+                        queue.append(peer)
+
+        while True:
+            while queue:
+                index = queue.pop()
+                mask = candidates[index]
+                if not mask:
+                    if not values[index]:
+                        return
+                    continue
+                place(index, DIGITS_OF_MASK[mask][0])
+                techniques["naked single"] = techniques.get("naked single", 0) + 1
+            if not hidden:
+                return
+            progress = False
+            for unit in UNITS:
+                once, twice = 0, 0
+                for index in unit:
+                    twice |= once & candidates[index]
+                    once |= candidates[index]
+                for digit in DIGITS_OF_MASK[once & ~twice]:
+                    index = next((index for index in unit if candidates[index] >> digit & 1), None)
+                    if index is not None:
+                        place(index, digit)
+                        techniques["hidden single"] = techniques.get("hidden single", 0) + 1
+                        progress = True
+            if not progress:
+                return
+
+    def _naked_single(self):
+        """ Find the cells with a single candidate. """
+        for index, mask in enumerate(self._candidates):
+            if mask and not mask & (mask - 1):
+                return [(index, DIGITS_OF_MASK[mask][0])], []
+        return [], []
+
+    def _hidden_single(self):
+        """ Find the digits that fit in a single cell of a unit. """
+        candidates = self._candidates
+        for unit in UNITS:
+            once, twice = 0, 0
+            for index in unit:
+                twice |= once & candidates[index]
+                once |= candidates[index]
+            singles = once & ~twice
+            if singles:
+                digit = DIGITS_OF_MASK[singles][0]
+                index = next(index for index in unit if candidates[index] >> digit & 1)
+                return [(index, digit)], []
+        return [], []
+
+    def _pointing(self):
+        """ Find the digits confined to one row or column inside a box, and remove them from the rest of that line. """
+        return self._intersections(_POINTING_GROUPS)
+
+    def _claiming(self):
+        """ Find the digits confined to one box inside a row or column, and remove them from the rest of that box. """
+        return self._intersections(_CLAIMING_GROUPS)
+
+    def _intersections(self, groups):
+        """ Remove the digits confined to the intersection of two units from the rest of the second unit.
+        Args:
+            groups (tuple): For each unit, the three (inside, outside) cell groups it shares with three other units.
+        """
+        candidates = self._candidates
+        for parts in groups:
+            unions = [_union(candidates, inside) for inside, _ in parts]
+            for k, (_, outside) in enumerate(parts):
+                confined = unions[k] & ~(unions[k - 1] | unions[k - 2])
+                if not confined:
+                    continue
+                eliminations = [(index, digit) for index in outside for digit in DIGITS_OF_MASK[candidates[index] & confined]]
+                if eliminations:
+                    return [], eliminations
+        return [], []
+
+    def _naked_subset(self, size):
+        """ Find `size` cells of a unit holding only `size` candidates, and remove them from the other cells of the unit. """
+        candidates = self._candidates
+        for unit in UNITS:
+            cells = [index for index in unit if candidates[index] and len(DIGITS_OF_MASK[candidates[index]]) <= size]
+            for subset in combinations(cells, size):
+                mask = _union(candidates, subset)
+                if len(DIGITS_OF_MASK[mask]) != size:
+                    continue
+                eliminations = [
+                    (index, digit) for index in unit if index not in subset
+                    for digit in DIGITS_OF_MASK[candidates[index] & mask]
+                ]
+                if eliminations:
+                    return [], eliminations
+        return [], []
+
+    def _hidden_subset(self, size):
+        """ Find `size` digits confined to `size` cells of a unit, and remove the other candidates of these cells. """
+        candidates = self._candidates
+        for unit in UNITS:
+            positions = [0] * 10
+            for k, index in enumerate(unit):
+                for digit in DIGITS_OF_MASK[candidates[index]]:
+                    positions[digit] |= 1 << k
+            digits = [digit for digit in range(1, 10) if 2 <= positions[digit].bit_count() <= size]
+            for subset in combinations(digits, size):
+                cells = 0
+                for digit in subset:
+                    cells |= positions[digit]
+                if cells.bit_count() != size:
+                    continue
+                keep = sum(1 << digit for digit in subset)
+                eliminations = [
+                    (unit[k], digit) for k in range(9) if cells >> k & 1
+                    for digit in DIGITS_OF_MASK[candidates[unit[k]] & ~keep]
+                ]
+                if eliminations:
+                    return [], eliminations
+        return [], []
+
+    def _fish(self, size):
+        """ Find a digit confined to `size` columns in `size` rows (or the reverse), and remove it from the rest of these columns. """
+        candidates = self._candidates
+        in_rows = [[0] * 9 for _ in range(10)]
+        in_cols = [[0] * 9 for _ in range(10)]
+        for index, mask in enumerate(candidates):
+            row, col = ROW_OF[index], COL_OF[index]
+            for digit in DIGITS_OF_MASK[mask]:
+                in_rows[digit][row] |= 1 << col
+                in_cols[digit][col] |= 1 << row
+        for digit in range(1, 10):
+            for lines, cover in ((in_rows[digit], 9), (in_cols[digit], 0)):
+                bases = [line for line in range(9) if 2 <= lines[line].bit_count() <= size]
+                for subset in combinations(bases, size):
+                    positions = 0
+                    for line in subset:
+                        positions |= lines[line]
+                    if positions.bit_count() != size:
+                        continue
+                    skip = sum(1 << line for line in subset)
+                    eliminations = [
+                        (UNITS[cover + position][k], digit) for position in range(9) if positions >> position & 1
+                        for k in range(9) if lines[k] >> position & 1 and not skip >> k & 1
+                    ]
+                    if eliminations:
+                        return [], eliminations
+        return [], []
+
+    def _xy_wing(self):
+        """ Find a pivot cell XY seeing two cells XZ and YZ, and remove Z from the cells seeing both of them. """
+        candidates = self._candidates
+        pairs = [index for index, mask in enumerate(candidates) if mask and len(DIGITS_OF_MASK[mask]) == 2]
+        for pivot in pairs:
+            pivot_mask = candidates[pivot]
+            wings = [index for index in PEERS[pivot] if candidates[index] in _BIVALUE and candidates[index] != pivot_mask and candidates[index] & pivot_mask]
+            for first, second in combinations(wings, 2):
+                mask = candidates[first] ^ candidates[second]
+                if mask != pivot_mask or not candidates[first] & candidates[second] & ~pivot_mask:
+                    continue
+                bit = candidates[first] & candidates[second]
+                digit = DIGITS_OF_MASK[bit][0]
+                eliminations = [
+                    (index, digit) for index in set(PEERS[first]) & set(PEERS[second])
+                    if index != pivot and candidates[index] & bit
+                ]
+                if eliminations:
+                    return [], eliminations
+        return [], []
+
+# Bitmasks with exactly two candidates.
+_BIVALUE = frozenset(mask for mask in range(1 << 10) if mask & ALL_DIGITS == mask and len(DIGITS_OF_MASK[mask]) == 2)
+
+def _union(candidates, cells):
+    """ Get the union of the candidates of some cells as a bitmask. """
+    mask = 0
+    for index in cells:
+        mask |= candidates[index]
+    return mask
+
+def _intersection_groups(unit, others):
+    """ Split a unit into its three intersections with other units, each with the cells of the other unit outside `unit`. """
+    return tuple(
+        (tuple(index for index in UNITS[other] if index in unit), tuple(index for index in UNITS[other] if index not in unit))
+        for other in others
+    )
+
+# For each box, its intersections with its three rows and with its three columns.
+_POINTING_GROUPS = tuple(
+    _intersection_groups(UNITS[18 + box], lines)
+    for box in range(9)
+    for lines in ((box // 3 * 3, box // 3 * 3 + 1, box // 3 * 3 + 2), (9 + box % 3 * 3, 10 + box % 3 * 3, 11 + box % 3 * 3))
+)
+# For each row and column, its intersections with the three boxes it crosses.
+_CLAIMING_GROUPS = tuple(
+    _intersection_groups(UNITS[line], tuple(sorted({18 + BOX_OF[index] for index in UNITS[line]})))
+    for line in range(18)
+)
@@ -6,13 +6,16 @@ It defines the `Number` class, which represents a number in a Sudoku cell and pr
 class Number:
     """ Class to represent a number with a value and a flag indicating if it is fixed. """
 
-    def __init__(self, value=0, fixed=False):
+    __slots__ = ("_value", "_fixed", "_max_value")
+
+    def __init__(self, value=0, fixed=False, max_value=9):
         """ Initialize the number with a value and a flag indicating if it is fixed.
         Args:
-            value (int): The value of the number (1-9). Default is 0, which represents an empty cell.
+            value (int): The value of the number (1 to `max_value`). Default is 0, which represents an empty cell.
             fixed (bool): Whether the number is fixed (cannot be changed).
+            max_value (int): The highest number of the board, e.g. 16 on a 16x16 board. Defaults to 9.
         Raises:
-            ValueError: If the value is not between 0 and 9.
+            ValueError: If the value is not between 0 and `max_value`.
             TypeError: If the value is not of the expected type (int) or if fixed is not a boolean.
             PermissionError: If the number is initialized with a value of 0 and fixed is True.
         """
@@ -23,9 +26,10 @@ class Number:
         
         self._value = value
         self._fixed = fixed
+        self._max_value = max_value
 
         if not self._is_valid():
-            raise ValueError("Value must be between 0 and 9.")
+            raise ValueError(f"Value must be between 0 and {max_value}.")
         if self._value == 0 and self._fixed:
             raise PermissionError("Cannot initialize a fixed number with value 0 (empty cell).")
 
@@ -49,17 +53,13 @@ class Number:
     def set_value(self, value):
         """ Set the value of the number.
         Args:
-            value (int): The new value of the number (1-9). 0 represents an empty cell.
+            value (int): The new value of the number (1 to `max_value`). 0 represents an empty cell.
         Raises:
-            ValueError: If the value is not between 0 and 9.
+            ValueError: If the value is not between 0 and `max_value`.
             TypeError: If the value is not of the expected type (int).
             PermissionError: If the number is fixed and cannot be changed.
         """
-        if not isinstance(value, int):
-            raise TypeError("Value must be an integer.")
-        if not (0 <= value <= 9):
-            raise ValueError("Value must be between 0 and 9.")
-        
+        Number.check_value(value, self._max_value)
         if self.is_fixed():
             raise PermissionError("Cannot change a fixed number.")
         
@@ -94,11 +94,27 @@ class Number:
         
         self._fixed = True
 
+    @staticmethod
+    def check_value(value, max_value=9):
+        """ Check that a value can be stored in a Sudoku cell.
+            Used by the `Board` class, which stores its cells without creating Number instances.
+        Args:
+            value (int): The value to check (0 to `max_value`). 0 represents an empty cell.
+            max_value (int): The highest number of the board, its number of rows. Defaults to 9.
+        Raises:
+            ValueError: If the value is not between 0 and `max_value`.
+            TypeError: If the value is not of the expected type (int).
+        """
+        if not isinstance(value, int):
+            raise TypeError("Value must be an integer.")
+        if not (0 <= value <= max_value):
+            raise ValueError(f"Value must be between 0 and {max_value}.")
+
     # Methods to support the above methods
 
     def _is_valid(self):
-        """ Check if the number is valid (value is between 0 and 9).
+        """ Check if the number is valid (value is between 0 and `max_value`).
         Returns:
             bool: True if the number is valid, False otherwise.
         """
-        return 0 <= self._value <= 9
\ No newline at end of file
+        return 0 <= self._value <= self._max_value
\ No newline at end of file
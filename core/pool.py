@@ -0,0 +1,223 @@
+""" Sudoku Puzzle Pool Class
+This module is part of the core package of the Sudoku game.
+It defines the `PuzzlePool` class, which keeps puzzles of each difficulty level ready to be played.
+The pool is refilled by a background thread up to a watermark and can be saved to disk across restarts.
+"""
+
+import json
+import os
+import threading
+from collections import deque
+
+from core.generator import LEVEL_CLUES, Generator
+
+DEFAULT_WATERMARK = 8
+
+class PuzzlePool:
+    """ Class keeping a pool of generated puzzles for each difficulty level. """
+
+    def __init__(self, watermark=DEFAULT_WATERMARK, path=None, seed=None):
+        """ Initialize the pool, loading the puzzles saved at `path` if the file exists.
+        Args:
+            watermark (int): The number of puzzles kept ready for each level. Defaults to `DEFAULT_WATERMARK`.
+            path (str): The JSON file where the pool is saved. Defaults to None, which keeps the pool in memory only.
+            seed (int): The seed of the generator refilling the pool. Defaults to None, which uses a random seed.
+        Raises:
+            ValueError: If the watermark is not a positive integer.
+        """
+        if not isinstance(watermark, int) or watermark < 1:
+            raise ValueError("Watermark must be a positive integer.")
+        self._watermark = watermark
+        self._path = path
+        self._generator = Generator(seed)
+        self._generator_lock = threading.Lock()
+        self._puzzles = {level: deque() for level in LEVEL_CLUES}
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+        self._changed = False
+        if path is not None:
+            self._load()
+
+    # Methods to manage the pool
+
+    def start(self):
+        """ Start refilling the pool in a background thread. Does nothing if the thread is already running. """
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._refill, name="puzzle-pool", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """ Stop the background thread, waiting for the puzzle being generated, and save the pool. """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.save()
+
+    def fill(self, level=None):
+        """ Generate puzzles in the calling thread until the pool reaches its watermark.
+        Args:
+            level (str): The level to fill. Defaults to None, which fills every level.
+        Raises:
+            ValueError: If the level is not valid.
+        """
+        levels = [self._check_level(level)] if level is not None else list(self._puzzles)
+        for level in levels:
+            while self.get_size(level) < self._watermark:
+                self._add(level, self._generate(level))
+
+    def get_puzzle(self, level):
+        """ Take a ready puzzle of the given level from the pool, or generate one if the pool is empty for this level.
+        Args:
+            level (str): The difficulty level of the puzzle.
+        Returns:
+            tuple[list[int], list[int], dict]: The givens, the solution and the grade of the puzzle (see `Generator.generate`).
+        Raises:
+            ValueError: If the level is not valid.
+        """
+        self._check_level(level)
+        with self._condition:
+            if self._puzzles[level]:
+                puzzle = self._puzzles[level].popleft()
+                self._changed = True
+                self._condition.notify_all()
+                return puzzle
+        return self._generate(level)
+
+    def get_size(self, level):
+        """ Get the number of ready puzzles of a level.
+        Args:
+            level (str): The difficulty level.
+        Returns:
+            int: The number of puzzles in the pool for this level.
+        Raises:
+            ValueError: If the level is not valid.
+        """
+        self._check_level(level)
+        with self._condition:
+            return len(self._puzzles[level])
+
+    def get_watermark(self):
+        """ Get the number of puzzles kept ready for each level.
+        Returns:
+            int: The watermark of the pool.
+        """
+        return self._watermark
+
+    def save(self):
+        """ Save the pool to its file, replacing it atomically. Does nothing if the pool has no file. """
+        with self._condition:
+            self._changed = False
+            if self._path is None:
+                return
+            data = {level: list(puzzles) for level, puzzles in self._puzzles.items()}
+        temporary = f"{self._path}.tmp"
+        with open(temporary, "w") as file:
+            json.dump(data, file)
+        os.replace(temporary, self._path)
+
+    # Functions to support the above methods
+
+    def _check_level(self, level):
+        """ Check if a level is valid.
+        Args:
+            level (str): The level to check.
+        Returns:
+            str: The level.
+        Raises:
+            ValueError: If the level is not valid.
+        """
+        if level not in self._puzzles:
+            raise ValueError(f"Level must be one of {list(self._puzzles)}.")
+        return level
+
+    def _generate(self, level):
+        """ Generate a puzzle of the given level.
+            The generator is shared with the background thread, so calls are serialized.
+        Args:
+            level (str): The difficulty level of the puzzle.
+        Returns:
+            tuple[list[int], list[int], dict]: The givens, the solution and the grade of the puzzle.
+        """
+        with self._generator_lock:
+            givens, solution = self._generator.generate(level)
+            return givens, solution, self._generator.get_last_grade()
+
+    def _add(self, level, puzzle):
+        """ Add a puzzle to the pool, unless the level already reached the watermark.
+        Args:
+            level (str): The difficulty level of the puzzle.
+            puzzle (tuple): The givens, the solution and the grade of the puzzle.
+        """
+        with self._condition:
+            if len(self._puzzles[level]) < self._watermark:
+                self._puzzles[level].append(puzzle)
+                self._changed = True
+
+    def _refill(self):
+        """ Loop of the background thread: generate a puzzle for the emptiest level below the watermark,
+            or save the pool and wait for a puzzle to be taken once every level is full.
+        """
+        while True:
+            with self._condition:
+                while self._running and self._next_level() is None and not self._changed:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                level = self._next_level()
+            if level is None:
+                self.save()
+            else:
+                self._add(level, self._generate(level))
+
+    def _next_level(self):
+        """ Find the level with the fewest ready puzzles, if it is below the watermark. Must be called with the condition held.
+        Returns:
+            str: The level to refill, or None if every level reached the watermark.
+        """
+        level = min(self._puzzles, key=lambda level: len(self._puzzles[level]))
+        return level if len(self._puzzles[level]) < self._watermark else None
+
+    def _load(self):
+        """ Load the puzzles saved in the file of the pool, ignoring a missing, unreadable or malformed file.
+            Either every puzzle of the file is loaded, or none of them is.
+        """
+        try:
+            with open(self._path, "r") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict):
+            return
+        loaded = {}
+        for level, puzzles in data.items():
+            if level not in self._puzzles:
+                continue
+            if not isinstance(puzzles, list) or not all(_is_valid_entry(entry) for entry in puzzles):
+                return
+            loaded[level] = [tuple(entry) for entry in puzzles[:self._watermark]]
+        for level, puzzles in loaded.items():
+            self._puzzles[level].extend(puzzles)
+
+# Functions to support the above methods
+
+def _is_valid_entry(entry):
+    """ Check if an entry of a saved pool holds a puzzle.
+    Args:
+        entry (object): The entry read from the JSON file.
+    Returns:
+        bool: True if the entry holds 81 givens from 0 to 9, 81 solution values from 1 to 9 and a grade, False otherwise.
+    """
+    if not isinstance(entry, list) or len(entry) != 3:
+        return False
+    givens, solution, grade = entry
+    return (isinstance(givens, list) and len(givens) == 81 and all(type(value) is int and 0 <= value <= 9 for value in givens)
+            and isinstance(solution, list) and len(solution) == 81
+            and all(type(value) is int and 1 <= value <= 9 for value in solution)
+            and isinstance(grade, dict))
@@ -0,0 +1,85 @@
+""" Sudoku Sharding Module
+This module is part of the core package of the Sudoku game.
+It generates batches of puzzles over a pool of processes. Each puzzle of a batch has an index, and its generator is seeded
+from the seed of the batch and this index only, so the same puzzles come out whatever the number of workers,
+and a batch can be split across machines by giving each of them a range of indices (a shard).
+"""
+
+import hashlib
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from core.generator import LEVEL_CLUES, Generator
+
+# Number of puzzles sent to the pool for each worker before waiting for a result,
+# which bounds the memory used by large batches.
+PUZZLES_PER_WORKER = 4
+
+def puzzle_seed(seed, index):
+    """ Get the seed of the generator of a puzzle of a batch.
+        The seed is derived with BLAKE2b, so it is the same on every run and platform.
+    Args:
+        seed (int): The seed of the batch.
+        index (int): The index of the puzzle in the batch.
+    Returns:
+        int: The 64-bit seed of the generator of the puzzle.
+    """
+    digest = hashlib.blake2b(f"{seed}:{index}".encode("ascii"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+def generate_shard(level, count, seed=0, start=0, workers=None, box_size=3):
+    """ Generate the puzzles `start` to `start + count - 1` of a batch, yielding each of them as soon as it is ready.
+        Puzzles come back in completion order, each with its index, so callers needing the input order sort on it.
+    Args:
+        level (str): The difficulty level of the puzzles.
+        count (int): The number of puzzles of the shard.
+        seed (int): The seed of the batch. Defaults to 0.
+        start (int): The index of the first puzzle of the shard. Defaults to 0.
+        workers (int): The number of processes. Defaults to None, which uses one process per CPU.
+            With a single worker, the puzzles are generated in the current process, in index order.
+        box_size (int): The box size of the puzzles (2 to 5). Defaults to 3, for 9x9 puzzles.
+    Yields:
+        tuple[int, list[int], list[int], dict]: The index, the givens, the solution and the grade of each puzzle
+        (see `Generator.generate`).
+    Raises:
+        ValueError: If the level is not valid, or the count, start or number of workers is out of range.
+    """
+    if level not in LEVEL_CLUES:
+        raise ValueError(f"Level must be one of {list(LEVEL_CLUES)}.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if count < 0 or start < 0 or workers < 1:
+        raise ValueError("Count and start must not be negative, and workers must be positive.")
+    indices = range(start, start + count)
+    if workers == 1:
+        for index in indices:
+            yield _generate_puzzle(level, seed, index, box_size)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for index in indices:
+            pending.add(pool.submit(_generate_puzzle, level, seed, index, box_size))
+            if len(pending) >= workers * PUZZLES_PER_WORKER:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+# Functions to support the above methods
+
+def _generate_puzzle(level, seed, index, box_size):
+    """ Generate a puzzle of a batch in the current process.
+    Args:
+        level (str): The difficulty level of the puzzle.
+        seed (int): The seed of the batch.
+        index (int): The index of the puzzle in the batch.
+        box_size (int): The box size of the puzzle.
+    Returns:
+        tuple[int, list[int], list[int], dict]: The index, the givens, the solution and the grade of the puzzle.
+    """
+    generator = Generator(puzzle_seed(seed, index), box_size)
+    givens, solution = generator.generate(level)
+    return index, givens, solution, generator.get_last_grade()
@@ -0,0 +1,294 @@
+""" Sudoku Solver Class
+This module is part of the core package of the Sudoku game.
+It defines the `Solver` class, which solves a Sudoku board with Knuth's Algorithm X using Dancing Links (DLX).
+The puzzle is encoded as an exact cover problem of up to 729 candidate rows (cell, digit) over 324 constraint columns on a 9x9 board:
+each cell holds one digit, and each row, column and box holds each digit once.
+Larger boards (up to 25x25) use the same encoding with size³ rows over 4 x size² columns.
+Each search builds the matrix of the candidates left by the givens only, instead of covering the givens in the full matrix,
+which keeps the cost of a search on a nearly complete 25x25 board proportional to its empty cells.
+"""
+
+from core import stats
+from core.board import Board, get_geometry
+
+class Solver:
+    """ Class solving Sudoku boards of one size with Dancing Links. The givens of the board are never modified. """
+
+    def __init__(self, box_size=3):
+        """ Initialize the solver for the boards of a size.
+        Args:
+            box_size (int): The box size of the boards to solve (2 to 5). Defaults to 3, for 9x9 boards.
+        Raises:
+            ValueError: If the box size is not supported.
+        """
+        self._geometry = get_geometry(box_size)
+
+    # Methods to solve a board
+
+    def solve(self, board):
+        """ Find the first solution of a board.
+        Args:
+            board (Board): The board to solve.
+        Returns:
+            Board: A new board holding the solution, with the same fixed cells, or None if the board has no solution.
+        Raises:
+            TypeError: If the board is not an instance of the Board class.
+        """
+        solutions = self.solve_all(board, limit=1)
+        return solutions[0] if solutions else None
+
+    def solve_all(self, board, limit=None):
+        """ Find all the solutions of a board, up to an optional limit.
+        Args:
+            board (Board): The board to solve.
+            limit (int): The maximum number of solutions to return. Defaults to None, which returns all the solutions.
+        Returns:
+            list[Board]: New boards holding the solutions, with the same fixed cells as the given board.
+        Raises:
+            TypeError: If the board is not an instance of the Board class.
+            ValueError: If the board is not of the size of the solver.
+        """
+        solutions = []
+        size = self._geometry.size
+        for values in self.solve_values(self._get_values(board), limit):
+            solution = board.copy()
+            for index, value in enumerate(values):
+                if not solution.get_number(index // size, index % size):
+                    solution.set_number(index // size, index % size, value)
+            solutions.append(solution)
+        return solutions
+
+    def count_solutions(self, board, limit=None):
+        """ Count the solutions of a board, up to an optional limit.
+        Args:
+            board (Board): The board to solve.
+            limit (int): The number of solutions at which to stop counting. Defaults to None, which counts all the solutions.
+        Returns:
+            int: The number of solutions, capped at `limit`.
+        Raises:
+            TypeError: If the board is not an instance of the Board class.
+            ValueError: If the board is not of the size of the solver.
+        """
+        return sum(1 for _ in self.solve_values(self._get_values(board), limit))
+
+    def solve_values(self, values, limit=None):
+        """ Iterate over the solutions of a grid given as a flat list of values.
+        Args:
+            values (list[int]): The values of the grid in row-major order (0 for empty cells), 81 on a 9x9 board.
+            limit (int): The maximum number of solutions to produce. Defaults to None, which produces all the solutions.
+        Yields:
+            list[int]: The values of each solution.
+        Raises:
+            ValueError: If the grid does not contain one value per cell.
+        """
+        yield from self._solve(values, limit, None)
+
+    def count_values(self, values, limit=None, max_nodes=None):
+        """ Count the solutions of a grid given as a flat list of values, giving up after a number of search nodes.
+            Bounding the search keeps the checks of large boards practical, where a single search can take hours.
+        Args:
+            values (list[int]): The values of the grid in row-major order (0 for empty cells), 81 on a 9x9 board.
+            limit (int): The number of solutions at which to stop counting. Defaults to None, which counts all the solutions.
+            max_nodes (int): The number of search nodes after which to give up. Defaults to None, which never gives up.
+        Returns:
+            int: The number of solutions, capped at `limit`, or None if the search gave up before finishing.
+        Raises:
+            ValueError: If the grid does not contain one value per cell.
+        """
+        budget = [max_nodes] if max_nodes is not None else None
+        count = sum(1 for _ in self._solve(values, limit, budget))
+        if budget is not None and budget[0] < 0 and count != limit:
+            return None
+        return count
+
+    # Functions to support the above methods
+
+    def _solve(self, values, limit, budget):
+        """ Iterate over the solutions of a grid given as a flat list of values.
+        Args:
+            values (list[int]): The values of the grid in row-major order (0 for empty cells).
+            limit (int): The maximum number of solutions to produce, or None.
+            budget (list[int]): The number of search nodes left, decremented by the search, or None for no limit.
+        Yields:
+            list[int]: The values of each solution.
+        Raises:
+            ValueError: If the grid does not contain one value per cell.
+        """
+        geometry = self._geometry
+        if len(values) != geometry.cells:
+            raise ValueError(f"Grid must contain {geometry.cells} values.")
+        if limit is not None and limit <= 0:
+            return
+        matrix = _build_matrix(geometry, values)
+        if matrix is None:
+            return  # Invalid number or two givens sharing a constraint
+        left, right, up, down, column, size, candidates = matrix
+        solution = list(values)
+        count = 0
+        for _ in _search(left, right, up, down, column, size, solution, candidates, geometry.size, budget):
+            yield solution[:]
+            count += 1
+            if count == limit:
+                return
+
+    def _get_values(self, board):
+        """ Read the values of a board as a flat list.
+        Args:
+            board (Board): The board to read.
+        Returns:
+            list[int]: The values of the board in row-major order.
+        Raises:
+            TypeError: If the board is not an instance of the Board class.
+            ValueError: If the board is not of the size of the solver.
+        """
+        if not isinstance(board, Board):
+            raise TypeError("Board must be an instance of the Board class.")
+        size = self._geometry.size
+        if board.get_size() != size:
+            raise ValueError(f"Board must be a {size}x{size} board.")
+        return [board.get_number(index // size, index % size) for index in range(self._geometry.cells)]
+
+def _build_matrix(geometry, values):
+    """ Build the links of the exact cover matrix left by the givens of a grid.
+        Node 0 is the root, then come the headers of the constraints not met by the givens,
+        and each candidate (cell, digit) allowed by the givens adds 4 nodes.
+    Args:
+        geometry (Geometry): The tables of the grid.
+        values (list[int]): The values of the grid in row-major order (0 for empty cells).
+    Returns:
+        tuple[list[int], ...]: The left, right, up, down and column links of each node, the size of each column header,
+        and the candidate of each row (cell * size + digit - 1), or None if a given is invalid or two givens share a constraint.
+    """
+    cells, digits = geometry.cells, geometry.size
+    units_of = geometry.units_of
+    used = [0] * (3 * digits)
+    for index, value in enumerate(values):
+        if value:
+            if not 0 < value <= digits:
+                return None
+            bit = 1 << value
+            for unit in units_of[index]:
+                if used[unit] & bit:
+                    return None
+                used[unit] |= bit
+    # Header node of each constraint not met: cell constraints first, then (unit, digit) constraints
+    headers = [0] * (4 * cells)
+    count = 0
+    for index in range(cells):
+        if not values[index]:
+            count += 1
+            headers[index] = count
+    for unit in range(3 * digits):
+        for digit in range(1, digits + 1):
+            if not used[unit] >> digit & 1:
+                count += 1
+                headers[cells + unit * digits + digit - 1] = count
+    left = [count] + list(range(count))
+    right = list(range(1, count + 1)) + [0]
+    up = list(range(count + 1))
+    down = list(range(count + 1))
+    column = list(range(count + 1))
+    size = [0] * (count + 1)
+    candidates = []
+    for index in range(cells):
+        if values[index]:
+            continue
+        row_unit, col_unit, box_unit = units_of[index]
+        free = ~(used[row_unit] | used[col_unit] | used[box_unit])
+        for digit in range(1, digits + 1):
+            if not free >> digit & 1:
+                continue
+            node = len(column)
+            candidates.append(index * digits + digit - 1)
+            row_headers = (
+                headers[index],
+                headers[cells + row_unit * digits + digit - 1],
+                headers[cells + col_unit * digits + digit - 1],
+                headers[cells + box_unit * digits + digit - 1],
+            )
+            left.extend((node + 3, node, node + 1, node + 2))
+            right.extend((node + 1, node + 2, node + 3, node))
+            column.extend(row_headers)
+            down.extend(row_headers)
+            for current, header in enumerate(row_headers, node):
+                up.append(up[header])
+                down[up[header]] = current
+                up[header] = current
+                size[header] += 1
+    return left, right, up, down, column, size, candidates
+
+def _cover(header, left, right, up, down, column, size):
+    """ Remove a column from the header list and every row using it from the other columns. """
+    right[left[header]] = right[header]
+    left[right[header]] = left[header]
+    i = down[header]
+    while i != header:
+        j = right[i]
+        while j != i:
+            up[down[j]] = up[j]
+            down[up[j]] = down[j]
+            size[column[j]] -= 1
+            j = right[j]
+        i = down[i]
+
+def _uncover(header, left, right, up, down, column, size):
+    """ Restore a column removed by `_cover`, in reverse order. """
+    i = up[header]
+    while i != header:
+        j = left[i]
+        while j != i:
+            size[column[j]] += 1
+            up[down[j]] = j
+            down[up[j]] = j
+            j = left[j]
+        i = up[i]
+    right[left[header]] = header
+    left[right[header]] = header
+
+def _search(left, right, up, down, column, size, solution, candidates, digits, budget):
+    """ Run Algorithm X, choosing the column with the fewest rows first.
+        The chosen candidates are written in `solution`, which holds a complete grid each time the generator yields.
+        `candidates` holds the (cell, digit) of each candidate row, which follow the column headers, and `digits` is the size of the board.
+        `budget` holds the number of nodes left, or is None; the search stops once it drops below zero.
+    Yields:
+        None: Once per solution found.
+    """
+    if stats.enabled:
+        stats.count("solver.nodes")
+    if budget is not None:
+        budget[0] -= 1
+        if budget[0] < 0:
+            return
+    if right[0] == 0:
+        yield None
+        return
+    first = len(size)  # First node of the candidate rows
+    header, best = 0, first
+    j = right[0]
+    while j != 0:
+        if size[j] < best:
+            header, best = j, size[j]
+            if best <= 1:
+                break
+        j = right[j]
+    if best == 0:
+        return
+    _cover(header, left, right, up, down, column, size)
+    i = down[header]
+    while i != header:
+        # Candidate rows have 4 nodes each
+        row = (i - first) // 4
+        node = first + row * 4
+        candidate = candidates[row]
+        solution[candidate // digits] = candidate % digits + 1
+        for j in (node, node + 1, node + 2, node + 3):
+            if j != i:
+                _cover(column[j], left, right, up, down, column, size)
+        yield from _search(left, right, up, down, column, size, solution, candidates, digits, budget)
+        for j in (node + 3, node + 2, node + 1, node):
+            if j != i:
+                _uncover(column[j], left, right, up, down, column, size)
+        if stats.enabled:
+            stats.count("solver.backtracks")
+        i = down[i]
+    _uncover(header, left, right, up, down, column, size)
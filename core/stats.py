@@ -0,0 +1,101 @@
+""" Sudoku Statistics Module
+This module is part of the core package of the Sudoku game.
+It provides opt-in instrumentation: named counters and timers updated by the hot paths of the board, the solvers and the generator.
+Instrumentation is disabled by default. Instrumented code checks the module-level `enabled` flag before counting,
+so that disabled instrumentation costs a single attribute read.
+The counters are shared by the whole process and safe to update from several threads.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+enabled = False
+_counters = {}
+_timers = {}  # Name -> [number of calls, total seconds]
+_lock = threading.Lock()
+
+def enable():
+    """ Start updating the counters and timers. """
+    global enabled
+    enabled = True
+
+def disable():
+    """ Stop updating the counters and timers, keeping their current values. """
+    global enabled
+    enabled = False
+
+def is_enabled():
+    """ Check if the instrumentation is enabled.
+    Returns:
+        bool: True if the counters and timers are updated, False otherwise.
+    """
+    return enabled
+
+def reset():
+    """ Set every counter and timer back to zero. """
+    with _lock:
+        _counters.clear()
+        _timers.clear()
+
+def count(name, amount=1):
+    """ Add to a counter. Callers in hot paths check `enabled` first.
+    Args:
+        name (str): The name of the counter, prefixed by its component (e.g. "solver.nodes").
+        amount (int): The amount to add. Defaults to 1.
+    """
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+@contextmanager
+def timer(name):
+    """ Time a block of code, adding its duration to a timer if the instrumentation is enabled.
+    Args:
+        name (str): The name of the timer, prefixed by its component (e.g. "generator.fill_grid").
+    """
+    if not enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        with _lock:
+            entry = _timers.setdefault(name, [0, 0.0])
+            entry[0] += 1
+            entry[1] += elapsed
+
+def get_stats():
+    """ Get a copy of the counters and timers.
+    Returns:
+        dict: The "counters" (dict of name to count) and the "timers" (dict of name to a dict with the "calls" and "seconds" keys).
+    """
+    with _lock:
+        return {
+            "counters": dict(sorted(_counters.items())),
+            "timers": {name: {"calls": calls, "seconds": seconds} for name, (calls, seconds) in sorted(_timers.items())},
+        }
+
+def format_stats(data):
+    """ Format counters and timers as a readable breakdown, the slowest timers first.
+    Args:
+        data (dict): The counters and timers (see `get_stats`).
+    Returns:
+        str: The breakdown, one counter or timer per line.
+    """
+    lines = []
+    timers = sorted(data.get("timers", {}).items(), key=lambda item: -item[1]["seconds"])
+    if timers:
+        lines.append("Timers:")
+        width = max(len(name) for name, _ in timers)
+        for name, entry in timers:
+            average = entry["seconds"] / entry["calls"] * 1000 if entry["calls"] else 0.0
+            lines.append(f"  {name:<{width}}  {entry['seconds']:10.3f} s  {entry['calls']:8d} calls  {average:10.3f} ms/call")
+    counters = data.get("counters", {})
+    if counters:
+        lines.append("Counters:")
+        width = max(len(name) for name in counters)
+        for name, value in counters.items():
+            lines.append(f"  {name:<{width}}  {value:12d}")
+    return "\n".join(lines) if lines else "No statistics recorded."
@@ -0,0 +1,199 @@
+""" Sudoku Uniqueness Checker Class
+This module is part of the core package of the Sudoku game.
+It defines the `UniquenessChecker` class, which removes givens from a puzzle with a known unique solution
+as long as the solution stays unique.
+Each check looks for a second solution only, with another digit in the cell just emptied, and stops at the first one found.
+The digit masks of the rows, columns and boxes and the list of empty cells are kept from one removal to the next,
+and removals whose digit is a naked or hidden single of the remaining givens are accepted without any search.
+"""
+
+from core import stats
+from core.board import ALL_DIGITS, BOX_OF, COL_OF, DIGITS_OF_MASK, ROW_OF, UNITS, UNITS_OF
+from core.solver import Solver
+
+class UniquenessChecker:
+    """ Class removing the givens of a 9x9 puzzle while its solution stays unique. """
+
+    def __init__(self, givens, solution=None):
+        """ Initialize the checker with a puzzle with a unique solution.
+        Args:
+            givens (list[int]): The 81 givens of the puzzle in row-major order (0 for empty cells). A complete grid is a valid puzzle.
+            solution (list[int]): The 81 values of the unique solution of the puzzle, which is trusted.
+                Defaults to None, which solves the puzzle and checks that its solution is unique.
+        Raises:
+            ValueError: If the puzzle or the solution does not contain 81 values, or the puzzle does not have a unique solution.
+        """
+        if len(givens) != 81:
+            raise ValueError("Puzzle must contain 81 values.")
+        if solution is None:
+            solutions = list(Solver().solve_values(givens, limit=2))
+            if len(solutions) != 1:
+                raise ValueError("Puzzle must have a unique solution.")
+            solution = solutions[0]
+        elif len(solution) != 81:
+            raise ValueError("Solution must contain 81 values.")
+        self._values = list(givens)
+        self._solution = list(solution)
+        self._empty = [index for index, value in enumerate(self._values) if not value]
+        self._rows, self._cols, self._boxes = [0] * 9, [0] * 9, [0] * 9
+        for index, digit in enumerate(self._values):
+            if digit:
+                self._rows[ROW_OF[index]] |= 1 << digit
+                self._cols[COL_OF[index]] |= 1 << digit
+                self._boxes[BOX_OF[index]] |= 1 << digit
+
+    # Methods to remove givens
+
+    def remove(self, index):
+        """ Remove a given if the solution stays unique without it, or keep it otherwise.
+        Args:
+            index (int): The index of the cell (0 to 80).
+        Returns:
+            bool: True if the given was removed (or the cell was already empty), False if it was kept.
+        """
+        if not self._values[index]:
+            return True
+        self.clear(index)
+        if self.is_forced(index) or not self.has_other_solution(index):
+            return True
+        self.restore(index)
+        return False
+
+    def clear(self, index):
+        """ Remove a given without checking the solution. Does nothing if the cell is already empty.
+        Args:
+            index (int): The index of the cell (0 to 80).
+        """
+        digit = self._values[index]
+        if not digit:
+            return
+        bit = 1 << digit
+        self._values[index] = 0
+        self._rows[ROW_OF[index]] ^= bit
+        self._cols[COL_OF[index]] ^= bit
+        self._boxes[BOX_OF[index]] ^= bit
+        self._empty.append(index)
+
+    def restore(self, index):
+        """ Put the digit of the solution back in a cell. Does nothing if the cell is not empty.
+        Args:
+            index (int): The index of the cell (0 to 80).
+        """
+        if self._values[index]:
+            return
+        digit = self._solution[index]
+        bit = 1 << digit
+        self._values[index] = digit
+        self._rows[ROW_OF[index]] |= bit
+        self._cols[COL_OF[index]] |= bit
+        self._boxes[BOX_OF[index]] |= bit
+        self._empty.remove(index)
+
+    def is_forced(self, index):
+        """ Check if the digit of the solution in an empty cell is a naked or hidden single of the current givens.
+            If so, the cell is deduced right away and emptying it keeps the solution unique.
+        Args:
+            index (int): The index of the empty cell (0 to 80).
+        Returns:
+            bool: True if the cell has no other candidate, or if no other cell of one of its units can hold the digit.
+        """
+        values, rows, cols, boxes = self._values, self._rows, self._cols, self._boxes
+        bit = 1 << self._solution[index]
+        if ~(rows[ROW_OF[index]] | cols[COL_OF[index]] | boxes[BOX_OF[index]]) & ALL_DIGITS == bit:
+            return True
+        for unit in UNITS_OF[index]:
+            if not any(
+                not values[other] and not (rows[ROW_OF[other]] | cols[COL_OF[other]] | boxes[BOX_OF[other]]) & bit
+                for other in UNITS[unit] if other != index
+            ):
+                return True
+        return False
+
+    def has_other_solution(self, index):
+        """ Check if the current givens have a solution holding another digit than the solution in an empty cell.
+            The search stops at the first such solution.
+        Args:
+            index (int): The index of the empty cell (0 to 80).
+        Returns:
+            bool: True if another solution exists, False otherwise.
+        """
+        if stats.enabled:
+            stats.count("uniqueness.checks")
+        values, empty, rows, cols, boxes = self._values, self._empty, self._rows, self._cols, self._boxes
+        row, col, box = ROW_OF[index], COL_OF[index], BOX_OF[index]
+        others = ~(rows[row] | cols[col] | boxes[box]) & ALL_DIGITS & ~(1 << self._solution[index])
+        for digit in DIGITS_OF_MASK[others]:
+            bit = 1 << digit
+            values[index] = digit
+            rows[row] |= bit
+            cols[col] |= bit
+            boxes[box] |= bit
+            found = _search(values, empty, rows, cols, boxes)
+            rows[row] ^= bit
+            cols[col] ^= bit
+            boxes[box] ^= bit
+            values[index] = 0
+            if found:
+                return True
+        return False
+
+    def get_givens(self):
+        """ Get the current givens.
+        Returns:
+            list[int]: The 81 givens in row-major order (0 for empty cells).
+        """
+        return self._values[:]
+
+    def get_given_count(self):
+        """ Get the number of current givens.
+        Returns:
+            int: The number of non-empty cells.
+        """
+        return 81 - len(self._empty)
+
+# Functions to support the above methods
+
+def _search(values, empty, rows, cols, boxes):
+    """ Depth-first search for one solution of the grid, filling the most constrained cells first.
+        The lists are restored to their initial content before returning.
+    Args:
+        values (list[int]): The 81 values of the grid (0 for empty cells).
+        empty (list[int]): The indices of the cells that were empty before the search, some of them filled by the search.
+        rows, cols, boxes (list[int]): The bitmasks of the digits used in each row, column and box.
+    Returns:
+        bool: True if a solution was found, False otherwise.
+    """
+    if stats.enabled:
+        stats.count("uniqueness.nodes")
+    best, best_mask, best_count = None, 0, 10
+    for index in empty:
+        if values[index]:
+            continue
+        mask = ~(rows[ROW_OF[index]] | cols[COL_OF[index]] | boxes[BOX_OF[index]]) & ALL_DIGITS
+        if not mask:
+            return False
+        count = len(DIGITS_OF_MASK[mask])
+        if count < best_count:
+            best, best_mask, best_count = index, mask, count
+            if count == 1:
+                break
+    if best is None:
+        return True
+    row, col, box = ROW_OF[best], COL_OF[best], BOX_OF[best]
+    for digit in DIGITS_OF_MASK[best_mask]:
+        bit = 1 << digit
+        values[best] = digit
+        rows[row] |= bit
+        cols[col] |= bit
+        boxes[box] |= bit
+        found = _search(values, empty, rows, cols, boxes)
+        rows[row] ^= bit
+        cols[col] ^= bit
+        boxes[box] ^= bit
+        if found:
+            values[best] = 0
+            return True
+    values[best] = 0
+    if stats.enabled:
+        stats.count("uniqueness.backtracks")
+    return False
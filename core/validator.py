@@ -0,0 +1,91 @@
+""" Sudoku Bulk Validator
+This module is part of the core package of the Sudoku game.
+It checks many grids at once with NumPy, gathering the 27 units of every grid into one array
+so that no Python object is created per cell. It requires the numpy package, which the rest of the game does not need.
+"""
+
+import numpy as np
+
+from core.board import ALL_DIGITS, UNITS
+
+# Number of grids checked at once, which bounds the size of the intermediate arrays
+BLOCK_SIZE = 65536
+
+_UNIT_CELLS = np.array(UNITS, dtype=np.intp)  # (27, 9) cell indices of each unit
+_BIT_COUNT = np.array([bin(mask).count("1") for mask in range(1 << 10)], dtype=np.uint8)
+
+def validate_grids(grids, conflicts=False):
+    """ Check the validity and completeness of many grids at once.
+        A grid is valid when no digit appears twice in a row, column or subgrid, and complete when it is valid and has no empty cell.
+    Args:
+        grids (array-like): The grids, as an (N, 81) or (N, 9, 9) array of integers between 0 and 9 (0 for empty cells).
+        conflicts (bool): Whether to also return the digits repeated in each unit. Defaults to False.
+    Returns:
+        tuple[numpy.ndarray, ...]: The (N,) boolean arrays of the valid and of the complete grids.
+        If `conflicts` is True, an (N, 27) uint16 array follows, where bit `n` of each unit is set when the digit `n` appears
+        more than once in it. Units are numbered 0-8 for rows, 9-17 for columns and 18-26 for subgrids.
+    Raises:
+        ValueError: If the grids do not have the expected shape or hold values outside 0-9.
+        TypeError: If the grids do not hold integers.
+    """
+    grids = _as_grid_array(grids)
+    count = grids.shape[0]
+    valid = np.empty(count, dtype=bool)
+    complete = np.empty(count, dtype=bool)
+    masks = np.empty((count, 27), dtype=np.uint16) if conflicts else None
+    for start in range(0, count, BLOCK_SIZE):
+        block = grids[start:start + BLOCK_SIZE]
+        units = block[:, _UNIT_CELLS]  # (n, 27, 9)
+        valid[start:start + len(block)] = ~_unit_conflicts(units).any(axis=1)
+        complete[start:start + len(block)] = valid[start:start + len(block)] & block.all(axis=1)
+        if conflicts:
+            masks[start:start + len(block)] = _repeated_digits(units)
+    if conflicts:
+        return valid, complete, masks
+    return valid, complete
+
+# Functions to support the above methods
+
+def _as_grid_array(grids):
+    """ Convert grids to a contiguous (N, 81) uint8 array.
+    Args:
+        grids (array-like): The grids, as an (N, 81) or (N, 9, 9) array of integers.
+    Returns:
+        numpy.ndarray: The grids as an (N, 81) uint8 array.
+    Raises:
+        ValueError: If the grids do not have the expected shape or hold values outside 0-9.
+        TypeError: If the grids do not hold integers.
+    """
+    grids = np.asarray(grids)
+    if grids.ndim == 3 and grids.shape[1:] == (9, 9):
+        grids = grids.reshape(grids.shape[0], 81)
+    if grids.ndim != 2 or grids.shape[1] != 81:
+        raise ValueError("Grids must be an (N, 81) or (N, 9, 9) array.")
+    if grids.size and not np.issubdtype(grids.dtype, np.integer):
+        raise TypeError("Grids must hold integers.")
+    if grids.size and (grids.min() < 0 or grids.max() > 9):
+        raise ValueError("Grid values must be between 0 and 9.")
+    return np.ascontiguousarray(grids, dtype=np.uint8)
+
+def _unit_conflicts(units):
+    """ Find the units holding a repeated digit, by comparing the number of filled cells with the number of distinct digits.
+    Args:
+        units (numpy.ndarray): The (n, 27, 9) values of the units of each grid.
+    Returns:
+        numpy.ndarray: The (n, 27) boolean array of the units holding a repeated digit.
+    """
+    bits = np.left_shift(np.uint16(1), units, dtype=np.uint16)
+    digits = np.bitwise_or.reduce(bits, axis=2) & ALL_DIGITS
+    return np.count_nonzero(units, axis=2) != _BIT_COUNT[digits]
+
+def _repeated_digits(units):
+    """ Find the digits repeated in each unit, by comparing neighbours once the values of each unit are sorted.
+    Args:
+        units (numpy.ndarray): The (n, 27, 9) values of the units of each grid.
+    Returns:
+        numpy.ndarray: The (n, 27) uint16 array of the bitmasks of the repeated digits.
+    """
+    ordered = np.sort(units, axis=2)
+    repeated = (ordered[:, :, 1:] == ordered[:, :, :-1]) & (ordered[:, :, 1:] != 0)
+    bits = np.left_shift(np.uint16(1), ordered[:, :, 1:], dtype=np.uint16)
+    return np.bitwise_or.reduce(np.where(repeated, bits, np.uint16(0)), axis=2)
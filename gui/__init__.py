@@ -4,7 +4,8 @@ This module provides graphical user interface functionality for the Sudoku game,
 
 Structure:
     gui.py      - Contains the main GUI application logic
+    renderer.py - Contains the BoardRenderer class drawing the board with pygame, redrawing only the changed cells
 """
 from .gui import run_gui
 
-__all__ = ["run_gui"]
\ No newline at end of file
+__all__ = ["run_gui"]
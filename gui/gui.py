@@ -1,12 +1,107 @@
 """ Sudoku GUI Module
 This module provides a graphical user interface (GUI) for playing Sudoku.
 It is part of the GUI package and is designed to work with the core game logic.
+The board is drawn by the `BoardRenderer` class, which only redraws the cells changed since the last frame,
+and the main loop sleeps between frames at a fixed frame rate instead of polling.
 """
 
+import pygame
+
+from core.game import Game, valid_levels
+from gui.renderer import BoardRenderer
+
+FPS = 30
+TITLE = "Sudoku"
+# Keys moving the selection, as (row, col) steps
+MOVES = {pygame.K_UP: (-1, 0), pygame.K_DOWN: (1, 0), pygame.K_LEFT: (0, -1), pygame.K_RIGHT: (0, 1)}
+CLEAR_KEYS = (pygame.K_BACKSPACE, pygame.K_DELETE, pygame.K_0, pygame.K_KP0)
+
 def run_gui(level):
     """ Run the Sudoku GUI with the specified difficulty level.
+        Click or use the arrow keys to select a cell, type a number to place it (or to toggle a pencil mark in pencil mode),
+        and use Backspace to clear it. P toggles the pencil mode, H shows a hint, U and R undo and redo, and N starts a new game.
     Args:
         level (str): The difficulty level of the Sudoku puzzle.
     Raises:
         ValueError: If the level is not one of the valid options.
-    """
\ No newline at end of file
+    """
+    if level not in valid_levels:
+        raise ValueError(f"Level must be one of {valid_levels}.")
+    pygame.init()
+    try:
+        game = Game(level)
+        game.start_game()
+        renderer = BoardRenderer(game.get_board())
+        screen = pygame.display.set_mode(renderer.get_size())
+        pygame.display.set_caption(f"{TITLE} - {level}")
+        clock = pygame.time.Clock()
+        pencil = False
+        running = True
+        while running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.WINDOWEXPOSED:
+                    renderer.invalidate()
+                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    renderer.set_selection(renderer.cell_at(event.pos))
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        running = False
+                    elif event.key == pygame.K_p:
+                        pencil = not pencil
+                        pygame.display.set_caption(f"{TITLE} - {level}" + (" (pencil)" if pencil else ""))
+                    else:
+                        _handle_key(game, renderer, event, pencil)
+            rects = renderer.draw(screen)
+            if rects:
+                pygame.display.update(rects)
+            # Clock.tick sleeps until the next frame, so an idle board costs almost no CPU
+            clock.tick(FPS)
+        renderer.close()
+        game.close()
+    finally:
+        pygame.quit()
+
+# Functions to support the above methods
+
+def _handle_key(game, renderer, event, pencil):
+    """ Apply a key press to the game.
+    Args:
+        game (Game): The game.
+        renderer (BoardRenderer): The renderer of its board.
+        event (pygame.event.Event): The key press.
+        pencil (bool): Whether numbers toggle pencil marks instead of being placed.
+    """
+    board = game.get_board()
+    selected = renderer.get_selection()
+    if event.key in MOVES:
+        row, col = selected if selected is not None else (0, 0)
+        step = MOVES[event.key]
+        size = board.get_size()
+        renderer.set_selection(((row + step[0]) % size, (col + step[1]) % size))
+    elif event.key == pygame.K_u:
+        renderer.set_selection(game.undo() or selected)
+    elif event.key == pygame.K_r:
+        renderer.set_selection(game.redo() or selected)
+    elif event.key == pygame.K_h:
+        hint = game.hint()
+        if hint is not None:
+            renderer.set_selection(hint[:2])
+            board.set_number(*hint[:3])
+    elif event.key == pygame.K_n:
+        game.reset_game()
+        renderer.set_board(game.get_board())
+    elif selected is not None and not board.is_fixed(*selected):
+        if event.key in CLEAR_KEYS:
+            board.clear_number(*selected)
+        elif event.unicode.isdigit() and event.unicode != "0":
+            number = int(event.unicode)
+            if pencil:
+                if not board.get_number(*selected):
+                    renderer.toggle_mark(*selected, number)
+            else:
+                board.set_number(*selected, number)
+    if board.is_complete():
+        game.end_game()
+        pygame.display.set_caption(f"{TITLE} - {game.get_level()} - completed")
@@ -0,0 +1,259 @@
+""" Sudoku Board Renderer
+This module is part of the GUI package and draws a `Board` with pygame.
+Only the cells changed since the last frame are drawn again: the renderer listens to the changes of the board
+and keeps the set of dirty cells, and `draw` returns the rectangles to pass to `pygame.display.update`.
+The digits and the pencil marks are rendered once into cached glyph surfaces, which each frame only blits.
+It requires the pygame package, which the rest of the game does not need.
+"""
+
+import pygame
+
+from core.board import CHARS
+
+CELL_SIZE = 56
+MARGIN = 12
+THIN_LINE = 1
+THICK_LINE = 3
+# Pixels left around the content of a cell, so that redrawing a cell never touches the grid lines
+CELL_INSET = THICK_LINE // 2 + 1
+
+BACKGROUND = (250, 250, 250)
+LINE_COLOR = (40, 40, 40)
+SELECTED_BACKGROUND = (200, 220, 250)
+# Colors of the digits: givens, numbers of the player, and numbers appearing twice in a row, column or subgrid
+STYLE_COLORS = {"fixed": (20, 20, 20), "player": (30, 80, 200), "conflict": (210, 40, 40)}
+MARK_COLOR = (110, 110, 110)
+
+class BoardRenderer:
+    """ Class drawing a board with pygame, redrawing only the cells changed since the last frame. """
+
+    def __init__(self, board, cell_size=CELL_SIZE, origin=(MARGIN, MARGIN)):
+        """ Initialize the renderer of a board, listening to its changes.
+        Args:
+            board (Board): The board to draw.
+            cell_size (int): The size of a cell in pixels. Defaults to `CELL_SIZE`.
+            origin (tuple[int, int]): The position of the top left corner of the grid in pixels. Defaults to (`MARGIN`, `MARGIN`).
+        Raises:
+            ValueError: If the cell size is too small to hold a digit.
+        """
+        if cell_size < 4 * CELL_INSET:
+            raise ValueError(f"Cell size must be at least {4 * CELL_INSET} pixels.")
+        self._cell_size = cell_size
+        self._origin = origin
+        self._board = None
+        self._size = 0
+        self._box_size = 0
+        self._selected = None
+        self._marks = {}  # (row, col) -> set of the pencil marks of an empty cell
+        self._dirty = set()
+        self._full = True  # Whether the next frame redraws the whole grid
+        self._font = None
+        self._mark_font = None
+        self._glyphs = {}  # (number, style) -> rendered digit
+        self._mark_glyphs = {}  # number -> rendered pencil mark
+        self.set_board(board)
+
+    # Methods to draw the board
+
+    def set_board(self, board):
+        """ Draw another board from the next frame on, moving the listener from the previous one.
+        Args:
+            board (Board): The new board.
+        """
+        if self._board is not None:
+            self._board.remove_listener(self._on_change)
+        if board.get_size() != self._size:
+            self._glyphs.clear()
+            self._mark_glyphs.clear()
+            self._font = self._mark_font = None
+        self._board = board
+        self._size = board.get_size()
+        self._box_size = board.get_box_size()
+        self._selected = None
+        self._marks.clear()
+        self._dirty.clear()
+        self._full = True
+        board.add_listener(self._on_change)
+
+    def close(self):
+        """ Stop listening to the changes of the board. """
+        self._board.remove_listener(self._on_change)
+
+    def get_size(self):
+        """ Get the size of the grid in pixels.
+        Returns:
+            tuple[int, int]: The width and the height of the grid and its margins.
+        """
+        side = self._size * self._cell_size + 2 * self._origin[0]
+        return side, self._size * self._cell_size + 2 * self._origin[1]
+
+    def get_selection(self):
+        """ Get the selected cell.
+        Returns:
+            tuple[int, int]: The (row, col) position of the selected cell, or None.
+        """
+        return self._selected
+
+    def set_selection(self, cell):
+        """ Select a cell, which is drawn highlighted.
+        Args:
+            cell (tuple[int, int]): The (row, col) position of the cell, or None to clear the selection.
+        """
+        if cell == self._selected:
+            return
+        if self._selected is not None:
+            self._dirty.add(self._selected)
+        if cell is not None:
+            self._dirty.add(cell)
+        self._selected = cell
+
+    def toggle_mark(self, row, col, number):
+        """ Add or remove a pencil mark of an empty cell. Marks are drawn in the empty cells only.
+        Args:
+            row (int): The row index (0 to size - 1).
+            col (int): The column index (0 to size - 1).
+            number (int): The number to mark (1 to size).
+        """
+        marks = self._marks.setdefault((row, col), set())
+        marks ^= {number}
+        if not marks:
+            del self._marks[(row, col)]
+        self._dirty.add((row, col))
+
+    def cell_at(self, position):
+        """ Find the cell under a point of the window.
+        Args:
+            position (tuple[int, int]): The (x, y) position in pixels.
+        Returns:
+            tuple[int, int]: The (row, col) position of the cell, or None if the point is outside the grid.
+        """
+        col = (position[0] - self._origin[0]) // self._cell_size
+        row = (position[1] - self._origin[1]) // self._cell_size
+        if 0 <= row < self._size and 0 <= col < self._size:
+            return row, col
+        return None
+
+    def draw(self, surface):
+        """ Draw the cells changed since the last frame, or the whole grid on the first frame and after `set_board` or `invalidate`.
+        Args:
+            surface (pygame.Surface): The surface of the window.
+        Returns:
+            list[pygame.Rect]: The rectangles drawn, to pass to `pygame.display.update`. Empty if nothing changed.
+        """
+        if not self._full and not self._dirty:
+            return []
+        conflicts = set(self._board.conflicting_cells())
+        if self._full:
+            self._full = False
+            self._dirty.clear()
+            surface.fill(BACKGROUND)
+            for row in range(self._size):
+                for col in range(self._size):
+                    self._draw_cell(surface, row, col, conflicts)
+            self._draw_lines(surface)
+            return [pygame.Rect((0, 0), self.get_size())]
+        rects = [self._draw_cell(surface, row, col, conflicts) for row, col in self._dirty]
+        self._dirty.clear()
+        return rects
+
+    def invalidate(self):
+        """ Redraw the whole grid on the next frame, e.g. after the window was exposed again. """
+        self._full = True
+
+    # Functions to support the above methods
+
+    def _on_change(self, row, col, old, new):
+        """ Mark a changed cell as dirty, with the cells of its row, column and subgrid holding its old or new number,
+            whose conflict color may have changed. Called by the board after each change.
+        Args:
+            row (int): The row index of the changed cell.
+            col (int): The column index of the changed cell.
+            old (int): The previous number of the cell.
+            new (int): The new number of the cell.
+        """
+        board, size, box_size = self._board, self._size, self._box_size
+        dirty = self._dirty
+        dirty.add((row, col))
+        top, left = row - row % box_size, col - col % box_size
+        peers = [(row, other) for other in range(size)] + [(other, col) for other in range(size)]
+        peers += [(top + i // box_size, left + i % box_size) for i in range(size)]
+        for peer in peers:
+            value = board.get_number(*peer)
+            if value and (value == old or value == new):
+                dirty.add(peer)
+
+    def _draw_cell(self, surface, row, col, conflicts):
+        """ Draw the content of a cell, inside the grid lines.
+        Args:
+            surface (pygame.Surface): The surface of the window.
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+            conflicts (set[tuple[int, int]]): The cells whose number also appears in their row, column or subgrid.
+        Returns:
+            pygame.Rect: The rectangle drawn.
+        """
+        size = self._cell_size
+        rect = pygame.Rect(self._origin[0] + col * size + CELL_INSET, self._origin[1] + row * size + CELL_INSET,
+                           size - 2 * CELL_INSET, size - 2 * CELL_INSET)
+        surface.fill(SELECTED_BACKGROUND if (row, col) == self._selected else BACKGROUND, rect)
+        board = self._board
+        value = board.get_number(row, col)
+        if value:
+            if board.is_fixed(row, col):
+                style = "fixed"
+            elif (row, col) in conflicts:
+                style = "conflict"
+            else:
+                style = "player"
+            glyph = self._glyph(value, style)
+            surface.blit(glyph, glyph.get_rect(center=rect.center))
+        elif (row, col) in self._marks:
+            step = rect.width / self._box_size
+            for number in self._marks[(row, col)]:
+                glyph = self._mark_glyph(number)
+                y, x = divmod(number - 1, self._box_size)
+                center = (rect.left + int((x + 0.5) * step), rect.top + int((y + 0.5) * step))
+                surface.blit(glyph, glyph.get_rect(center=center))
+        return rect
+
+    def _draw_lines(self, surface):
+        """ Draw the grid lines, thicker around the subgrids.
+        Args:
+            surface (pygame.Surface): The surface of the window.
+        """
+        left, top = self._origin
+        length = self._size * self._cell_size
+        for line in range(self._size + 1):
+            width = THICK_LINE if line % self._box_size == 0 else THIN_LINE
+            offset = line * self._cell_size
+            pygame.draw.line(surface, LINE_COLOR, (left + offset, top), (left + offset, top + length), width)
+            pygame.draw.line(surface, LINE_COLOR, (left, top + offset), (left + length, top + offset), width)
+
+    def _glyph(self, number, style):
+        """ Get the rendered digit of a number in a style, rendering it on first use.
+        Args:
+            number (int): The number (1 to size).
+            style (str): The style of the number, a key of `STYLE_COLORS`.
+        Returns:
+            pygame.Surface: The rendered digit.
+        """
+        glyph = self._glyphs.get((number, style))
+        if glyph is None:
+            if self._font is None:
+                self._font = pygame.font.Font(None, self._cell_size * 3 // 4)
+            glyph = self._glyphs[(number, style)] = self._font.render(CHARS[number], True, STYLE_COLORS[style]).convert_alpha()
+        return glyph
+
+    def _mark_glyph(self, number):
+        """ Get the rendered pencil mark of a number, rendering it on first use.
+        Args:
+            number (int): The number (1 to size).
+        Returns:
+            pygame.Surface: The rendered pencil mark.
+        """
+        glyph = self._mark_glyphs.get(number)
+        if glyph is None:
+            if self._mark_font is None:
+                self._mark_font = pygame.font.Font(None, max(8, (self._cell_size - 2 * CELL_INSET) // self._box_size + 4))
+            glyph = self._mark_glyphs[number] = self._mark_font.render(CHARS[number], True, MARK_COLOR).convert_alpha()
+        return glyph
@@ -0,0 +1,11 @@
+""" Server Module for Sudoku Game
+
+This module provides a server for the Sudoku game, letting other programs generate, solve, validate and get hints on puzzles
+through a socket instead of running the game for each request.
+
+Structure:
+    server.py   - Contains the asyncio server speaking JSON lines over TCP or a Unix socket, backed by a process pool
+"""
+from .server import PuzzleServer, run_serve
+
+__all__ = ["PuzzleServer", "run_serve"]
@@ -0,0 +1,384 @@
+""" Sudoku Server Module
+This module is part of the server package and serves the Sudoku game to other programs over a socket.
+The protocol is JSON lines: each request is one JSON object on its own line, such as
+    {"id": 1, "op": "solve", "puzzle": "53..7....6..195...."}
+and each response is one JSON object on its own line, holding the "id" of the request and either its "result" or an "error".
+Requests of a connection are handled concurrently, so responses may come back in another order than the requests.
+
+The operations are:
+    generate - Generate a puzzle of a "level", or the puzzle of a "puzzle_id" (see `PuzzleCatalog`)
+    solve    - Solve a "puzzle" in the one-line format
+    validate - Check the conflicts and the completion of a "board" in the one-line format
+    hint     - Get the next logical move on a "board" started from a "puzzle" (see `find_hint`)
+The CPU-bound operations run in a process pool. Solve and hint requests arriving within a few milliseconds of each other
+are sent to the pool in one batch, which saves most of the cost of a round trip to a worker process per request.
+"""
+
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from core.board import FROM_CHARS, TO_CHARS, Board
+from core.catalog import PuzzleCatalog
+from core.game import find_hint
+from core.solver import Solver
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Longest wait for more requests before sending a batch to the pool, in seconds, and largest batch of each operation
+BATCH_DELAY = 0.002
+BATCH_SIZES = {"solve": 64, "hint": 16}
+# Longest request line accepted, in bytes
+MAX_LINE = 64 * 1024
+
+_solvers = {}  # Box size -> Solver of the current process, built on first use
+_catalog = None  # Catalog of the current process, built on first use
+
+def run_serve(host=DEFAULT_HOST, port=DEFAULT_PORT, path=None, workers=None):
+    """ Run a puzzle server until it is interrupted.
+    Args:
+        host (str): The address to listen on. Defaults to `DEFAULT_HOST`.
+        port (int): The TCP port to listen on. Defaults to `DEFAULT_PORT`.
+        path (str): The path of a Unix socket to listen on instead of TCP. Defaults to None.
+        workers (int): The number of worker processes. Defaults to None, which uses one process per CPU.
+    Raises:
+        ValueError: If the number of workers is not positive.
+    """
+    server = PuzzleServer(host, port, path, workers)
+
+    async def serve():
+        await server.start()
+        print(f"Serving on {server.get_address()}", flush=True)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+class PuzzleServer:
+    """ Class serving puzzle requests in JSON lines over TCP or a Unix socket. """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, path=None, workers=None):
+        """ Initialize the server, which listens once started.
+        Args:
+            host (str): The address to listen on. Defaults to `DEFAULT_HOST`, which only accepts local connections.
+            port (int): The TCP port to listen on, 0 for any free port. Defaults to `DEFAULT_PORT`.
+            path (str): The path of a Unix socket to listen on instead of TCP. Defaults to None.
+            workers (int): The number of worker processes. Defaults to None, which uses one process per CPU.
+        Raises:
+            ValueError: If the number of workers is not positive.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("Workers must be positive.")
+        self._host = host
+        self._port = port
+        self._path = path
+        self._workers = workers
+        self._pool = None
+        self._server = None
+        self._batchers = {}
+
+    # Methods to run the server
+
+    async def start(self):
+        """ Start the worker processes and listen for connections. """
+        self._pool = ProcessPoolExecutor(max_workers=self._workers)
+        self._batchers = {
+            "solve": _Batcher(self._pool, _solve_batch, BATCH_SIZES["solve"]),
+            "hint": _Batcher(self._pool, _hint_batch, BATCH_SIZES["hint"]),
+        }
+        if self._path is not None:
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=self._path, limit=MAX_LINE)
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, self._host, self._port, limit=MAX_LINE)
+
+    async def serve_forever(self):
+        """ Start the server if needed and serve connections until the task is cancelled, then close the server. """
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """ Stop listening and shut the worker processes down. """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def get_address(self):
+        """ Get the address the server listens on.
+        Returns:
+            tuple[str, int] | str: The host and the port for TCP, or the path of the Unix socket, or None if the server is not started.
+        """
+        if self._server is None:
+            return None
+        if self._path is not None:
+            return self._path
+        return self._server.sockets[0].getsockname()[:2]
+
+    # Functions to support the above methods
+
+    async def _handle_connection(self, reader, writer):
+        """ Read the requests of a connection until it is closed, handling each of them in its own task.
+        Args:
+            reader (asyncio.StreamReader): The stream of the requests.
+            writer (asyncio.StreamWriter): The stream of the responses.
+        """
+        lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # Line longer than MAX_LINE
+                    await self._respond(writer, lock, {"id": None, "error": "Request is too long."})
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(self._handle_request(line, writer, lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(self, line, writer, lock):
+        """ Handle a request and write its response.
+        Args:
+            line (bytes): The JSON request.
+            writer (asyncio.StreamWriter): The stream of the responses.
+            lock (asyncio.Lock): The lock keeping the responses of the connection from interleaving.
+        """
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object.")
+            request_id = request.get("id")
+            response = {"id": request_id, "result": await self._dispatch(request)}
+        except (ValueError, TypeError, RuntimeError) as error:  # RuntimeError includes a broken process pool
+            response = {"id": request_id, "error": str(error) or type(error).__name__}
+        await self._respond(writer, lock, response)
+
+    async def _dispatch(self, request):
+        """ Run the operation of a request.
+        Args:
+            request (dict): The request.
+        Returns:
+            dict: The result of the operation.
+        Raises:
+            ValueError: If the operation or its arguments are not valid.
+        """
+        op = request.get("op")
+        if op == "validate":
+            return _validate(request.get("board"))
+        if op in self._batchers:
+            return await self._batchers[op].submit(request)
+        if op == "generate":
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._pool, _generate, request.get("level"), request.get("puzzle_id"))
+        raise ValueError(f"Operation must be one of ['generate', 'solve', 'validate', 'hint'], not {op!r}.")
+
+    async def _respond(self, writer, lock, response):
+        """ Write a response on its own line.
+        Args:
+            writer (asyncio.StreamWriter): The stream of the responses.
+            lock (asyncio.Lock): The lock keeping the responses of the connection from interleaving.
+            response (dict): The response.
+        """
+        async with lock:
+            writer.write(json.dumps(response).encode("utf-8") + b"\n")
+            await writer.drain()
+
+class _Batcher:
+    """ Class grouping the requests of an operation into batches run in a process pool. """
+
+    def __init__(self, pool, function, max_size):
+        """ Initialize an empty batch.
+        Args:
+            pool (concurrent.futures.Executor): The pool running the batches.
+            function (callable): The module-level function running a batch, taking a list of requests and returning the
+                list of their results, or of the `ValueError` instances raised by the invalid ones.
+            max_size (int): The number of requests after which a batch is sent without waiting.
+        """
+        self._pool = pool
+        self._function = function
+        self._max_size = max_size
+        self._requests = []
+        self._futures = []
+        self._timer = None
+
+    async def submit(self, request):
+        """ Add a request to the current batch and wait for its result.
+        Args:
+            request (dict): The request.
+        Returns:
+            dict: The result of the request.
+        Raises:
+            ValueError: If the request is not valid.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._requests.append(request)
+        self._futures.append(future)
+        if len(self._requests) >= self._max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(BATCH_DELAY, self._flush)
+        result = await future
+        if isinstance(result, ValueError):
+            raise result
+        return result
+
+    def _flush(self):
+        """ Send the current batch to the pool and start a new one. """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        requests, futures = self._requests, self._futures
+        self._requests, self._futures = [], []
+        try:
+            batch = asyncio.get_running_loop().run_in_executor(self._pool, self._function, requests)
+        except Exception as error:  # E.g. a broken or shut down pool: fail the requests instead of leaving them waiting
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        batch.add_done_callback(lambda batch: _resolve(batch, futures))
+
+def _resolve(batch, futures):
+    """ Give each request of a finished batch its result, or the error of the whole batch.
+    Args:
+        batch (asyncio.Future): The batch run in the pool.
+        futures (list[asyncio.Future]): The futures of its requests.
+    """
+    error = batch.exception() if not batch.cancelled() else asyncio.CancelledError()
+    results = batch.result() if error is None else [None] * len(futures)
+    for future, result in zip(futures, results):
+        if future.done():
+            continue
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+def _parse(text):
+    """ Read a board in the one-line format.
+    Args:
+        text (str): The board.
+    Returns:
+        tuple[Board, list[int]]: The board, with its numbers fixed, and its values in row-major order (0 for empty cells).
+    Raises:
+        ValueError: If the board is not valid.
+    """
+    if not isinstance(text, str):
+        raise ValueError("Board must be a string in the one-line format.")
+    board = Board.from_string(text)
+    return board, list(text.strip().encode("ascii").translate(FROM_CHARS))
+
+def _format(values):
+    """ Write a grid in the one-line format.
+    Args:
+        values (list[int]): The values of the grid in row-major order (0 for empty cells).
+    Returns:
+        str: The grid, with "." for the empty cells.
+    """
+    return bytes(values).translate(TO_CHARS).decode("ascii")
+
+def _validate(text):
+    """ Check the conflicts and the completion of a board. Cheap enough to run in the event loop.
+    Args:
+        text (str): The board in the one-line format.
+    Returns:
+        dict: Whether the board is "complete", its "filled" count and its "conflicts" as a list of [row, col] positions.
+    Raises:
+        ValueError: If the board is not valid.
+    """
+    board, _ = _parse(text)
+    return {
+        "complete": board.is_complete(),
+        "filled": board.get_filled_count(),
+        "conflicts": [list(cell) for cell in board.conflicting_cells()],
+    }
+
+def _solve_batch(requests):
+    """ Solve a batch of puzzles in the current process.
+    Args:
+        requests (list[dict]): The solve requests.
+    Returns:
+        list[dict | ValueError]: For each request, the "solution" in the one-line format (None if the puzzle has no solution)
+        and whether it is "unique", or the error of an invalid request.
+    """
+    results = []
+    for request in requests:
+        try:
+            board, values = _parse(request.get("puzzle"))
+            box_size = board.get_box_size()
+            if box_size not in _solvers:
+                _solvers[box_size] = Solver(box_size)
+            solutions = list(_solvers[box_size].solve_values(values, limit=2))
+            solution = _format(solutions[0]) if solutions else None
+            results.append({"solution": solution, "unique": len(solutions) == 1})
+        except ValueError as error:
+            results.append(error)
+    return results
+
+def _hint_batch(requests):
+    """ Find the next logical move of a batch of boards in the current process.
+    Args:
+        requests (list[dict]): The hint requests, with the "puzzle" and optionally the current "board" in the one-line format.
+    Returns:
+        list[dict | ValueError]: For each request, the "row", "col", "number" and "technique" of the hint (None if there is none),
+        or the error of an invalid request.
+    """
+    results = []
+    for request in requests:
+        try:
+            board, _ = _parse(request.get("puzzle"))
+            if board.get_size() != 9:
+                raise ValueError("Hints need a 9x9 board.")
+            if request.get("board") is not None:
+                _, values = _parse(request["board"])
+                size = board.get_size()
+                for index, value in enumerate(values):
+                    if value and not board.is_fixed(index // size, index % size):
+                        board.set_number(index // size, index % size, value)
+            hint = find_hint(board)
+            keys = ("row", "col", "number", "technique")
+            results.append(dict(zip(keys, hint)) if hint is not None else None)
+        except (ValueError, IndexError) as error:
+            results.append(ValueError(str(error)))
+    return results
+
+def _generate(level, puzzle_id):
+    """ Generate a puzzle in the current process.
+    Args:
+        level (str): The difficulty level of the puzzle, ignored if a puzzle ID is given.
+        puzzle_id (str): The ID of the puzzle, or None for a new puzzle.
+    Returns:
+        dict: The "puzzle_id", the "puzzle" and "solution" in the one-line format, and the "grade" of the puzzle.
+    Raises:
+        ValueError: If the level or the puzzle ID is not valid.
+    """
+    global _catalog
+    if _catalog is None:
+        _catalog = PuzzleCatalog()
+    if puzzle_id is None:
+        puzzle_id = _catalog.new_id(level)
+    givens, solution, grade = _catalog.get_puzzle(puzzle_id)
+    return {"puzzle_id": puzzle_id, "puzzle": _format(givens), "solution": _format(solution), "grade": grade}
@@ -1,16 +1,21 @@
 """ Main file for the Sudoku game.
 This script serves as the entry point for the Sudoku game, allowing users to choose between a CLI or a GUI to play the game.
-It also allows users to select the difficulty level of the game.
+It also allows users to select the difficulty level of the game, to solve puzzle files in batch with the `solve` subcommand,
+to check, solve and grade a stream of puzzles in a Unix pipeline with the `pipe` subcommand,
+to generate shards of puzzle batches with the `generate` subcommand, to serve puzzles to other programs with the `serve` subcommand,
+or to run the benchmarks of the core operations with the `bench` subcommand.
+Any of them can be profiled with the `--profile` option.
 It uses argparse for command-line argument parsing and provides a simple user interface.
 """
 
 # import necessary libraries
 import argparse
-import subprocess
+import sys
 
 # import necessary modules
-from cli import *
-from gui import *
+# The modules of each mode (CLI, GUI, batch, server, benchmarks) are imported by `run_command` once the mode is selected,
+# so that short-lived processes such as batch runs do not pay for the imports of the others (pygame for the GUI).
+from core import stats
 
 # Constants for difficulty levels and quit commands
 DIFFICULTY_LEVEL = ['easy', 'medium', 'hard']
@@ -39,6 +44,11 @@ def main():
     This function handles the command-line interface and user input to start the game.
     It allows the user to choose between CLI and GUI modes, as well as the difficulty level.
     It also provides a version option to display the game's version.
+    The `solve` subcommand runs the non-interactive batch mode instead of the game, the `pipe` subcommand the streaming mode,
+    the `generate` subcommand writes a shard of a puzzle batch,
+    the `serve` subcommand runs the puzzle server until interrupted,
+    and the `bench` subcommand runs the benchmarks, exiting with status 1 on a regression.
+    The `--profile` option enables the instrumentation counters of the core package and prints them on exit.
     """
 
     # Parse command-line arguments using argparse
@@ -46,10 +56,87 @@ def main():
     parser.add_argument('-v', '--version', action='version', version='Sudoku Game 1.0', help='Show the version of the Sudoku game')
     parser.add_argument('--cli', action='store_true', help='Run the game in CLI mode')
     parser.add_argument('-t', '--test', '--tests', action='store_true', help='Run the game in test mode (CLI only)')
+    parser.add_argument('--profile', action='store_true', help='Print the instrumentation counters and timers on exit '
+                                                                '(counters of worker processes are not collected)')
+    parser.add_argument('--profile-output', default=None, metavar='FILE',
+                        help='With --profile, also write the counters as JSON (.json) or a cProfile dump (any other extension)')
+    subparsers = parser.add_subparsers(dest='command')
+    solve_parser = subparsers.add_parser('solve', help='Solve puzzles in batch, one 81-character puzzle per line')
+    solve_parser.add_argument('-i', '--input', default='-', help='Puzzle file to read (default: standard input)')
+    solve_parser.add_argument('-o', '--output', default='-', help='Result file to write (default: standard output)')
+    solve_parser.add_argument('-w', '--workers', type=int, default=None, help='Number of worker processes (default: one per CPU)')
+    solve_parser.add_argument('--chunk-size', type=int, default=256, help='Number of puzzles sent to a worker at once')
+    pipe_parser = subparsers.add_parser('pipe', help='Check, solve and grade puzzles line by line, writing each result as soon as it is ready')
+    pipe_parser.add_argument('-i', '--input', default='-', help='Puzzle file to read (default: standard input)')
+    pipe_parser.add_argument('-o', '--output', default='-', help='Result file to write (default: standard output)')
+    pipe_parser.add_argument('--no-grade', action='store_true', help='Do not grade the puzzles, which is faster')
+    generate_parser = subparsers.add_parser('generate', help='Generate a shard of a puzzle batch, one puzzle per line as soon as it is ready')
+    generate_parser.add_argument('level', choices=['easy', 'medium', 'hard', 'expert'], help='Difficulty level of the puzzles')
+    generate_parser.add_argument('-n', '--count', type=int, default=1, help='Number of puzzles to generate')
+    generate_parser.add_argument('-s', '--seed', type=int, default=0, help='Seed of the batch')
+    generate_parser.add_argument('--start', type=int, default=0, help='Index of the first puzzle of the shard in the batch')
+    generate_parser.add_argument('-o', '--output', default='-', help='Puzzle file to write (default: standard output)')
+    generate_parser.add_argument('-w', '--workers', type=int, default=None, help='Number of worker processes (default: one per CPU)')
+    generate_parser.add_argument('--box-size', type=int, default=3, help='Box size of the puzzles (3 for 9x9 puzzles)')
+    serve_parser = subparsers.add_parser('serve', help='Serve generate, solve, validate and hint requests in JSON lines over a socket')
+    serve_parser.add_argument('--host', default='127.0.0.1', help='Address to listen on (default: local connections only)')
+    serve_parser.add_argument('-p', '--port', type=int, default=8765, help='TCP port to listen on')
+    serve_parser.add_argument('--unix', default=None, metavar='PATH', help='Unix socket to listen on instead of TCP')
+    serve_parser.add_argument('-w', '--workers', type=int, default=None, help='Number of worker processes (default: one per CPU)')
+    bench_parser = subparsers.add_parser('bench', help='Run the benchmarks and compare them with the baseline')
+    bench_parser.add_argument('-o', '--output', default='-', help='JSON result file to write (default: standard output)')
+    bench_parser.add_argument('-b', '--baseline', default=None, help='Baseline file (default: bench/baseline.json)')
+    bench_parser.add_argument('--threshold', type=float, default=0.25, help='Relative slowdown reported as a regression')
+    bench_parser.add_argument('--update-baseline', action='store_true', help='Replace the baseline with the results')
+    bench_parser.add_argument('names', nargs='*', help='Benchmarks to run (default: all)')
     args = parser.parse_args()
 
+    if not args.profile:
+        run_command(args)
+        return
+    import cProfile
+    stats.enable()
+    output = args.profile_output
+    profiler = cProfile.Profile() if output is not None and not output.endswith('.json') else None
+    try:
+        if profiler is not None:
+            profiler.runcall(run_command, args)
+        else:
+            run_command(args)
+    finally:
+        write_profile(output, profiler)
+
+def run_command(args):
+    """Run the subcommand or the game selected by the command-line arguments.
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+    """
+    if args.command == 'solve':
+        from cli import run_solve
+        run_solve(args.input, args.output, args.workers, args.chunk_size)
+        return
+    if args.command == 'pipe':
+        from cli import run_pipe
+        run_pipe(args.input, args.output, grade=not args.no_grade)
+        return
+    if args.command == 'generate':
+        from cli import run_generate
+        run_generate(args.level, args.count, args.output, args.seed, args.start, args.workers, args.box_size)
+        return
+    if args.command == 'serve':
+        from server import run_serve
+        run_serve(args.host, args.port, args.unix, args.workers)
+        return
+    if args.command == 'bench':
+        from bench import run_bench
+        options = {'baseline_path': args.baseline} if args.baseline else {}
+        regressions = run_bench(args.output, threshold=args.threshold, update=args.update_baseline, names=args.names or None, **options)
+        for regression in regressions:
+            print(f"Regression: {regression['name']} is {regression['change']:.0%} slower than the baseline.", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
     level = None
-    if not args.tests:
+    if not args.test:
         # Check if the user wants to play in a specific difficulty level
         level = prompt_choice(f"Choose difficulty level ({', '.join(DIFFICULTY_LEVEL)}): ", DIFFICULTY_LEVEL)
         if level is None:
@@ -58,13 +145,31 @@ def main():
     # Run the game in the selected mode and difficulty level
     if args.cli:
         print(f"Running Sudoku in CLI mode with {level} difficulty...")
+        from cli import run_cli
         run_cli(level)
-    elif args.tests:
+    elif args.test:
         print("Running Sudoku in test mode (CLI only)...")
+        import subprocess
         subprocess.run(['pytest'])
     else:
         print(f"Running Sudoku in GUI mode with {level} difficulty...")
+        from gui import run_gui
         run_gui(level)
 
+def write_profile(path, profiler):
+    """Print the instrumentation counters and timers, and write them or the cProfile statistics to a file.
+    Args:
+        path (str): The file to write: JSON if it ends with ".json", a cProfile dump otherwise, or None for none.
+        profiler (cProfile.Profile): The profiler of the run, or None.
+    """
+    import json
+    data = stats.get_stats()
+    print(stats.format_stats(data), file=sys.stderr)
+    if profiler is not None:
+        profiler.dump_stats(path)
+    elif path is not None:
+        with open(path, 'w') as file:
+            json.dump(data, file, indent=2)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
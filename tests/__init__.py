@@ -4,7 +4,24 @@ This module contains tests for the Sudoku game components.
 It is used to ensure the functionality and correctness of the game logic.
 
 Structure:
-    test_board.py     - Tests for the Board class
-    test_game.py      - Tests for the Game class
-    test_number.py    - Tests for the Number class
+    test_bank.py       - Tests for the PuzzleBank class
+    test_batch.py      - Tests for the batch mode of the CLI
+    test_bench.py      - Tests for the benchmarks
+    test_board.py      - Tests for the Board class
+    test_cache.py      - Tests for the SolutionCache class
+    test_canonical.py  - Tests for the canonical form of grids
+    test_catalog.py    - Tests for the PuzzleCatalog class
+    test_game.py       - Tests for the Game class
+    test_generator.py  - Tests for the Generator class
+    test_gui.py        - Tests for the BoardRenderer class of the GUI
+    test_logic.py      - Tests for the LogicSolver class
+    test_number.py     - Tests for the Number class
+    test_pipe.py       - Tests for the streaming mode of the CLI
+    test_pool.py       - Tests for the PuzzlePool class
+    test_server.py     - Tests for the puzzle server
+    test_sharding.py   - Tests for the sharded generation of puzzle batches
+    test_solver.py     - Tests for the Solver class
+    test_stats.py      - Tests for the instrumentation counters and timers
+    test_uniqueness.py - Tests for the UniquenessChecker class
+    test_validator.py  - Tests for the bulk validator
 """
\ No newline at end of file
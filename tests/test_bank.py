@@ -0,0 +1,118 @@
+""" Tests for the bank module.
+This module contains unit tests for the `PuzzleBank` class and the `write_bank` function in the Sudoku game.
+"""
+from core.bank import PuzzleBank, write_bank
+from core.game import Game
+from core.generator import Generator
+import pytest
+
+@pytest.fixture(scope="module")
+def puzzles():
+    generator = Generator(seed=10)
+    result = []
+    for level in ["expert", "easy", "hard", "medium", "easy"]:
+        givens, solution = generator.generate(level)
+        result.append((givens, solution, generator.get_last_grade()))
+    return result
+
+@pytest.fixture
+def bank(tmp_path, puzzles):
+    path = tmp_path / "bank.bin"
+    assert write_bank(str(path), puzzles) == len(puzzles)
+    bank = PuzzleBank(str(path), seed=1)
+    yield bank
+    bank.close()
+
+# ----------------------------------------------------------------------
+# METHOD write_bank, get_record
+# ----------------------------------------------------------------------
+def test_records_round_trip(bank, puzzles):
+    records = [bank.get_record(number) for number in range(bank.get_count())]
+    assert sorted((g, s) for g, s, _ in records) == sorted((g, s) for g, s, _ in puzzles)
+    for givens, solution, grade in records:
+        original = next(p for p in puzzles if p[0] == givens)
+        assert grade["level"] == original[2]["level"]
+        assert grade["rating"] == pytest.approx(original[2]["rating"])
+    # Records are sorted by level, then rating
+    keys = [(["easy", "medium", "hard", "expert"].index(r[2]["level"]), r[2]["rating"]) for r in records]
+    assert keys == sorted(keys)
+
+def test_get_record_out_of_bounds(bank):
+    with pytest.raises(IndexError):
+        bank.get_record(bank.get_count())
+
+# ----------------------------------------------------------------------
+# METHOD get_count, get_puzzle
+# ----------------------------------------------------------------------
+def test_get_count(bank, puzzles):
+    assert bank.get_count() == 5
+    assert bank.get_count("easy") == 2
+    assert bank.get_count("expert") == 1
+    rating = next(p[2]["rating"] for p in puzzles if p[2]["level"] == "hard")
+    assert bank.get_count("hard", min_rating=rating, max_rating=rating) == 1
+    assert bank.get_count("hard", min_rating=rating + 0.1) == 0
+
+def test_get_puzzle(bank):
+    for _ in range(10):
+        givens, solution, grade = bank.get_puzzle("easy")
+        assert grade["level"] == "easy"
+        assert all(g in (0, s) for g, s in zip(givens, solution))
+    with pytest.raises(ValueError):
+        bank.get_puzzle("invalid")
+
+def test_get_puzzle_empty_range(bank):
+    with pytest.raises(ValueError):
+        bank.get_puzzle("easy", min_rating=4.0)
+
+def test_empty_bank(tmp_path):
+    path = tmp_path / "empty.bin"
+    assert write_bank(str(path), []) == 0
+    bank = PuzzleBank(str(path))
+    assert bank.get_count() == 0
+    bank.close()
+
+def test_write_failure_removes_temporary(tmp_path, puzzles):
+    path = tmp_path / "bad.bin"
+    givens, solution, grade = puzzles[0]
+    with pytest.raises(ValueError):
+        write_bank(str(path), [puzzles[0], (givens, solution, dict(grade, level="invalid"))])
+    assert list(tmp_path.iterdir()) == []
+
+def test_write_failure_keeps_previous_bank(tmp_path, puzzles):
+    path = tmp_path / "bank.bin"
+    write_bank(str(path), puzzles[:2])
+    data = path.read_bytes()
+    def interrupted():
+        yield from puzzles
+        raise KeyboardInterrupt
+    with pytest.raises(KeyboardInterrupt):
+        write_bank(str(path), interrupted())
+    assert path.read_bytes() == data
+    assert list(tmp_path.iterdir()) == [path]
+
+@pytest.mark.parametrize("change", [
+    lambda givens, solution: solution.__setitem__(0, 10),
+    lambda givens, solution: solution.__setitem__(0, 0),
+    lambda givens, solution: givens.__setitem__(givens.index(0), solution[givens.index(0)] % 9 + 1),
+])
+def test_write_invalid_solution(tmp_path, puzzles, change):
+    givens, solution, grade = puzzles[0]
+    givens, solution = givens[:], solution[:]
+    change(givens, solution)
+    with pytest.raises(ValueError):
+        write_bank(str(tmp_path / "bad.bin"), [(givens, solution, grade)])
+
+def test_invalid_file(tmp_path):
+    path = tmp_path / "bad.bin"
+    path.write_bytes(b"not a bank" * 100)
+    with pytest.raises(ValueError):
+        PuzzleBank(str(path))
+
+# ----------------------------------------------------------------------
+# INTEGRATION WITH Game
+# ----------------------------------------------------------------------
+def test_game_uses_bank(bank):
+    g = Game("medium", source=bank)
+    g.start_game()
+    assert g.get_grade()["level"] == "medium"
+    assert sum(g.get_board().is_fixed(i, j) for i in range(9) for j in range(9)) > 0
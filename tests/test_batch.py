@@ -0,0 +1,55 @@
+""" Tests for the batch module.
+This module contains unit tests for the batch mode of the Sudoku CLI.
+"""
+from cli.batch import format_grid, parse_puzzle, run_generate, run_solve
+import pytest
+
+PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+SOLUTION = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+UNSOLVABLE = "11" + "." * 79
+
+# ----------------------------------------------------------------------
+# METHOD parse_puzzle, format_grid
+# ----------------------------------------------------------------------
+def test_parse_and_format():
+    values = parse_puzzle(PUZZLE + "\n")
+    assert len(values) == 81 and values[:3] == [5, 3, 0]
+    assert parse_puzzle(PUZZLE.replace(".", "0")) == values
+    assert format_grid(values) == PUZZLE
+
+def test_parse_invalid():
+    with pytest.raises(ValueError):
+        parse_puzzle(PUZZLE[:80])
+    with pytest.raises(ValueError):
+        parse_puzzle("x" + PUZZLE[1:])
+
+# ----------------------------------------------------------------------
+# METHOD run_solve
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_solve_keeps_order(tmp_path, workers):
+    lines = [PUZZLE, "", UNSOLVABLE, "bad line"] + [PUZZLE] * 10
+    source = tmp_path / "puzzles.txt"
+    source.write_text("\n".join(lines) + "\n")
+    target = tmp_path / "solutions.txt"
+    assert run_solve(str(source), str(target), workers=workers, chunk_size=3) == 13
+    results = [line.split("\t") for line in target.read_text().splitlines()]
+    assert [solution for solution, _ in results] == [SOLUTION, "unsolvable", "invalid"] + [SOLUTION] * 10
+    assert all(float(elapsed) >= 0 for _, elapsed in results)
+
+def test_run_solve_invalid_workers(tmp_path):
+    with pytest.raises(ValueError):
+        run_solve(str(tmp_path / "none.txt"), workers=0)
+
+# ----------------------------------------------------------------------
+# METHOD run_generate
+# ----------------------------------------------------------------------
+def test_run_generate(tmp_path):
+    target = tmp_path / "puzzles.txt"
+    assert run_generate("easy", 2, str(target), seed=9, start=4, workers=1) == 2
+    lines = [line.split("\t") for line in target.read_text().splitlines()]
+    assert [index for index, _, _, _ in lines] == ["4", "5"]
+    assert all(level == "easy" for _, _, _, level in lines)
+    index, givens, solution, _ = lines[0]
+    assert format_grid(parse_puzzle(givens)) == givens
+    assert all(g == "." or g == s for g, s in zip(givens, solution))
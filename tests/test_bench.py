@@ -0,0 +1,66 @@
+""" Tests for the bench module.
+This module contains unit tests for the benchmarks of the Sudoku game.
+"""
+from bench.bench import BENCHMARKS, compare, import_times, run_bench, time_callable
+import json
+import pytest
+
+# ----------------------------------------------------------------------
+# METHOD time_callable
+# ----------------------------------------------------------------------
+def test_time_callable():
+    result = time_callable(lambda: sum(range(10)), repeat=3, min_time=0.001)
+    assert result["best_ns"] > 0
+    assert result["median_ns"] >= result["best_ns"]
+    assert result["number"] >= 1
+    assert result["relative"] > 0
+
+def test_benchmarks_run():
+    for factory in BENCHMARKS.values():
+        factory()()
+
+# ----------------------------------------------------------------------
+# METHOD import_times
+# ----------------------------------------------------------------------
+def test_import_times():
+    times = import_times(limit=None)
+    assert times[0][0] == "sudoku" and times[0][1] > 0
+    assert [time for _, time in times] == sorted((time for _, time in times), reverse=True)
+    assert len(import_times(limit=3)) == 3
+
+def test_startup_imports_no_mode():
+    # Importing sudoku.py must not load the modules of the modes, which are imported once a mode is selected
+    modules = {name for name, _ in import_times(limit=None)}
+    assert not modules & {"gui", "pygame", "server", "asyncio", "cli", "bench", "core.game", "concurrent.futures", "cProfile"}
+
+# ----------------------------------------------------------------------
+# METHOD compare
+# ----------------------------------------------------------------------
+def test_compare():
+    baseline = {"benchmarks": {"fast": {"relative": 1.0}, "slow": {"relative": 1.0}}}
+    results = {"fast": {"relative": 1.1}, "slow": {"relative": 2.0}, "new": {"relative": 5.0}}
+    regressions = compare(results, baseline, threshold=0.25)
+    assert [regression["name"] for regression in regressions] == ["slow"]
+    assert regressions[0]["change"] == pytest.approx(1.0)
+
+# ----------------------------------------------------------------------
+# METHOD run_bench
+# ----------------------------------------------------------------------
+def test_run_bench_baseline(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    output = tmp_path / "results.json"
+    names = ["is_valid"]
+    assert run_bench(str(output), str(baseline), update=True, names=names, repeat=1, min_time=0.001) == []
+    assert list(json.loads(baseline.read_text())["benchmarks"]) == names
+    data = json.loads(baseline.read_text())
+    data["benchmarks"]["is_valid"]["relative"] /= 100
+    baseline.write_text(json.dumps(data))
+    regressions = run_bench(str(output), str(baseline), names=names, repeat=1, min_time=0.001)
+    assert [regression["name"] for regression in regressions] == names
+    assert json.loads(output.read_text())["regressions"] == regressions
+
+def test_run_bench_invalid(tmp_path):
+    with pytest.raises(ValueError):
+        run_bench(str(tmp_path / "out.json"), names=["unknown"])
+    with pytest.raises(ValueError):
+        run_bench(str(tmp_path / "out.json"), threshold=0)
@@ -93,6 +93,93 @@ def test_set_number_on_fixed_cell():
     with pytest.raises(PermissionError):
         b.clear_number(0, 0)
 
+# ----------------------------------------------------------------------
+# METHOD lock_number, is_fixed, copy
+# ----------------------------------------------------------------------
+def test_lock_number():
+    b = Board()
+    b.set_number(2, 3, 6)
+    assert not b.is_fixed(2, 3)
+    b.lock_number(2, 3)
+    assert b.is_fixed(2, 3)
+    with pytest.raises(PermissionError):
+        b.set_number(2, 3, 1)
+    with pytest.raises(PermissionError):
+        b.lock_number(2, 3)
+    with pytest.raises(PermissionError):
+        b.lock_number(0, 0)  # empty cell
+
+def test_fixed_cells_from_grid():
+    grid = [[Number(0) for _ in range(9)] for _ in range(9)]
+    grid[4][4] = Number(8, fixed=True)
+    b = Board(grid)
+    assert b.is_fixed(4, 4) and b.get_number(4, 4) == 8
+    assert not b.is_fixed(0, 0)
+
+def test_copy_is_independent():
+    b = Board()
+    b.set_number(0, 0, 5)
+    b.lock_number(0, 0)
+    c = b.copy()
+    c.set_number(8, 8, 1)
+    assert b.get_number(8, 8) == 0
+    assert 1 in b.allowed_numbers(8, 0)
+    assert c.is_fixed(0, 0) and c.get_number(0, 0) == 5
+    assert 1 not in c.allowed_numbers(8, 0)
+
+def test_copy_keeps_subclass():
+    class MyBoard(Board):
+        pass
+    b = MyBoard()
+    b.set_number(0, 0, 5)
+    c = b.copy()
+    assert type(c) is MyBoard
+    assert c.get_number(0, 0) == 5
+
+# ----------------------------------------------------------------------
+# METHOD from_string, to_string, from_bytes, to_bytes
+# ----------------------------------------------------------------------
+PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+
+def test_from_string_to_string():
+    b = Board.from_string(PUZZLE + "\n")
+    assert b.to_string() == PUZZLE
+    assert b.get_number(0, 0) == 5 and b.is_fixed(0, 0)
+    assert b.get_number(0, 2) == 0 and not b.is_fixed(0, 2)
+    assert b.get_filled_count() == 30
+    assert Board.from_string(PUZZLE.replace(".", "0")).to_string() == PUZZLE
+    assert not Board.from_string(PUZZLE, fixed=False).is_fixed(0, 0)
+
+def test_from_string_invalid():
+    with pytest.raises(ValueError):
+        Board.from_string(PUZZLE[:80])
+    with pytest.raises(ValueError):
+        Board.from_string("x" + PUZZLE[1:])
+    with pytest.raises(ValueError):
+        Board.from_string("é" + PUZZLE[1:])
+
+def test_bytes_round_trip():
+    b = Board.from_string(PUZZLE)
+    b.set_number(0, 2, 4)
+    data = b.to_bytes()
+    assert len(data) == 52
+    c = Board.from_bytes(data)
+    assert c.to_string() == b.to_string()
+    assert all(c.is_fixed(i, j) == b.is_fixed(i, j) for i in range(9) for j in range(9))
+    assert c.get_conflict_count() == b.get_conflict_count()
+    assert Board.from_bytes(data, trusted=True).to_string() == b.to_string()
+
+def test_from_bytes_invalid():
+    data = Board.from_string(PUZZLE).to_bytes()
+    with pytest.raises(ValueError):
+        Board.from_bytes(data[:-1])
+    with pytest.raises(ValueError):
+        Board.from_bytes(data[:11] + b"\xff" + data[12:])
+    empty_fixed = bytearray(data)
+    empty_fixed[0] |= 1 << 2  # Cell (0, 2) is empty
+    with pytest.raises(ValueError):
+        Board.from_bytes(bytes(empty_fixed))
+
 # ----------------------------------------------------------------------
 # METHOD allowed_numbers, is_valid
 # ----------------------------------------------------------------------
@@ -118,6 +205,168 @@ def test_is_valid():
     b.set_number(1, 0, 2)
     assert not b.is_valid(1, 0)  # 2 already in row
 
+def test_allowed_mask():
+    b = Board()
+    b.set_number(0, 0, 1)
+    b.set_number(4, 2, 5)
+    b.set_number(2, 1, 9)
+    mask = b.allowed_mask(0, 2)
+    assert [n for n in range(1, 10) if mask >> n & 1] == b.allowed_numbers(0, 2) == [2, 3, 4, 6, 7, 8]
+    with pytest.raises(IndexError):
+        b.allowed_mask(0, 9)
+
+def test_allowed_numbers_after_clear_with_duplicates():
+    b = Board()
+    b.set_number(0, 0, 4)
+    b.set_number(0, 5, 4)
+    b.clear_number(0, 0)
+    assert 4 not in b.allowed_numbers(0, 8)  # still present at (0, 5)
+    b.clear_number(0, 5)
+    assert 4 in b.allowed_numbers(0, 8)
+
+def test_allowed_numbers_matches_scan():
+    grid = [[Number(((i*3 + i//3 + j) % 9) + 1 if (i + j) % 3 else 0) for j in range(9)] for i in range(9)]
+    b = Board(grid)
+    for i in range(9):
+        for j in range(9):
+            used = set(b._get_row(i) + b._get_column(j) + b._get_subgrid(i, j))
+            assert b.allowed_numbers(i, j) == [n for n in range(1, 10) if n not in used]
+
+# ----------------------------------------------------------------------
+# METHOD is_complete, get_filled_count, get_conflict_count, conflicting_cells
+# ----------------------------------------------------------------------
+def test_is_complete():
+    b = Board()
+    assert not b.is_complete()
+    for i in range(9):
+        for j in range(9):
+            b.set_number(i, j, ((i*3 + i//3 + j) % 9) + 1)
+    assert b.get_filled_count() == 81
+    assert b.is_complete()
+    b.clear_number(4, 4)
+    assert b.get_filled_count() == 80
+    assert not b.is_complete()
+
+def test_conflicts():
+    b = Board()
+    b.set_number(0, 0, 1)
+    b.set_number(0, 4, 1)  # same row
+    b.set_number(1, 1, 1)  # same subgrid as (0, 0)
+    assert b.get_conflict_count() == 2
+    assert b.conflicting_cells() == [(0, 0), (0, 4), (1, 1)]
+    b.set_number(0, 4, 2)
+    assert b.get_conflict_count() == 1
+    assert b.conflicting_cells() == [(0, 0), (1, 1)]
+    b.clear_number(1, 1)
+    assert b.get_conflict_count() == 0
+    assert b.conflicting_cells() == []
+
+def test_conflicts_from_grid_and_copy():
+    grid = [[Number(0) for _ in range(9)] for _ in range(9)]
+    grid[0][0] = Number(5)
+    grid[8][0] = Number(5)
+    b = Board(grid)
+    c = b.copy()
+    assert b.get_filled_count() == c.get_filled_count() == 2
+    assert c.conflicting_cells() == [(0, 0), (8, 0)]
+    c.clear_number(8, 0)
+    assert c.get_conflict_count() == 0
+    assert b.get_conflict_count() == 1
+
+def test_loaded_counters_match_moves():
+    text = "111" + "." * 6 + "1" + "." * 8 + "5" * 9 + "." * 54
+    loaded = Board.from_string(text, fixed=False)
+    moved = Board()
+    for index, char in enumerate(text):
+        if char != ".":
+            moved.set_number(index // 9, index % 9, int(char))
+    assert loaded.get_filled_count() == moved.get_filled_count() == 13
+    assert loaded.get_conflict_count() == moved.get_conflict_count()
+    assert loaded._counts == moved._counts and loaded._masks == moved._masks
+    assert loaded._unit_conflicts == moved._unit_conflicts
+
+# ----------------------------------------------------------------------
+# METHOD add_listener, remove_listener
+# ----------------------------------------------------------------------
+def test_listeners():
+    b = Board()
+    changes = []
+    listener = lambda *change: changes.append(change)
+    b.add_listener(listener)
+    b.set_number(0, 0, 5)
+    b.clear_number(0, 0)
+    assert changes == [(0, 0, 0, 5), (0, 0, 5, 0)]
+    assert b.copy()._listeners == ()
+    b.remove_listener(listener)
+    b.set_number(1, 1, 3)
+    assert len(changes) == 2
+    with pytest.raises(TypeError):
+        b.add_listener("not callable")
+
+# ----------------------------------------------------------------------
+# METHOD undo, redo, snapshot, restore
+# ----------------------------------------------------------------------
+def test_undo_redo():
+    b = Board()
+    assert b.undo() is None
+    b.set_number(0, 0, 5)
+    b.set_number(0, 0, 6)
+    b.clear_number(0, 0)
+    assert b.undo() == (0, 0)
+    assert b.get_number(0, 0) == 6
+    assert b.undo() == (0, 0)
+    assert b.get_number(0, 0) == 5
+    assert b.redo() == (0, 0)
+    assert b.get_number(0, 0) == 6
+    b.set_number(4, 4, 1)
+    assert b.redo() is None
+    assert b.undo() == (4, 4)
+    assert b.get_number(4, 4) == 0
+    assert b.get_filled_count() == 1
+
+def test_undo_restores_conflicts_and_notifies():
+    b = Board()
+    changes = []
+    b.add_listener(lambda *change: changes.append(change))
+    b.set_number(0, 0, 5)
+    b.set_number(0, 8, 5)
+    assert b.get_conflict_count() == 1
+    b.undo()
+    assert b.get_conflict_count() == 0
+    assert changes[-1] == (0, 8, 5, 0)
+
+def test_no_op_change_not_recorded():
+    b = Board()
+    b.set_number(0, 0, 5)
+    b.set_number(0, 0, 5)
+    b.clear_number(1, 1)
+    assert b.undo() == (0, 0)
+    assert b.undo() is None
+
+def test_lock_clears_journal():
+    b = Board()
+    b.set_number(0, 0, 5)
+    b.lock_number(0, 0)
+    assert b.undo() is None
+    assert b.get_number(0, 0) == 5
+    assert b.copy().undo() is None
+
+def test_snapshot_restore():
+    b = Board()
+    b.set_number(0, 0, 1)
+    marker = b.snapshot()
+    b.set_number(1, 1, 2)
+    b.set_number(2, 2, 3)
+    b.undo()
+    b.restore(marker)
+    assert b.get_number(1, 1) == 0
+    assert b.get_number(0, 0) == 1
+    assert b.redo() is None
+    with pytest.raises(ValueError):
+        b.restore(marker + 1)
+    with pytest.raises(ValueError):
+        b.restore("marker")
+
 # ----------------------------------------------------------------------
 # INTERNAL METHODS (PRIVATE)
 # ----------------------------------------------------------------------
@@ -150,4 +399,45 @@ def test_manipulate_full_and_empty_board():
             b.clear_number(i, j)
     for i in range(9):
         for j in range(9):
-            assert b.get_number(i, j) == 0
\ No newline at end of file
+            assert b.get_number(i, j) == 0
+# ----------------------------------------------------------------------
+# METHOD get_box_size, get_size (larger boards)
+# ----------------------------------------------------------------------
+def test_board_sizes():
+    assert Board().get_box_size() == 3 and Board().get_size() == 9
+    assert Board(box_size=2).get_size() == 4
+    assert Board(box_size=4).get_size() == 16
+    assert Board(box_size=5).get_size() == 25
+    with pytest.raises(ValueError):
+        Board(box_size=6)
+    with pytest.raises(ValueError):
+        Board(box_size=1)
+
+def test_large_board_set_get_and_conflicts():
+    b = Board(box_size=4)
+    b.set_number(15, 15, 16)
+    assert b.get_number(15, 15) == 16
+    assert 16 not in b.allowed_numbers(15, 0)
+    assert 16 in b.allowed_numbers(0, 0)
+    with pytest.raises(ValueError):
+        b.set_number(0, 0, 17)
+    with pytest.raises(IndexError):
+        b.set_number(16, 0, 1)
+    b.set_number(12, 12, 16)  # same box
+    assert b.get_conflict_count() == 1
+    assert b.conflicting_cells() == [(12, 12), (15, 15)]
+    assert b.undo() == (12, 12)
+    assert b.get_conflict_count() == 0
+
+def test_large_board_string_and_bytes():
+    text = "1" + "." * 254 + "G"
+    b = Board.from_string(text)
+    assert b.get_size() == 16
+    assert b.to_string() == text
+    assert b.get_number(15, 15) == 16 and b.is_fixed(15, 15)
+    assert Board.from_bytes(b.to_bytes(), box_size=4).to_string() == text
+    b = Board(box_size=5)
+    b.set_number(24, 24, 25)
+    assert b.to_string()[-1] == "P"
+    assert Board.from_bytes(b.to_bytes(), box_size=5).get_number(24, 24) == 25
+    assert len(Board.from_string("1234" + "." * 12).to_string()) == 16
@@ -0,0 +1,77 @@
+""" Tests for the cache module.
+This module contains unit tests for the `SolutionCache` class in the Sudoku game.
+"""
+from core.cache import SolutionCache
+from core.generator import Generator
+import random
+import pytest
+
+PUZZLE = [int(c) for c in "530070000600195000098000060800060003400803001700020006060000280000419005000080079"]
+SOLUTION = [int(c) for c in "534678912672195348198342567859761423426853791713924856961537284287419635345286179"]
+
+def relabeled(values, digits):
+    return [digits[value] for value in values]
+
+# ----------------------------------------------------------------------
+# METHOD __init__
+# ----------------------------------------------------------------------
+def test_init_invalid_size():
+    with pytest.raises(ValueError):
+        SolutionCache(max_size=0)
+
+# ----------------------------------------------------------------------
+# METHOD get_solution, get_stats
+# ----------------------------------------------------------------------
+def test_get_solution_hits_and_misses():
+    cache = SolutionCache()
+    assert cache.get_solution(PUZZLE) == SOLUTION
+    assert cache.get_solution(PUZZLE) == SOLUTION
+    assert cache.get_stats() == {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+
+def test_get_solution_unsolvable():
+    cache = SolutionCache()
+    puzzle = [1, 1] + [0] * 79
+    assert cache.get_solution(puzzle) is None
+    assert cache.get_solution(puzzle) is None
+    assert cache.get_stats()["hits"] == 1
+
+def test_get_solution_invalid():
+    with pytest.raises(ValueError):
+        SolutionCache().get_solution([0] * 80)
+
+def test_lru_eviction():
+    generator = Generator(seed=8)
+    puzzles = [generator.generate("easy")[0] for _ in range(3)]
+    cache = SolutionCache(max_size=2)
+    cache.get_solution(puzzles[0])
+    cache.get_solution(puzzles[1])
+    cache.get_solution(puzzles[0])  # puzzles[1] is now the least recently used
+    cache.get_solution(puzzles[2])
+    assert cache.get_stats() == {"hits": 1, "misses": 3, "evictions": 1, "size": 2}
+    cache.get_solution(puzzles[0])
+    assert cache.get_stats()["hits"] == 2
+    cache.get_solution(puzzles[1])
+    assert cache.get_stats()["misses"] == 4
+
+# ----------------------------------------------------------------------
+# METHOD put, clear
+# ----------------------------------------------------------------------
+def test_put_and_clear():
+    cache = SolutionCache()
+    cache.put(PUZZLE, SOLUTION)
+    assert cache.get_solution(PUZZLE) == SOLUTION
+    assert cache.get_stats()["hits"] == 1
+    cache.clear()
+    assert cache.get_stats() == {"hits": 0, "misses": 0, "evictions": 0, "size": 0}
+
+# ----------------------------------------------------------------------
+# CANONICAL KEYS
+# ----------------------------------------------------------------------
+def test_canonical_keys_share_entries():
+    cache = SolutionCache(canonical=True)
+    digits = [0] + random.Random(3).sample(range(1, 10), 9)
+    assert cache.get_solution(PUZZLE) == SOLUTION
+    assert cache.get_solution(relabeled(PUZZLE, digits)) == relabeled(SOLUTION, digits)
+    transposed = [PUZZLE[col * 9 + row] for row in range(9) for col in range(9)]
+    assert cache.get_solution(transposed) == [SOLUTION[col * 9 + row] for row in range(9) for col in range(9)]
+    assert cache.get_stats() == {"hits": 2, "misses": 1, "evictions": 0, "size": 1}
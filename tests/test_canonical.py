@@ -0,0 +1,87 @@
+""" Tests for the canonical module.
+This module contains unit tests for the canonical form of Sudoku grids.
+"""
+from core.board import Board
+from core.canonical import apply_transform, canonical_form, canonicalize, invert_transform
+from core.generator import Generator
+import random
+import pytest
+
+def random_symmetry(values, rng):
+    """ Apply a random symmetry of Sudoku to a grid of 81 values. """
+    def line_order():
+        blocks = rng.sample(range(3), 3)
+        return [block * 3 + offset for block in blocks for offset in rng.sample(range(3), 3)]
+    rows, cols = line_order(), line_order()
+    digits = [0] + rng.sample(range(1, 10), 9)
+    grid = [values[row * 9 + col] for row in rows for col in cols]
+    if rng.random() < 0.5:
+        grid = [grid[col * 9 + row] for row in range(9) for col in range(9)]
+    return [digits[value] for value in grid]
+
+def relabeled(values):
+    """ Relabel the digits of a grid in order of first appearance. """
+    labels = {0: 0}
+    return "".join(str(labels.setdefault(value, len(labels))) for value in values)
+
+@pytest.fixture(scope="module")
+def puzzles():
+    generator = Generator(seed=21)
+    return [generator.generate(level) for level in ("easy", "hard", "expert")]
+
+# ----------------------------------------------------------------------
+# METHOD canonical_form
+# ----------------------------------------------------------------------
+def test_canonical_form_is_invariant(puzzles):
+    rng = random.Random(5)
+    for givens, solution in puzzles:
+        for values in (givens, solution):
+            key = canonical_form(values)
+            assert len(key) == 81
+            for _ in range(3):
+                assert canonical_form(random_symmetry(values, rng)) == key
+
+def test_canonical_form_is_minimal(puzzles):
+    rng = random.Random(6)
+    givens, solution = puzzles[0]
+    for values in (givens, solution):
+        key = canonical_form(values)
+        assert key == relabeled([int(c) for c in key])
+        for _ in range(50):
+            assert key <= relabeled(random_symmetry(values, rng))
+
+def test_canonical_form_tells_puzzles_apart(puzzles):
+    keys = {canonical_form(givens) for givens, _ in puzzles}
+    assert len(keys) == len(puzzles)
+
+def test_canonical_form_of_board(puzzles):
+    givens, _ = puzzles[1]
+    b = Board()
+    for index, value in enumerate(givens):
+        b.set_number(index // 9, index % 9, value)
+    assert canonical_form(b) == canonical_form(givens)
+
+def test_canonical_form_sparse_grids():
+    assert canonical_form([0] * 81) == "0" * 81
+    values = [0] * 81
+    values[0], values[80] = 7, 7
+    other = [0] * 81
+    other[13], other[61] = 2, 2  # also in different bands and stacks
+    assert canonical_form(values) == canonical_form(other)
+
+def test_canonical_form_invalid():
+    with pytest.raises(TypeError):
+        canonical_form("not a grid")
+    with pytest.raises(ValueError):
+        canonical_form([0] * 80)
+
+# ----------------------------------------------------------------------
+# METHOD canonicalize, apply_transform, invert_transform
+# ----------------------------------------------------------------------
+def test_transform_round_trip(puzzles):
+    givens, solution = puzzles[2]
+    key, transform = canonicalize(givens)
+    assert "".join(map(str, apply_transform(givens, transform))) == key
+    canonical_solution = apply_transform(solution, transform)
+    assert all(c == "0" or int(c) == v for c, v in zip(key, canonical_solution))
+    assert invert_transform(canonical_solution, transform) == solution
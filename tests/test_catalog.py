@@ -0,0 +1,66 @@
+""" Tests for the catalog module.
+This module contains unit tests for the `PuzzleCatalog` class in the Sudoku game.
+"""
+from core.catalog import PuzzleCatalog, make_id, parse_id
+from core.generator import GENERATOR_VERSION, Generator
+import pytest
+
+# Puzzle of the ID "2-hard-0000000000003039", which must not change while GENERATOR_VERSION is 2
+GIVENS = "000009500000080003803006901000000042700860000000095070420000008006000000005700000"
+SOLUTION = "614329587297581463853476921569137842732864159148295376421653798376948215985712634"
+
+# ----------------------------------------------------------------------
+# METHOD make_id, parse_id
+# ----------------------------------------------------------------------
+def test_make_and_parse_id():
+    puzzle_id = make_id("hard", 12345)
+    assert puzzle_id == f"{GENERATOR_VERSION}-hard-0000000000003039"
+    assert parse_id(puzzle_id) == (GENERATOR_VERSION, "hard", 12345)
+    assert parse_id(make_id("easy", 2 ** 64 - 1))[2] == 2 ** 64 - 1
+
+@pytest.mark.parametrize("puzzle_id", [
+    "", "1-hard", "1-impossible-ff", "x-hard-ff", "1-hard-zz", "1-hard-" + "f" * 17, None,
+    "1-hard-3039", "01-hard-0000000000003039", "1-hard-+000000000003039", "1-hard-00000000_0003039",
+    " 1-hard-0000000000003039", "1-hard-0000000000003039\n", "1-hard-000000000000303F", "\u0661-hard-0000000000003039",
+])
+def test_parse_invalid_id(puzzle_id):
+    with pytest.raises(ValueError):
+        parse_id(puzzle_id)
+
+def test_make_invalid_id():
+    with pytest.raises(ValueError):
+        make_id("impossible", 1)
+    with pytest.raises(ValueError):
+        make_id("easy", -1)
+    with pytest.raises(ValueError):
+        make_id("easy", 2 ** 64)
+
+# ----------------------------------------------------------------------
+# METHOD get_puzzle, new_id, get_stats
+# ----------------------------------------------------------------------
+def test_get_puzzle_is_reproducible():
+    givens, solution, grade = PuzzleCatalog().get_puzzle(make_id("hard", 12345))
+    if GENERATOR_VERSION == 2:
+        assert "".join(map(str, givens)) == GIVENS
+        assert "".join(map(str, solution)) == SOLUTION
+    assert (givens, solution) == Generator(12345).generate("hard")
+    assert grade["level"] == "hard"
+
+def test_get_puzzle_cache():
+    catalog = PuzzleCatalog(max_size=1, seed=3)
+    first, second = catalog.new_id("easy"), catalog.new_id("easy")
+    assert first != second and parse_id(first)[1] == "easy"
+    puzzle = catalog.get_puzzle(first)
+    puzzle[0][:] = [0] * 81  # callers get copies
+    assert catalog.get_puzzle(first)[0] != [0] * 81
+    catalog.get_puzzle(second)
+    assert catalog.get_stats() == {"hits": 1, "misses": 2, "size": 1}
+    assert PuzzleCatalog(seed=3).new_id("easy") == first
+
+def test_get_puzzle_other_version():
+    with pytest.raises(ValueError):
+        PuzzleCatalog().get_puzzle(f"{GENERATOR_VERSION + 1}-easy-0000000000000001")
+
+def test_init_invalid_size():
+    with pytest.raises(ValueError):
+        PuzzleCatalog(max_size=0)
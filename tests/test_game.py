@@ -1,9 +1,14 @@
 """ Tests for the game module.
 This module contains unit tests for the `Game` class in the Sudoku game.
 """
-from core.game import Game
+from core.game import Game, find_hint
 from core.board import Board
+from core.cache import SolutionCache
+from core.catalog import PuzzleCatalog
+from core import stats
+from core.logic import TECHNIQUES
 import pytest
+import time
 
 # ----------------------------------------------------------------------
 # METHOD __init__
@@ -54,6 +59,177 @@ def test_start_game_sets_status_and_fills_board():
     # The board must contain fixed numbers
     fixed_count = sum(g.get_board().get_number(i, j) != 0 for i in range(9) for j in range(9))
     assert fixed_count > 0
+    assert all(g.get_board().is_fixed(i, j) == (g.get_board().get_number(i, j) != 0) for i in range(9) for j in range(9))
+    assert g.get_generation_time() > 0.0
+
+def test_start_game_from_puzzle_id():
+    catalog = PuzzleCatalog()
+    g = Game("easy", catalog=catalog)
+    assert g.get_puzzle_id() is None
+    g.start_game()
+    puzzle_id = g.get_puzzle_id()
+    assert puzzle_id.split("-")[1] == "easy"
+    other = Game("expert", catalog=catalog)
+    other.start_game(puzzle_id)
+    assert other.get_level() == "easy" and other.get_puzzle_id() == puzzle_id
+    assert str(other.get_board()) == str(g.get_board())
+    assert catalog.get_stats()["hits"] == 1
+    with pytest.raises(ValueError):
+        other.start_game("not an id")
+
+def test_init_invalid_catalog():
+    with pytest.raises(TypeError):
+        Game("easy", catalog="not a catalog")
+
+# ----------------------------------------------------------------------
+# METHOD get_solution, get_mistakes
+# ----------------------------------------------------------------------
+def test_get_solution_uses_cache():
+    cache = SolutionCache()
+    g = Game("easy", cache=cache)
+    g.start_game()
+    solution = g.get_solution()
+    assert all(g.get_board().get_number(i, j) in (0, solution[i * 9 + j]) for i in range(9) for j in range(9))
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 0
+
+def test_get_mistakes():
+    g = Game("easy", cache=SolutionCache())
+    g.start_game()
+    solution = g.get_solution()
+    empty = [index for index in range(81) if g.get_board().get_number(index // 9, index % 9) == 0]
+    right, wrong = empty[0], empty[1]
+    g.get_board().set_number(right // 9, right % 9, solution[right])
+    g.get_board().set_number(wrong // 9, wrong % 9, solution[wrong] % 9 + 1)
+    assert g.get_mistakes() == [(wrong // 9, wrong % 9)]
+
+def test_init_invalid_cache():
+    with pytest.raises(TypeError):
+        Game("easy", cache="not a cache")
+
+# ----------------------------------------------------------------------
+# METHOD get_stats
+# ----------------------------------------------------------------------
+def test_get_stats():
+    stats.reset()
+    stats.enable()
+    try:
+        g = Game("easy", cache=SolutionCache())
+        g.start_game()
+        data = g.get_stats()
+    finally:
+        stats.disable()
+        stats.reset()
+    assert data["counters"]["game.puzzles"] == 1
+    assert data["counters"]["generator.puzzles.easy"] == 1
+    assert data["cache"]["size"] == 1
+    assert data["generation_time"] == g.get_generation_time()
+    g.stop_hints()
+
+# ----------------------------------------------------------------------
+# METHOD undo, redo
+# ----------------------------------------------------------------------
+def test_undo_redo_moves():
+    g = Game("easy")
+    g.start_game()
+    assert g.undo() is None
+    index = next(index for index in range(81) if g.get_board().get_number(index // 9, index % 9) == 0)
+    g.get_board().set_number(index // 9, index % 9, 1)
+    assert g.undo() == (index // 9, index % 9)
+    assert g.get_board().get_number(index // 9, index % 9) == 0
+    assert g.redo() == (index // 9, index % 9)
+    assert g.get_board().get_number(index // 9, index % 9) == 1
+    g.stop_hints()
+
+# ----------------------------------------------------------------------
+# METHOD hint, stop_hints
+# ----------------------------------------------------------------------
+def test_hint_is_correct_move():
+    g = Game("hard", cache=SolutionCache())
+    g.start_game()
+    solution = g.get_solution()
+    for _ in range(5):
+        row, col, digit, technique = g.hint()
+        assert g.get_board().get_number(row, col) == 0
+        assert digit == solution[row * 9 + col]
+        assert technique in TECHNIQUES or technique == "solution"
+        g.get_board().set_number(row, col, digit)
+    g.stop_hints()
+
+def test_hint_ignores_mistakes():
+    g = Game("easy", cache=SolutionCache())
+    g.start_game()
+    solution = g.get_solution()
+    empty = [index for index in range(81) if g.get_board().get_number(index // 9, index % 9) == 0]
+    for index in empty[:-1]:
+        g.get_board().set_number(index // 9, index % 9, solution[index])
+    wrong = empty[0]
+    g.get_board().set_number(wrong // 9, wrong % 9, solution[wrong] % 9 + 1)
+    hints = {g.hint()[:3]}
+    assert hints <= {(wrong // 9, wrong % 9, solution[wrong]), (empty[-1] // 9, empty[-1] % 9, solution[empty[-1]])}
+    g.stop_hints()
+
+def test_hint_precomputed_after_change():
+    g = Game("medium", cache=SolutionCache())
+    g.start_game()
+    row, col, digit, _ = g.hint()
+    g.get_board().set_number(row, col, digit)
+    deadline = time.monotonic() + 10
+    while g._hint is None or g._hint[0] != g._hint_version:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+    precomputed = g._hint[1]
+    assert g.hint() == precomputed
+    g.stop_hints()
+
+def test_hint_complete_board():
+    g = Game("easy", cache=SolutionCache())
+    g.start_game()
+    solution = g.get_solution()
+    for index in range(81):
+        if not g.get_board().is_fixed(index // 9, index % 9):
+            g.get_board().set_number(index // 9, index % 9, solution[index])
+    assert g.hint() is None
+    g.stop_hints()
+
+def test_find_hint_without_thread():
+    g = Game("medium", cache=SolutionCache())
+    g.start_game()
+    hint = find_hint(g.get_board())
+    assert g._hint_thread is None
+    assert hint == g.hint()
+    assert find_hint(g.get_board(), is_stale=lambda: True) is None
+    g.stop_hints()
+
+def test_hint_computed_once(monkeypatch):
+    g = Game("easy", cache=SolutionCache())
+    g.start_game()
+    calls = []
+    compute = g._compute_hint
+    monkeypatch.setattr(g, "_compute_hint", lambda board, version: calls.append(version) or compute(board, version))
+    hint = g.hint()
+    assert hint is not None and g.hint() == hint
+    assert calls == [g._hint_version]
+    g.stop_hints()
+
+def test_hint_thread_stopped_by_reset_and_set_board():
+    g = Game("easy")
+    g.start_game()
+    g.hint()
+    thread = g._hint_thread
+    g.reset_game()
+    assert g._hint_thread is None and not thread.is_alive()
+    g.hint()
+    thread = g._hint_thread
+    g.set_board(Board())
+    assert g._hint_thread is None and not thread.is_alive()
+
+def test_context_manager_stops_hints():
+    with Game("easy") as g:
+        g.start_game()
+        assert g.hint() is not None
+        thread = g._hint_thread
+    assert g._hint_thread is None and not thread.is_alive()
 
 # ----------------------------------------------------------------------
 # METHOD reset_game
@@ -96,6 +272,7 @@ def test_clear_board():
 def test_is_board_valid_true():
     g = Game("easy")
     g.start_game()
+    g._clear_board()  # Givens are fixed, start from an empty board
     # Fill the grid with a valid solution
     for i in range(9):
         for j in range(9):
@@ -105,6 +282,7 @@ def test_is_board_valid_true():
 def test_is_board_valid_false():
     g = Game("easy")
     g.start_game()
+    g._clear_board()  # Givens are fixed, start from an empty board
     # Put the same number twice in a row
     g._board.set_number(0, 0, 1)
     g._board.set_number(0, 1, 1)
@@ -118,6 +296,24 @@ def test_set_board_typeerror():
     with pytest.raises(TypeError):
         g.set_board("not a board")
 
+def test_set_board_not_9x9():
+    g = Game("easy")
+    with pytest.raises(ValueError):
+        g.set_board(Board(box_size=2))
+    with pytest.raises(ValueError):
+        find_hint(Board(box_size=2))
+
+def test_hint_raises_error_of_thread(monkeypatch):
+    g = Game("easy")
+    g.start_game()
+    def fail(board, version):
+        raise RuntimeError("broken")
+    monkeypatch.setattr(g, "_compute_hint", fail)
+    with pytest.raises(RuntimeError):
+        g.hint()
+    assert g._hint_thread.is_alive()
+    g.stop_hints()
+
 def test_set_status_valueerror():
     g = Game("easy")
     with pytest.raises(ValueError):
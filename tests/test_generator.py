@@ -0,0 +1,111 @@
+""" Tests for the generator module.
+This module contains unit tests for the `Generator` class in the Sudoku game.
+"""
+from core.generator import Generator, LEVEL_CLUES, _unavoidable_sets
+from core.logic import LogicSolver
+from core import stats
+import pytest
+
+def count_solutions(values, limit=2):
+    """ Count the solutions of a grid by plain backtracking, stopping at `limit`. """
+    try:
+        index = values.index(0)
+    except ValueError:
+        return 1
+    row, col = index // 9, index % 9
+    used = {values[row * 9 + c] for c in range(9)} | {values[r * 9 + col] for r in range(9)}
+    used |= {values[r * 9 + c] for r in range(row // 3 * 3, row // 3 * 3 + 3) for c in range(col // 3 * 3, col // 3 * 3 + 3)}
+    count = 0
+    for digit in range(1, 10):
+        if digit not in used:
+            values[index] = digit
+            count += count_solutions(values, limit - count)
+            values[index] = 0
+            if count >= limit:
+                break
+    return count
+
+def is_complete_grid(values):
+    units = [[r * 9 + c for c in range(9)] for r in range(9)] + [[r * 9 + c for r in range(9)] for c in range(9)]
+    units += [[(b // 3 * 3 + i // 3) * 9 + b % 3 * 3 + i % 3 for i in range(9)] for b in range(9)]
+    return all(sorted(values[i] for i in unit) == list(range(1, 10)) for unit in units)
+
+# ----------------------------------------------------------------------
+# METHOD generate
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("level", ["easy", "medium", "hard", "expert"])
+def test_generate_level(level):
+    g = Generator(seed=2)
+    givens, solution = g.generate(level)
+    assert sum(1 for v in givens if v) <= LEVEL_CLUES[level]
+    assert g.get_last_grade()["level"] == level
+    assert LogicSolver(givens).grade() == g.get_last_grade()
+
+@pytest.mark.parametrize("level", ["easy", "medium", "hard", "expert"])
+def test_generate_valid_and_unique(level):
+    givens, solution = Generator(seed=7).generate(level)
+    assert is_complete_grid(solution)
+    assert all(g == 0 or g == s for g, s in zip(givens, solution))
+    assert count_solutions(givens[:]) == 1
+
+def test_generate_is_reproducible():
+    assert Generator(seed=42).generate("hard") == Generator(seed=42).generate("hard")
+
+def test_generate_gradings_are_bounded(monkeypatch):
+    import core.generator
+    monkeypatch.setattr(core.generator, "MAX_GRADINGS", 5)
+    stats.reset()
+    stats.enable()
+    try:
+        g = Generator(seed=1)
+        givens, solution = g.generate("hard")
+        gradings = stats.get_stats()["counters"]["generator.gradings"]
+    finally:
+        stats.disable()
+        stats.reset()
+    assert gradings == 5
+    assert g.get_last_grade() == LogicSolver(givens).grade()
+    assert count_solutions(givens[:]) == 1
+
+def test_generate_invalid_level():
+    with pytest.raises(ValueError):
+        Generator().generate("impossible")
+
+def test_get_last_duration_and_grade():
+    g = Generator(seed=0)
+    assert g.get_last_duration() == 0.0
+    assert g.get_last_grade() is None
+    g.generate("easy")
+    assert g.get_last_duration() > 0.0
+    assert g.get_last_grade()["solved"] is True
+
+@pytest.mark.parametrize("box_size", [2, 4])
+def test_generate_larger_boards(box_size):
+    from core.board import Board
+    from core.solver import Solver
+    g = Generator(seed=1, box_size=box_size)
+    assert g.get_box_size() == box_size
+    givens, solution = g.generate("easy")
+    cells = box_size ** 4
+    assert len(givens) == len(solution) == cells
+    assert all(v == 0 or v == s for v, s in zip(givens, solution))
+    assert Board.from_string("".join(".123456789ABCDEFG"[v] for v in solution)).is_complete()
+    assert Solver(box_size).count_values(givens, limit=2) == 1
+    assert g.get_last_grade() is None
+
+# ----------------------------------------------------------------------
+# INTERNAL FUNCTIONS (PRIVATE)
+# ----------------------------------------------------------------------
+def test_unavoidable_sets_swap_two_digits():
+    solution = Generator(seed=3)._fill_grid()
+    sets = _unavoidable_sets(solution)
+    assert min(cells.bit_count() for cells in sets) >= 4
+    for cells in sets:
+        indices = [index for index in range(81) if cells >> index & 1]
+        first, second = sorted({solution[index] for index in indices})
+        swapped = solution[:]
+        for index in indices:
+            swapped[index] = first + second - solution[index]
+        assert is_complete_grid(swapped) and swapped != solution
+        givens = [0 if cells >> index & 1 else digit for index, digit in enumerate(solution)]
+        assert count_solutions(givens) == 2
@@ -0,0 +1,93 @@
+""" Tests for the gui module.
+This module contains unit tests for the `BoardRenderer` class of the Sudoku GUI, run without a display.
+"""
+import os
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+pygame = pytest.importorskip("pygame")
+
+from core.board import Board
+from gui.renderer import BoardRenderer
+
+PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+
+@pytest.fixture
+def screen():
+    pygame.init()
+    yield pygame.display.set_mode((600, 600))
+    pygame.quit()
+
+# ----------------------------------------------------------------------
+# METHOD draw
+# ----------------------------------------------------------------------
+def test_first_frame_draws_everything(screen):
+    renderer = BoardRenderer(Board.from_string(PUZZLE))
+    assert renderer.draw(screen) == [pygame.Rect((0, 0), renderer.get_size())]
+    assert renderer.draw(screen) == []
+    renderer.invalidate()
+    assert len(renderer.draw(screen)) == 1
+
+def test_draws_only_changed_cells(screen):
+    board = Board.from_string(PUZZLE)
+    renderer = BoardRenderer(board)
+    renderer.draw(screen)
+    board.set_number(0, 2, 4)
+    assert len(renderer.draw(screen)) == 1
+    board.set_number(0, 2, 5)  # conflicts with the given 5 in (0, 0): both are redrawn
+    assert len(renderer.draw(screen)) == 2
+    board.undo()
+    assert len(renderer.draw(screen)) == 2
+    renderer.set_selection((4, 4))
+    renderer.set_selection((4, 5))
+    assert len(renderer.draw(screen)) == 2
+    renderer.toggle_mark(0, 3, 2)
+    assert len(renderer.draw(screen)) == 1
+
+def test_player_and_conflict_styles(screen, monkeypatch):
+    board = Board.from_string(PUZZLE)
+    renderer = BoardRenderer(board)
+    renderer.draw(screen)
+    styles = []
+    glyph = renderer._glyph
+    monkeypatch.setattr(renderer, "_glyph", lambda number, style: styles.append((number, style)) or glyph(number, style))
+    board.set_number(0, 2, 4)
+    renderer.draw(screen)
+    assert styles == [(4, "player")]
+    styles.clear()
+    board.set_number(0, 2, 5)  # duplicates the given 5 in (0, 0)
+    renderer.draw(screen)
+    assert sorted(styles) == [(5, "conflict"), (5, "fixed")]
+
+def test_glyphs_are_cached(screen):
+    board = Board.from_string(PUZZLE)
+    renderer = BoardRenderer(board)
+    renderer.draw(screen)
+    glyphs = dict(renderer._glyphs)
+    board.set_number(0, 2, 4)
+    renderer.draw(screen)
+    assert all(renderer._glyphs[key] is glyph for key, glyph in glyphs.items())
+
+# ----------------------------------------------------------------------
+# METHOD set_board, cell_at, close
+# ----------------------------------------------------------------------
+def test_set_board_moves_listener(screen):
+    first, second = Board.from_string(PUZZLE), Board()
+    renderer = BoardRenderer(first)
+    renderer.draw(screen)
+    renderer.set_board(second)
+    assert len(renderer.draw(screen)) == 1  # full redraw
+    first.set_number(0, 2, 4)
+    assert renderer.draw(screen) == []
+    renderer.close()
+    second.set_number(0, 0, 1)
+    assert renderer.draw(screen) == []
+
+def test_cell_at():
+    renderer = BoardRenderer(Board(), cell_size=50, origin=(10, 10))
+    assert renderer.cell_at((10, 10)) == (0, 0)
+    assert renderer.cell_at((60, 115)) == (2, 1)
+    assert renderer.cell_at((5, 5)) is None
+    assert renderer.cell_at((460, 100)) is None
+    with pytest.raises(ValueError):
+        BoardRenderer(Board(), cell_size=4)
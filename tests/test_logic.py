@@ -0,0 +1,116 @@
+""" Tests for the logic module.
+This module contains unit tests for the `LogicSolver` class in the Sudoku game.
+"""
+from core.board import Board, UNITS
+from core.generator import Generator
+from core.logic import LogicSolver, UNSOLVED_RATING
+import pytest
+
+PUZZLE = "530070000600195000098000060800060003400803001700020006060000280000419005000080079"
+SOLUTION = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+
+def open_solver(candidates):
+    """ Build a solver on an empty grid with the given candidates per cell (other cells keep all digits). """
+    solver = LogicSolver([0] * 81)
+    for index, digits in candidates.items():
+        solver._candidates[index] = sum(1 << d for d in digits)
+    return solver
+
+# ----------------------------------------------------------------------
+# METHOD __init__
+# ----------------------------------------------------------------------
+def test_init_from_board_and_values():
+    b = Board()
+    b.set_number(0, 0, 5)
+    solver = LogicSolver(b)
+    assert solver.get_values()[0] == 5
+    assert solver.get_candidates(0) == []
+    assert 5 not in solver.get_candidates(1)
+    assert LogicSolver([int(c) for c in PUZZLE]).get_values() == [int(c) for c in PUZZLE]
+
+def test_init_invalid():
+    with pytest.raises(TypeError):
+        LogicSolver("not a board")
+    with pytest.raises(ValueError):
+        LogicSolver([0] * 80)
+
+# ----------------------------------------------------------------------
+# METHOD solve, grade
+# ----------------------------------------------------------------------
+def test_grade_easy_puzzle():
+    solver = LogicSolver([int(c) for c in PUZZLE])
+    grade = solver.grade()
+    assert grade["solved"] is True
+    assert grade["level"] == "easy"
+    assert set(grade["techniques"]) <= {"naked single", "hidden single"}
+    assert "".join(map(str, solver.get_values())) == SOLUTION
+
+def test_grade_empty_board_unsolved():
+    grade = LogicSolver(Board()).grade()
+    assert grade == {"level": "expert", "rating": UNSOLVED_RATING, "techniques": {}, "solved": False}
+
+def test_solve_max_rating():
+    givens, solution = Generator(seed=4).generate("medium")
+    assert not LogicSolver(givens).solve(max_rating=1.2)
+    solver = LogicSolver(givens)
+    assert solver.solve(max_rating=2.2)
+    assert solver.get_values() == solution
+
+@pytest.mark.parametrize("seed", range(5))
+def test_solve_is_sound(seed):
+    givens, solution = Generator(seed=seed).generate("expert")
+    solver = LogicSolver(givens)
+    solver.solve()
+    for index in range(81):
+        value = solver.get_values()[index]
+        assert value == solution[index] or (value == 0 and solution[index] in solver.get_candidates(index))
+
+# ----------------------------------------------------------------------
+# METHOD step (techniques)
+# ----------------------------------------------------------------------
+def test_step_naked_single():
+    solver = LogicSolver([int(c) for c in PUZZLE])
+    name, placements, eliminations = solver.step()
+    assert name == "naked single"
+    index, digit = placements[0]
+    assert str(digit) == SOLUTION[index]
+    assert solver.get_techniques() == {"naked single": 1}
+
+def test_step_pointing():
+    # Every digit but 2 and 3 only fits the first row of the first box: remove them from the rest of the row
+    cells = {index: [2, 3] for index in UNITS[18] if index >= 9}
+    solver = open_solver(cells)
+    name, placements, eliminations = solver.step()
+    assert name == "pointing"
+    assert placements == []
+    assert set(eliminations) == {(index, digit) for index in range(3, 9) for digit in (1, 4, 5, 6, 7, 8, 9)}
+
+def test_step_naked_pair():
+    solver = open_solver({0: [1, 2], 1: [1, 2]})
+    name, placements, eliminations = solver.step()
+    assert name == "naked pair"
+    assert (2, 1) in eliminations and (2, 2) in eliminations
+    assert all(index not in (0, 1) for index, _ in eliminations)
+
+def test_step_x_wing():
+    # Digit 5 only fits columns 0 and 4 in rows 0 and 8
+    cells = {index: [1, 2, 3, 4, 6, 7, 8, 9] for index in list(range(9)) + list(range(72, 81)) if index % 9 not in (0, 4)}
+    solver = open_solver(cells)
+    found = None
+    while found is None:
+        step = solver.step()
+        assert step is not None
+        if step[0] == "x-wing":
+            found = step
+    assert all(digit == 5 and index % 9 in (0, 4) and index // 9 not in (0, 8) for index, digit in found[2])
+
+def test_step_solved_returns_none():
+    solver = LogicSolver([int(c) for c in SOLUTION])
+    assert solver.is_solved()
+    assert solver.step() is None
+    assert solver.get_rating() == 0.0
+
+def test_is_broken():
+    solver = open_solver({0: []})
+    assert solver.is_broken()
+    assert not LogicSolver([int(c) for c in PUZZLE]).is_broken()
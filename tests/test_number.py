@@ -96,4 +96,16 @@ def test_cannot_lock_zero():
     with pytest.raises(PermissionError):
         n.lock()
 
-# _is_valid (indirectly tested through init/set_value)
\ No newline at end of file
+# _is_valid (indirectly tested through init/set_value)
+# ----------------------------------------------------------------------
+# max_value (larger boards)
+# ----------------------------------------------------------------------
+def test_max_value():
+    n = Number(12, max_value=16)
+    assert n.get_value() == 12
+    n.set_value(16)
+    assert n.get_value() == 16
+    with pytest.raises(ValueError):
+        n.set_value(17)
+    with pytest.raises(ValueError):
+        Number(17, max_value=16)
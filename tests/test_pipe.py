@@ -0,0 +1,98 @@
+""" Tests for the pipe module.
+This module contains unit tests for the streaming mode of the Sudoku CLI.
+"""
+from cli import pipe
+from cli.pipe import _read_lines, check_puzzle, run_pipe
+import io
+import os
+import subprocess
+import sys
+
+PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+SOLUTION = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+
+# ----------------------------------------------------------------------
+# METHOD check_puzzle
+# ----------------------------------------------------------------------
+def test_check_puzzle():
+    status, solution, grade = check_puzzle(PUZZLE + "\n")
+    assert (status, solution) == ("unique", SOLUTION)
+    assert grade["level"] == "easy" and grade["solved"]
+    assert check_puzzle(PUZZLE, grade=False) == ("unique", SOLUTION, None)
+    assert check_puzzle("." * 81) == ("multiple", None, None)
+    assert check_puzzle("55" + "." * 79) == ("conflict", None, None)
+    assert check_puzzle("x" + PUZZLE[1:]) == ("invalid", None, None)
+    assert check_puzzle(PUZZLE[:80]) == ("invalid", None, None)
+    unsolvable = PUZZLE[:2] + "1" + PUZZLE[3:]  # consistent givens but no solution
+    assert check_puzzle(unsolvable)[0] == "unsolvable"
+
+def test_check_larger_puzzle():
+    status, solution, grade = check_puzzle("1234" + "." * 12)
+    assert status == "multiple"
+    status, solution, grade = check_puzzle("1234341221434321"[:-1] + ".")
+    assert (status, solution, grade) == ("unique", "1234341221434321", None)
+
+# ----------------------------------------------------------------------
+# METHOD run_pipe
+# ----------------------------------------------------------------------
+def test_run_pipe_files(tmp_path):
+    source = tmp_path / "puzzles.txt"
+    source.write_text("\n".join([PUZZLE, "", "bad", "." * 81]) + "\n")
+    target = tmp_path / "results.txt"
+    assert run_pipe(str(source), str(target)) == 3
+    lines = [line.split("\t") for line in target.read_text().splitlines()]
+    assert lines[0][:3] == ["unique", SOLUTION, "easy"] and float(lines[0][3]) > 0
+    assert lines[1] == ["invalid", "-", "-", "-"]
+    assert lines[2] == ["multiple", "-", "-", "-"]
+
+def test_run_pipe_streams_results():
+    # Each result must come out before the next puzzle is written, while the input stays open
+    process = subprocess.Popen([sys.executable, "sudoku.py", "pipe", "--no-grade"], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    try:
+        for _ in range(2):
+            process.stdin.write(PUZZLE + "\n")
+            process.stdin.flush()
+            assert process.stdout.readline() == f"unique\t{SOLUTION}\t-\t-\n"
+    finally:
+        process.stdin.close()
+        process.wait(timeout=10)
+    assert process.returncode == 0
+
+def test_run_pipe_closed_output():
+    # The reader of the output goes away, like `head -n 1`: the run ends without error
+    process = subprocess.Popen([sys.executable, "sudoku.py", "pipe", "--no-grade"], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE, text=True)
+    process.stdin.write(PUZZLE + "\n")
+    process.stdin.flush()
+    process.stdout.readline()
+    process.stdout.close()
+    try:
+        process.stdin.write((PUZZLE + "\n") * 2000)
+        process.stdin.close()
+    except BrokenPipeError:
+        pass
+    assert process.wait(timeout=30) == 0
+    assert process.stderr.read() == ""
+
+# ----------------------------------------------------------------------
+# METHOD _read_lines
+# ----------------------------------------------------------------------
+def test_read_lines_reports_pending_input():
+    # Lines read in the same chunk are pending even when the operating system has no more input to give
+    read, write = os.pipe()
+    os.write(write, b"a\nb\nc\n")
+    with open(read, "rb", buffering=0) as source:
+        lines = _read_lines(source)
+        assert next(lines) == ("a", True)
+        assert next(lines) == ("b", True)
+        assert next(lines) == ("c", False)
+        os.write(write, b"d\xff")
+        os.close(write)
+        assert list(lines) == [("d\ufffd", False)]
+
+def test_read_lines_bounds_long_lines(monkeypatch):
+    monkeypatch.setattr(pipe, "CHUNK_SIZE", 100)
+    data = b"x" * 5000 + b"\n" + PUZZLE.encode() + b"\n" + b"y" * 3000
+    lines = [line for line, _ in _read_lines(io.BytesIO(data))]
+    assert lines == ["x" * (pipe.MAX_LINE_SIZE + 1), PUZZLE, "y" * (pipe.MAX_LINE_SIZE + 1)]
+    assert check_puzzle(lines[0]) == ("invalid", None, None)
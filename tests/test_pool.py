@@ -0,0 +1,116 @@
+""" Tests for the pool module.
+This module contains unit tests for the `PuzzlePool` class in the Sudoku game.
+"""
+from core.game import Game
+from core.pool import PuzzlePool
+import json
+import time
+import pytest
+
+def is_puzzle_of(givens, solution):
+    return len(givens) == len(solution) == 81 and all(g in (0, s) for g, s in zip(givens, solution)) and 0 not in solution
+
+# ----------------------------------------------------------------------
+# METHOD __init__
+# ----------------------------------------------------------------------
+def test_init_invalid_watermark():
+    with pytest.raises(ValueError):
+        PuzzlePool(watermark=0)
+
+# ----------------------------------------------------------------------
+# METHOD fill, get_puzzle, get_size
+# ----------------------------------------------------------------------
+def test_fill_and_get_puzzle():
+    pool = PuzzlePool(watermark=2, seed=1)
+    pool.fill("easy")
+    assert pool.get_size("easy") == 2
+    assert pool.get_size("expert") == 0
+    givens, solution, grade = pool.get_puzzle("easy")
+    assert is_puzzle_of(givens, solution)
+    assert grade["level"] == "easy"
+    assert pool.get_size("easy") == 1
+
+def test_get_puzzle_from_empty_pool():
+    pool = PuzzlePool(watermark=1, seed=2)
+    givens, solution, grade = pool.get_puzzle("medium")
+    assert is_puzzle_of(givens, solution)
+    assert pool.get_size("medium") == 0
+
+def test_invalid_level():
+    pool = PuzzlePool()
+    with pytest.raises(ValueError):
+        pool.get_puzzle("impossible")
+    with pytest.raises(ValueError):
+        pool.fill("impossible")
+
+# ----------------------------------------------------------------------
+# METHOD start, stop
+# ----------------------------------------------------------------------
+def test_background_refill():
+    pool = PuzzlePool(watermark=1, seed=3)
+    pool.start()
+    try:
+        deadline = time.monotonic() + 30
+        while any(pool.get_size(level) < 1 for level in ("easy", "medium", "hard", "expert")):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        pool.get_puzzle("hard")
+        while pool.get_size("hard") < 1:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+    finally:
+        pool.stop()
+
+# ----------------------------------------------------------------------
+# METHOD save (persistence)
+# ----------------------------------------------------------------------
+def test_save_and_load(tmp_path):
+    path = tmp_path / "pool.json"
+    pool = PuzzlePool(watermark=2, path=str(path), seed=4)
+    pool.fill("easy")
+    pool.save()
+    loaded = PuzzlePool(watermark=2, path=str(path))
+    assert loaded.get_size("easy") == 2
+    assert loaded.get_puzzle("easy") == pool.get_puzzle("easy")
+
+def test_load_unreadable_file(tmp_path):
+    path = tmp_path / "pool.json"
+    path.write_text("not json")
+    assert PuzzlePool(path=str(path)).get_size("easy") == 0
+
+@pytest.mark.parametrize("data", [
+    [1, 2, 3],
+    {"easy": {"givens": []}},
+    {"easy": [[[0] * 81, [1] * 81]]},
+    {"easy": [[[0] * 80, [1] * 81, {}]]},
+    {"easy": [[["x"] * 81, [1] * 81, {}]]},
+    {"easy": [[[0] * 81, [1] * 81, {}]], "hard": [None]},
+])
+def test_load_malformed_file(tmp_path, data):
+    path = tmp_path / "pool.json"
+    path.write_text(json.dumps(data))
+    pool = PuzzlePool(path=str(path))
+    assert pool.get_size("easy") == 0 and pool.get_size("hard") == 0
+
+def test_stop_saves(tmp_path):
+    path = tmp_path / "pool.json"
+    pool = PuzzlePool(watermark=1, path=str(path), seed=5)
+    pool.fill("hard")
+    pool.stop()
+    assert len(json.loads(path.read_text())["hard"]) == 1
+
+# ----------------------------------------------------------------------
+# INTEGRATION WITH Game
+# ----------------------------------------------------------------------
+def test_game_uses_pool():
+    pool = PuzzlePool(watermark=1, seed=6)
+    pool.fill("expert")
+    g = Game("expert", source=pool)
+    g.start_game()
+    assert pool.get_size("expert") == 0
+    assert g.get_grade()["level"] == "expert"
+    assert sum(g.get_board().is_fixed(i, j) for i in range(9) for j in range(9)) > 0
+
+def test_game_invalid_pool():
+    with pytest.raises(TypeError):
+        Game("easy", source="not a pool")
@@ -0,0 +1,97 @@
+""" Tests for the server module.
+This module contains unit tests for the `PuzzleServer` class of the Sudoku game.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from core.generator import GENERATOR_VERSION
+from server.server import PuzzleServer, _Batcher
+import asyncio
+import json
+import pytest
+
+PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+SOLUTION = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+
+async def exchange(server, requests):
+    """ Send requests on one connection and return the responses by id. """
+    host, port = server.get_address()
+    reader, writer = await asyncio.open_connection(host, port)
+    for request in requests:
+        writer.write((request if isinstance(request, str) else json.dumps(request)).encode() + b"\n")
+    await writer.drain()
+    responses = [json.loads(await reader.readline()) for _ in requests]
+    writer.close()
+    await writer.wait_closed()
+    return {response["id"]: response for response in responses}
+
+def run_with_server(requests):
+    async def main():
+        server = PuzzleServer(port=0, workers=1)
+        await server.start()
+        try:
+            return await exchange(server, requests)
+        finally:
+            await server.close()
+    return asyncio.run(main())
+
+# ----------------------------------------------------------------------
+# METHOD solve, validate, hint, generate requests
+# ----------------------------------------------------------------------
+def test_requests():
+    board = SOLUTION[:40] + "." + SOLUTION[41:]
+    responses = run_with_server([
+        {"id": "solve", "op": "solve", "puzzle": PUZZLE},
+        {"id": "unsolvable", "op": "solve", "puzzle": "11" + "." * 79},
+        {"id": "validate", "op": "validate", "board": "11" + "." * 79},
+        {"id": "complete", "op": "validate", "board": SOLUTION},
+        {"id": "hint", "op": "hint", "puzzle": PUZZLE, "board": board},
+        {"id": "generate", "op": "generate", "puzzle_id": f"{GENERATOR_VERSION}-easy-0000000000000001"},
+    ])
+    assert responses["solve"]["result"] == {"solution": SOLUTION, "unique": True}
+    assert responses["unsolvable"]["result"] == {"solution": None, "unique": False}
+    assert responses["validate"]["result"] == {"complete": False, "filled": 2, "conflicts": [[0, 0], [0, 1]]}
+    assert responses["complete"]["result"]["complete"] is True
+    assert responses["hint"]["result"] == {"row": 4, "col": 4, "number": int(SOLUTION[40]), "technique": "naked single"}
+    generated = responses["generate"]["result"]
+    assert generated["puzzle_id"] == f"{GENERATOR_VERSION}-easy-0000000000000001" and generated["grade"]["level"] == "easy"
+    assert all(g == "." or g == s for g, s in zip(generated["puzzle"], generated["solution"]))
+
+def test_invalid_requests():
+    responses = run_with_server([
+        "not json",
+        {"id": 1, "op": "unknown"},
+        {"id": 2, "op": "solve", "puzzle": "123"},
+        {"id": 3, "op": "validate"},
+        {"id": 4, "op": "generate", "level": "impossible"},
+    ])
+    assert set(responses) == {None, 1, 2, 3, 4}
+    assert all("error" in response and "result" not in response for response in responses.values())
+
+# ----------------------------------------------------------------------
+# CLASS _Batcher
+# ----------------------------------------------------------------------
+def test_batcher_groups_requests():
+    sizes = []
+    def run_batch(requests):
+        sizes.append(len(requests))
+        return [ValueError("odd") if request % 2 else request * 10 for request in requests]
+    async def main():
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            batcher = _Batcher(pool, run_batch, max_size=4)
+            return await asyncio.gather(*(batcher.submit(request) for request in range(10)), return_exceptions=True)
+    results = asyncio.run(main())
+    assert sizes == [4, 4, 2]
+    assert results[::2] == [0, 20, 40, 60, 80]
+    assert all(isinstance(result, ValueError) for result in results[1::2])
+
+def test_batcher_fails_requests_of_broken_pool():
+    async def main():
+        pool = ThreadPoolExecutor(max_workers=1)
+        pool.shutdown()
+        batcher = _Batcher(pool, lambda requests: requests, max_size=2)
+        return await asyncio.wait_for(asyncio.gather(*(batcher.submit(request) for request in range(3)), return_exceptions=True), 5)
+    results = asyncio.run(main())
+    assert len(results) == 3 and all(isinstance(result, RuntimeError) for result in results)
+
+def test_init_invalid_workers():
+    with pytest.raises(ValueError):
+        PuzzleServer(workers=0)
@@ -0,0 +1,42 @@
+""" Tests for the sharding module.
+This module contains unit tests for the sharded generation of puzzle batches in the Sudoku game.
+"""
+from core.generator import Generator
+from core.sharding import generate_shard, puzzle_seed
+import pytest
+
+# ----------------------------------------------------------------------
+# METHOD puzzle_seed
+# ----------------------------------------------------------------------
+def test_puzzle_seed():
+    assert puzzle_seed(1, 0) == puzzle_seed(1, 0)
+    assert len({puzzle_seed(1, i) for i in range(100)}) == 100
+    assert puzzle_seed(1, 0) != puzzle_seed(2, 0)
+    assert 0 <= puzzle_seed(1, 0) < 2 ** 64
+
+# ----------------------------------------------------------------------
+# METHOD generate_shard
+# ----------------------------------------------------------------------
+def test_generate_shard_in_process():
+    puzzles = list(generate_shard("easy", 3, seed=5, workers=1))
+    assert [index for index, _, _, _ in puzzles] == [0, 1, 2]
+    index, givens, solution, grade = puzzles[1]
+    assert (givens, solution) == Generator(puzzle_seed(5, 1)).generate("easy")
+    assert grade["level"] == "easy"
+
+def test_generate_shard_split_matches_whole_batch():
+    whole = sorted(generate_shard("easy", 4, seed=3, workers=2))
+    split = list(generate_shard("easy", 2, seed=3, workers=1)) + list(generate_shard("easy", 2, seed=3, start=2, workers=1))
+    assert whole == split
+
+def test_generate_shard_larger_boards():
+    (index, givens, solution, grade), = generate_shard("easy", 1, seed=1, start=7, workers=1, box_size=2)
+    assert index == 7 and len(givens) == len(solution) == 16 and grade is None
+
+def test_generate_shard_invalid():
+    with pytest.raises(ValueError):
+        list(generate_shard("impossible", 1))
+    with pytest.raises(ValueError):
+        list(generate_shard("easy", -1))
+    with pytest.raises(ValueError):
+        list(generate_shard("easy", 1, workers=0))
@@ -0,0 +1,96 @@
+""" Tests for the solver module.
+This module contains unit tests for the `Solver` class in the Sudoku game.
+"""
+from core.board import Board
+from core.solver import Solver
+import pytest
+
+PUZZLE = "530070000600195000098000060800060003400803001700020006060000280000419005000080079"
+SOLUTION = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+
+def make_board(text, lock=True):
+    b = Board()
+    for index, char in enumerate(text):
+        if char != "0":
+            b.set_number(index // 9, index % 9, int(char))
+            if lock:
+                b.lock_number(index // 9, index % 9)
+    return b
+
+def board_text(board):
+    return "".join(str(board.get_number(i // 9, i % 9)) for i in range(81))
+
+# ----------------------------------------------------------------------
+# METHOD solve
+# ----------------------------------------------------------------------
+def test_solve():
+    b = make_board(PUZZLE)
+    solution = Solver().solve(b)
+    assert board_text(solution) == SOLUTION
+    # Givens are untouched and stay fixed in the solution
+    assert board_text(b) == PUZZLE
+    assert solution.is_fixed(0, 0) and not solution.is_fixed(0, 2)
+
+def test_solve_unsolvable():
+    b = make_board(PUZZLE, lock=False)
+    b.set_number(0, 2, 5)  # 5 twice in the first row
+    assert Solver().solve(b) is None
+    b.set_number(0, 2, 0)
+    b.set_number(0, 2, 9)  # consistent givens but no solution
+    assert Solver().solve(b) is None
+
+def test_solve_invalid_type():
+    with pytest.raises(TypeError):
+        Solver().solve("not a board")
+
+# ----------------------------------------------------------------------
+# METHOD solve_all, count_solutions
+# ----------------------------------------------------------------------
+def test_solve_all_and_count():
+    text = SOLUTION[:81 - 27] + "0" * 27
+    b = make_board(text)
+    solver = Solver()
+    solutions = solver.solve_all(b)
+    assert len(solutions) == solver.count_solutions(b) > 1
+    assert SOLUTION in {board_text(s) for s in solutions}
+    assert len({board_text(s) for s in solutions}) == len(solutions)
+    assert len(solver.solve_all(b, limit=2)) == 2
+    assert solver.count_solutions(b, limit=2) == 2
+    assert solver.count_solutions(make_board(PUZZLE)) == 1
+
+def test_count_empty_board_capped():
+    assert Solver().count_solutions(Board(), limit=5) == 5
+
+# ----------------------------------------------------------------------
+# METHOD solve_values
+# ----------------------------------------------------------------------
+def test_solve_values():
+    values = [int(c) for c in PUZZLE]
+    assert [''.join(map(str, s)) for s in Solver().solve_values(values)] == [SOLUTION]
+    assert values == [int(c) for c in PUZZLE]
+    with pytest.raises(ValueError):
+        list(Solver().solve_values(values[:80]))
+
+# ----------------------------------------------------------------------
+# METHOD count_values, larger boards
+# ----------------------------------------------------------------------
+def test_count_values_node_budget():
+    values = [0] * 81
+    assert Solver().count_values(values, limit=2) == 2
+    assert Solver().count_values(values, limit=1000, max_nodes=10) is None
+
+def test_solve_large_board():
+    solver = Solver(box_size=4)
+    solution = next(iter(solver.solve_values([0] * 256)))
+    b = Board(box_size=4)
+    for index, value in enumerate(solution):
+        b.set_number(index // 16, index % 16, value)
+    assert b.is_complete()
+    givens = solution[:]
+    givens[0] = givens[17] = 0
+    assert solver.count_values(givens) == 1
+    assert board_text(Solver().solve(make_board(PUZZLE))) == SOLUTION
+
+def test_solve_board_size_mismatch():
+    with pytest.raises(ValueError):
+        Solver().solve(Board(box_size=4))
@@ -0,0 +1,66 @@
+""" Tests for the stats module.
+This module contains unit tests for the instrumentation counters and timers of the Sudoku game.
+"""
+from core import stats
+from core.board import Board
+from core.generator import Generator
+from core.solver import Solver
+import pytest
+
+PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    stats.reset()
+    yield
+    stats.disable()
+    stats.reset()
+
+# ----------------------------------------------------------------------
+# METHOD enable, disable, count, timer, reset
+# ----------------------------------------------------------------------
+def test_disabled_by_default():
+    assert not stats.is_enabled()
+    Solver().count_solutions(Board.from_string(PUZZLE))
+    with stats.timer("test.block"):
+        pass
+    assert stats.get_stats() == {"counters": {}, "timers": {}}
+
+def test_count_and_timer():
+    stats.enable()
+    stats.count("test.counter")
+    stats.count("test.counter", 2)
+    with stats.timer("test.block"):
+        pass
+    data = stats.get_stats()
+    assert data["counters"] == {"test.counter": 3}
+    assert data["timers"]["test.block"]["calls"] == 1
+    assert data["timers"]["test.block"]["seconds"] >= 0
+    stats.reset()
+    assert stats.get_stats() == {"counters": {}, "timers": {}}
+
+def test_instrumented_components():
+    stats.enable()
+    board = Board.from_string(PUZZLE, fixed=False)
+    board.get_number(0, 0)
+    board.set_number(0, 2, 4)
+    board.allowed_numbers(1, 1)
+    Solver().count_solutions(board)
+    Generator(seed=1).generate("easy")
+    counters = stats.get_stats()["counters"]
+    assert counters["board.reads"] >= 1
+    assert counters["board.writes"] == 1
+    assert counters["board.candidates"] == 1
+    assert counters["solver.nodes"] > 0
+    assert counters["generator.puzzles.easy"] == 1
+    assert counters["logic.propagations"] > 0
+    assert "generator.fill_grid" in stats.get_stats()["timers"]
+
+# ----------------------------------------------------------------------
+# METHOD format_stats
+# ----------------------------------------------------------------------
+def test_format_stats():
+    assert stats.format_stats(stats.get_stats()) == "No statistics recorded."
+    text = stats.format_stats({"counters": {"solver.nodes": 12}, "timers": {"generator.fill_grid": {"calls": 2, "seconds": 0.5}}})
+    assert "solver.nodes" in text and "12" in text
+    assert "generator.fill_grid" in text and "250.000 ms/call" in text
@@ -0,0 +1,68 @@
+""" Tests for the uniqueness module.
+This module contains unit tests for the `UniquenessChecker` class in the Sudoku game.
+"""
+from core.solver import Solver
+from core.uniqueness import UniquenessChecker
+import random
+import pytest
+
+PUZZLE = [int(c) for c in "530070000600195000098000060800060003400803001700020006060000280000419005000080079"]
+SOLUTION = [int(c) for c in "534678912672195348198342567859761423426853791713924856961537284287419635345286179"]
+
+def count(values):
+    return Solver().count_values(values, limit=2)
+
+# ----------------------------------------------------------------------
+# METHOD __init__
+# ----------------------------------------------------------------------
+def test_init_solves_puzzle():
+    checker = UniquenessChecker(PUZZLE)
+    assert checker.get_givens() == PUZZLE
+    assert checker.get_given_count() == 30
+
+def test_init_invalid():
+    with pytest.raises(ValueError):
+        UniquenessChecker(PUZZLE[:80])
+    with pytest.raises(ValueError):
+        UniquenessChecker(PUZZLE, SOLUTION[:80])
+    with pytest.raises(ValueError):
+        UniquenessChecker([0] * 81)  # many solutions
+
+# ----------------------------------------------------------------------
+# METHOD remove
+# ----------------------------------------------------------------------
+def test_remove_keeps_solution_unique():
+    checker = UniquenessChecker(SOLUTION, SOLUTION)
+    order = list(range(81))
+    random.Random(4).shuffle(order)
+    for index in order:
+        before = checker.get_givens()
+        removed = checker.remove(index)
+        givens = checker.get_givens()
+        if removed:
+            assert givens[index] == 0 and count(givens) == 1
+        else:
+            assert givens == before
+            before[index] = 0
+            assert count(before) == 2
+    assert checker.get_given_count() < 30
+    assert checker.remove(order[0]) is True  # already empty
+
+# ----------------------------------------------------------------------
+# METHOD clear, restore, is_forced, has_other_solution
+# ----------------------------------------------------------------------
+def test_clear_restore_and_checks():
+    checker = UniquenessChecker(SOLUTION, SOLUTION)
+    checker.clear(40)
+    assert checker.get_givens()[40] == 0 and checker.get_given_count() == 80
+    assert checker.is_forced(40)  # the only empty cell of the grid
+    assert not checker.has_other_solution(40)
+    checker.restore(40)
+    checker.restore(40)
+    assert checker.get_givens() == SOLUTION
+    empty = UniquenessChecker(SOLUTION, SOLUTION)
+    for index in range(27):
+        empty.clear(index)
+    assert not empty.is_forced(0)
+    assert empty.has_other_solution(0)
+    assert empty.get_givens()[27:] == SOLUTION[27:] and empty.get_given_count() == 54
@@ -0,0 +1,53 @@
+""" Tests for the validator module.
+This module contains unit tests for the bulk validation of grids with NumPy.
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.validator import validate_grids
+
+SOLUTION = [((i*3 + i//3 + j) % 9) + 1 for i in range(9) for j in range(9)]
+
+# ----------------------------------------------------------------------
+# METHOD validate_grids
+# ----------------------------------------------------------------------
+def test_validate_grids():
+    partial = list(SOLUTION)
+    partial[40] = 0
+    duplicate = [0] * 81
+    duplicate[0] = duplicate[8] = 7
+    valid, complete = validate_grids([SOLUTION, partial, duplicate, [0] * 81])
+    assert valid.tolist() == [True, True, False, True]
+    assert complete.tolist() == [True, False, False, False]
+
+def test_validate_grids_9x9_shape():
+    grids = np.array([SOLUTION, SOLUTION], dtype=np.uint8).reshape(2, 9, 9)
+    valid, complete = validate_grids(grids)
+    assert valid.all() and complete.all()
+
+def test_validate_grids_conflicts():
+    grid = [0] * 81
+    grid[0] = grid[4] = 3  # row 0
+    grid[10] = 3  # subgrid 0 with cell 0
+    grid[80] = grid[71] = 9  # column 8 and subgrid 8
+    valid, complete, masks = validate_grids([grid, SOLUTION], conflicts=True)
+    assert masks.shape == (2, 27)
+    assert not valid[0]
+    assert masks[0, 0] == 1 << 3
+    assert masks[0, 18] == 1 << 3
+    assert masks[0, 9 + 8] == 1 << 9 and masks[0, 18 + 8] == 1 << 9
+    assert np.count_nonzero(masks[0]) == 4
+    assert not masks[1].any()
+
+def test_validate_grids_empty():
+    valid, complete = validate_grids(np.zeros((0, 81), dtype=np.uint8))
+    assert valid.shape == complete.shape == (0,)
+
+def test_validate_grids_errors():
+    with pytest.raises(ValueError):
+        validate_grids([[0] * 80])
+    with pytest.raises(ValueError):
+        validate_grids([[10] + [0] * 80])
+    with pytest.raises(TypeError):
+        validate_grids([[0.5] * 81])